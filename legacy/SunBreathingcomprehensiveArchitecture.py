@@ -18,17 +18,29 @@ The Dragon-Phoenix Symbiotic Loop Implementation
 Enhanced with Gemini Ultra Deep Think Insights
 """
 
+import array
 import asyncio
+import copy
+import heapq
 import json
 import logging
+import os
+import re
+import shutil
+import sys
+import tempfile
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Hashable, List, Optional, Any, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 import numpy as np
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import threading
 import uuid
 import hashlib
@@ -128,99 +140,584 @@ class MemoryCluster:
     centroid: Optional[np.ndarray] = None
     coherence_score: float = 0.0
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    embedding_sum: Optional[np.ndarray] = None  # Running sum of member embeddings
+    unit_sum: Optional[np.ndarray] = None  # Running sum of L2-normalized member embeddings
+    member_count: int = 0
+
+
+# ============================================================================
+# RANK FUSION
+# ============================================================================
+
+@dataclass
+class FusedResult:
+    """One fused item with its per-list score breakdown"""
+    item: Any
+    score: float
+    contributions: Dict[str, float] = field(default_factory=dict)  # list name -> weight / (k + rank)
+    ranks: Dict[str, int] = field(default_factory=dict)  # list name -> 1-based rank
+
+
+class RankFusion:
+    """
+    RankFusion - weighted Reciprocal Rank Fusion over any number of ranked lists
+    score(d) = sum over lists l of weight_l / (k_l + rank_l(d)), with 1-based ranks and
+    only an item's best rank counting within a list. Ties keep first-seen order.
+    """
+    
+    def __init__(self, k: float = 60.0, weights: Optional[Dict[str, float]] = None,
+                 list_k: Optional[Dict[str, float]] = None):
+        self.k = k
+        self.weights = dict(weights or {})
+        self.list_k = dict(list_k or {})
+    
+    @staticmethod
+    def reciprocal_rank(rank: int, k: float = 60.0, weight: float = 1.0) -> float:
+        return weight / (k + rank)
+    
+    def configure(self, fusion_config: Dict[str, Any]):
+        self.k = fusion_config.get("k", self.k)
+        self.weights.update(fusion_config.get("weights", {}))
+        self.list_k.update(fusion_config.get("list_k", {}))
+    
+    def fuse(self, ranked_lists: Dict[str, Sequence[Any]], top_k: Optional[int] = None,
+             key=None) -> List[FusedResult]:
+        """
+        Fuse named ranked lists of items, best first
+        key maps an item to its identity (e.g. lambda node: node.id); the first item seen
+        for an identity is returned. top_k selects with a heap instead of a full sort.
+        """
+        key = key or (lambda item: item)
+        fused: Dict[Hashable, FusedResult] = {}
+        
+        for name, items in ranked_lists.items():
+            weight = self.weights.get(name, 1.0)
+            k = self.list_k.get(name, self.k)
+            for rank, item in enumerate(items, 1):
+                identity = key(item)
+                result = fused.get(identity)
+                if result is None:
+                    result = fused[identity] = FusedResult(item=item, score=0.0)
+                elif name in result.ranks:
+                    continue
+                contribution = self.reciprocal_rank(rank, k, weight)
+                result.score += contribution
+                result.contributions[name] = contribution
+                result.ranks[name] = rank
+        
+        results = fused.values()
+        if top_k is not None and top_k < len(fused):
+            return heapq.nlargest(top_k, results, key=lambda result: result.score)
+        return sorted(results, key=lambda result: result.score, reverse=True)
+    
+    def fuse_arrays(self, id_lists: Dict[str, np.ndarray],
+                    top_k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized fusion of integer id arrays (e.g. index rows), best first
+        Returns (ids, scores, contributions), where contributions has one column per
+        list in id_lists order. Same scores and tie order as fuse().
+        """
+        names = list(id_lists)
+        ids, ranks, columns = [], [], []
+        for column, name in enumerate(names):
+            values = np.asarray(id_lists[name], dtype=np.int64)
+            _, best = np.unique(values, return_index=True)  # first occurrence is the best rank
+            best = np.sort(best)
+            ids.append(values[best])
+            ranks.append(best + 1)
+            columns.append(np.full(len(best), column))
+        
+        if not names or not sum(len(values) for values in ids):
+            return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros((0, len(names)))
+        
+        ids, ranks, columns = np.concatenate(ids), np.concatenate(ranks), np.concatenate(columns)
+        weights = np.array([self.weights.get(name, 1.0) for name in names])[columns]
+        ks = np.array([self.list_k.get(name, self.k) for name in names])[columns]
+        
+        unique_ids, first_seen, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        contributions = np.zeros((len(unique_ids), len(names)))
+        contributions[inverse, columns] = weights / (ks + ranks)
+        scores = contributions.sum(axis=1)
+        
+        candidates = np.arange(len(unique_ids))
+        if top_k is not None and top_k < len(unique_ids):
+            threshold = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            candidates = np.flatnonzero(scores >= threshold)
+        order = candidates[np.lexsort((first_seen[candidates], -scores[candidates]))][:top_k]
+        return unique_ids[order], scores[order], contributions[order]
 
 
 # ============================================================================
 # Y789/NEXUS DUAL-PROCESS COGNITIVE ENGINE
 # ============================================================================
 
+# Keyword categories matched by QueryFeatures (substring matches on the lowercased query)
+QUERY_KEYWORDS: Dict[str, List[str]] = {
+    "analytical": ["analyze", "break down", "explain", "define"],
+    "synthetic": ["create", "imagine", "synthesize", "connect"]
+}
+
+
+@dataclass
+class QueryFeatures:
+    """Tokenized view of a query, parsed once and shared by every Y789/Nexus analyzer"""
+    text: str
+    lowered: str
+    tokens: List[str]
+    offsets: List[Tuple[int, int]]  # (start, end) of each token in the query
+    keyword_hits: Dict[str, List[str]]  # category -> keywords found, in query order
+    length: int  # whitespace-separated terms
+    
+    # One pass over the query for every keyword; the lookahead lets matches overlap
+    _TOKEN_PATTERN = re.compile(r"\w+")
+    _KEYWORD_PATTERN = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keywords in QUERY_KEYWORDS.values() for keyword in keywords) + "))"
+    )
+    _KEYWORD_CATEGORIES = {keyword: category for category, keywords in QUERY_KEYWORDS.items() for keyword in keywords}
+    
+    @classmethod
+    def from_query(cls, query: str) -> "QueryFeatures":
+        lowered = query.lower()
+        matches = list(cls._TOKEN_PATTERN.finditer(lowered))
+        keyword_hits: Dict[str, List[str]] = {}
+        for match in cls._KEYWORD_PATTERN.finditer(lowered):
+            keyword = match.group(1)
+            keyword_hits.setdefault(cls._KEYWORD_CATEGORIES[keyword], []).append(keyword)
+        return cls(
+            text=query,
+            lowered=lowered,
+            tokens=[match.group() for match in matches],
+            offsets=[match.span() for match in matches],
+            keyword_hits=keyword_hits,
+            length=len(lowered.split())
+        )
+
+
 class CognitiveEngine:
     """
     The Y789/Nexus dual-process cognitive engine implementing the core
     analytical and synthetic processing capabilities of Integra.
     """
     
+    HEMISPHERES = ("y789", "nexus")
+    
     def __init__(self):
         self.mode = CognitiveMode.INTEGRATED
         self.processing_history = deque(maxlen=1000)
         self.performance_metrics = {}
-        
-    def y789_process(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        self.executor_type = "none"  # none | thread (NumPy-heavy work) | process (pure-Python work)
+        self.max_workers = 2
+        self.hemisphere_timeouts: Dict[str, Optional[float]] = {"y789": None, "nexus": None}
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self.result_cache = BoundedLRUCache(max_entries=4096, ttl_seconds=300.0)
+        self.result_cache_enabled = True
+        self.volatile_context_keys = {"retrieved_knowledge"}  # left out of result fingerprints
+        self.cache_metrics = {kind: {"hits": 0, "misses": 0} for kind in ("integrated", *self.HEMISPHERES)}
+        self.cache_metrics["uncacheable"] = 0
+        self.config_fingerprint: Optional[str] = None
+        self.rank_fusion = RankFusion(k=60.0)  # fuses the hemispheres' ranked candidate lists
+        self.fusion_top_k = 10
+        self.vectorized_fusion_threshold = 256  # total candidates above which fusion runs on arrays
+    
+    def configure(self, engine_config: Dict[str, Any]):
+        """Apply the Phoenix blueprint's cognitive_engine section (a changed config drops cached results)"""
+        config_fingerprint = hashlib.md5(json.dumps(engine_config, sort_keys=True, default=str).encode()).hexdigest()
+        if config_fingerprint != self.config_fingerprint:
+            self.result_cache.clear()
+            self.config_fingerprint = config_fingerprint
+        
+        cache_config = engine_config.get("result_cache", {})
+        self.result_cache_enabled = cache_config.get("enabled", self.result_cache_enabled)
+        self.result_cache.resize(cache_config.get("max_entries", self.result_cache.max_entries))
+        self.result_cache.ttl_seconds = cache_config.get("ttl_seconds", self.result_cache.ttl_seconds)
+        self.volatile_context_keys = set(cache_config.get("volatile_context_keys", self.volatile_context_keys))
+        
+        fusion_config = engine_config.get("fusion_config", {})
+        self.rank_fusion.configure(fusion_config)
+        self.fusion_top_k = fusion_config.get("top_k", self.fusion_top_k)
+        self.vectorized_fusion_threshold = fusion_config.get("vectorized_threshold", self.vectorized_fusion_threshold)
+        
+        concurrency = engine_config.get("concurrency", {})
+        executor_type = concurrency.get("executor", self.executor_type)
+        if executor_type not in ("none", "thread", "process"):
+            raise ValueError(f"Unknown cognitive executor: {executor_type}")
+        max_workers = concurrency.get("max_workers", self.max_workers)
+        if (executor_type, max_workers) != (self.executor_type, self.max_workers):
+            self.shutdown()
+        
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.hemisphere_timeouts = {
+            hemisphere: concurrency.get(f"{hemisphere}_timeout", self.hemisphere_timeouts[hemisphere])
+            for hemisphere in self.HEMISPHERES
+        }
+    
+    def shutdown(self):
+        """Release the hemisphere worker pool (hemispheres still running are abandoned)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
+    def __getstate__(self):
+        # Process-pool workers get the engine without its pool, lock, history or result cache
+        state = self.__dict__.copy()
+        state.update(_executor=None, _executor_lock=None, processing_history=deque(maxlen=1000), result_cache=None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
+        
+    def y789_process(self, query: str, context: Dict[str, Any],
+                     features: Optional[QueryFeatures] = None) -> Dict[str, Any]:
         """
         Y789 Analytical Processing (Spock/Left Hemisphere)
         Implements precise, logical, reductionist analysis
         """
+        return self._y789_process(query, context, features, self._fingerprint(query, context))
+    
+    def _y789_process(self, query: str, context: Dict[str, Any], features: Optional[QueryFeatures],
+                      fingerprint: Optional[str]) -> Dict[str, Any]:
+        def compute() -> Dict[str, Any]:
+            analysis = self._y789_analysis(features or QueryFeatures.from_query(query), context)
+            self._log_processing("Y789", query, analysis)
+            return analysis
+        return self._memoized("y789", fingerprint, compute)
+    
+    def _y789_analysis(self, features: QueryFeatures, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Y789 analysis without history logging (safe to run in a worker)"""
         start_time = time.time()
-        
+        analysis = self._build_y789_result(features, context)
+        analysis["processing_time"] = time.time() - start_time
+        return analysis
+    
+    def _build_y789_result(self, features: QueryFeatures, context: Dict[str, Any],
+                           query_type: Optional[str] = None, precision_score: Optional[float] = None,
+                           confidence_level: Optional[float] = None) -> Dict[str, Any]:
+        """Y789 result dict (batch callers pass their precomputed scores)"""
         # Analytical deconstruction
         analysis = {
-            "query_type": self._classify_query(query),
-            "logical_structure": self._extract_logical_structure(query),
-            "fact_requirements": self._identify_fact_requirements(query),
-            "precision_score": self._calculate_precision_score(query),
-            "analytical_breakdown": self._perform_analytical_breakdown(query, context),
+            "query_type": query_type if query_type is not None else self._classify_query(features),
+            "logical_structure": self._extract_logical_structure(features),
+            "fact_requirements": self._identify_fact_requirements(features),
+            "precision_score": precision_score if precision_score is not None else self._calculate_precision_score(features),
+            "analytical_breakdown": self._perform_analytical_breakdown(features, context),
             "confidence_level": 0.0,
+            "ranked_candidates": [],
             "processing_time": 0.0
         }
         
         # Calculate confidence based on analytical clarity
-        analysis["confidence_level"] = self._calculate_y789_confidence(analysis)
-        analysis["processing_time"] = time.time() - start_time
-        
-        self._log_processing("Y789", query, analysis)
+        analysis["confidence_level"] = (
+            confidence_level if confidence_level is not None else self._calculate_y789_confidence(analysis)
+        )
+        analysis["ranked_candidates"] = self._rank_y789_candidates(analysis)
         return analysis
     
-    def nexus_process(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def nexus_process(self, query: str, context: Dict[str, Any],
+                      features: Optional[QueryFeatures] = None) -> Dict[str, Any]:
         """
         Nexus Synthetic Processing (Kirk/Right Hemisphere)
         Implements creative, holistic, pattern-weaving synthesis
         """
+        return self._nexus_process(query, context, features, self._fingerprint(query, context))
+    
+    def _nexus_process(self, query: str, context: Dict[str, Any], features: Optional[QueryFeatures],
+                       fingerprint: Optional[str]) -> Dict[str, Any]:
+        def compute() -> Dict[str, Any]:
+            synthesis = self._nexus_synthesis(features or QueryFeatures.from_query(query), context)
+            self._log_processing("NEXUS", query, synthesis)
+            return synthesis
+        return self._memoized("nexus", fingerprint, compute)
+    
+    def _nexus_synthesis(self, features: QueryFeatures, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Nexus synthesis without history logging (safe to run in a worker)"""
         start_time = time.time()
-        
+        synthesis = self._build_nexus_result(features, context)
+        synthesis["processing_time"] = time.time() - start_time
+        return synthesis
+    
+    def _build_nexus_result(self, features: QueryFeatures, context: Dict[str, Any],
+                            synthetic_insights: Optional[List[Dict[str, Any]]] = None,
+                            novelty_score: Optional[float] = None) -> Dict[str, Any]:
+        """Nexus result dict (batch callers pass their precomputed insights and novelty)"""
         # Synthetic construction
         synthesis = {
-            "pattern_recognition": self._identify_patterns(query, context),
-            "metaphorical_connections": self._find_metaphorical_links(query),
-            "creative_hypotheses": self._generate_hypotheses(query, context),
-            "contextual_integration": self._integrate_context(query, context),
-            "synthetic_insights": self._synthesize_insights(query, context),
+            "pattern_recognition": self._identify_patterns(features, context),
+            "metaphorical_connections": self._find_metaphorical_links(features),
+            "creative_hypotheses": self._generate_hypotheses(features, context),
+            "contextual_integration": self._integrate_context(features, context),
+            "synthetic_insights": (
+                synthetic_insights if synthetic_insights is not None else self._synthesize_insights(features, context)
+            ),
             "novelty_score": 0.0,
+            "ranked_candidates": [],
             "processing_time": 0.0
         }
         
         # Calculate novelty based on creative synthesis
-        synthesis["novelty_score"] = self._calculate_nexus_novelty(synthesis)
-        synthesis["processing_time"] = time.time() - start_time
-        
-        self._log_processing("NEXUS", query, synthesis)
+        synthesis["novelty_score"] = (
+            novelty_score if novelty_score is not None else self._calculate_nexus_novelty(synthesis)
+        )
+        synthesis["ranked_candidates"] = self._rank_nexus_candidates(synthesis)
         return synthesis
     
     def integrated_process(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Integrated Y789/Nexus Processing using Reciprocal Rank Fusion
-        Combines analytical precision with synthetic creativity
+        Combines analytical precision with synthetic creativity. With an executor
+        configured both hemispheres run concurrently; a hemisphere that misses its
+        timeout is replaced by an empty fallback and the result is marked partial (if
+        both miss, the result is built from both fallbacks). Results are memoized by query and context fingerprint (partial ones are not).
         """
-        # Parallel processing
-        y789_result = self.y789_process(query, context)
-        nexus_result = self.nexus_process(query, context)
+        fingerprint = self._fingerprint(query, context)
+        return self._memoized("integrated", fingerprint, lambda: self._integrated_compute(query, context, fingerprint))
+    
+    def _integrated_compute(self, query: str, context: Dict[str, Any], fingerprint: Optional[str]) -> Dict[str, Any]:
+        # Parsed once and shared by both hemispheres
+        features = QueryFeatures.from_query(query)
+        if self.executor_type == "none":
+            y789_result = self._y789_process(query, context, features, fingerprint)
+            nexus_result = self._nexus_process(query, context, features, fingerprint)
+            return self._integrate_hemispheres(y789_result, nexus_result)
+        
+        # Both hemispheres start together, so each deadline is measured from submission
+        start_time = time.monotonic()
+        futures = self._submit_hemispheres(features, context)
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for hemisphere, future in futures.items():
+            timeout = self.hemisphere_timeouts.get(hemisphere)
+            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start_time))
+            try:
+                results[hemisphere] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                future.cancel()
+                results[hemisphere] = None
+        return self._collect_hemispheres(query, results, fingerprint)
+    
+    async def integrated_process_async(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """integrated_process that awaits the hemisphere workers instead of blocking the event loop"""
+        if self.executor_type == "none":
+            return self.integrated_process(query, context)
+        fingerprint = self._fingerprint(query, context)
+        cached = self._cache_get("integrated", fingerprint)
+        if cached is not None:
+            return cached
+        
+        async def wait_for_hemisphere(hemisphere: str, future: Future) -> Optional[Dict[str, Any]]:
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), self.hemisphere_timeouts.get(hemisphere))
+            except asyncio.TimeoutError:
+                return None
+        
+        futures = self._submit_hemispheres(QueryFeatures.from_query(query), context)
+        results = await asyncio.gather(*(
+            wait_for_hemisphere(hemisphere, future) for hemisphere, future in futures.items()
+        ))
+        integrated_result = self._collect_hemispheres(query, dict(zip(futures, results)), fingerprint)
+        self._cache_put("integrated", fingerprint, integrated_result)
+        return integrated_result
+    
+    def integrated_process_batch(self, queries: List[str],
+                                 contexts: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        integrated_process for many queries on the calling thread
+        Classification, precision and confidences are computed as arrays across the batch;
+        the structured per-query parts (and each query's candidate fusion) are built one
+        query at a time.
+        Results equal the scalar path's (processing_time is each query's share of the
+        batch). Per-query runs are not written to processing_history.
+        """
+        start_time = time.time()
+        if contexts is None:
+            contexts = [{} for _ in queries]
+        if len(contexts) != len(queries):
+            raise ValueError("queries and contexts must have the same length")
+        
+        fingerprints = [self._fingerprint(query, context) for query, context in zip(queries, contexts)]
+        results: List[Optional[Dict[str, Any]]] = [
+            self._cache_get("integrated", fingerprint) for fingerprint in fingerprints
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            self._record_batch(len(queries), len(queries), start_time)
+            return results
+        
+        features = [QueryFeatures.from_query(queries[i]) for i in pending]
+        pending_contexts = [contexts[i] for i in pending]
+        
+        # Batch-wide scores
+        query_types = self._classify_queries(features)
+        precision_scores = self._calculate_precision_scores(features)
+        confidence_levels = self._calculate_y789_confidences(precision_scores)
+        synthetic_insights = [
+            self._synthesize_insights(query_features, context)
+            for query_features, context in zip(features, pending_contexts)
+        ]
+        novelty_scores = self._calculate_nexus_novelties(synthetic_insights)
+        integrated_confidences = self._calculate_integrated_confidences(confidence_levels, novelty_scores)
+        processing_time = (time.time() - start_time) / len(pending)
+        
+        # Structured per-query parts, including each query's candidate ranking and fusion
+        precision_list, confidence_list = precision_scores.tolist(), confidence_levels.tolist()
+        for j, (i, query_features, context) in enumerate(zip(pending, features, pending_contexts)):
+            y789_result = self._build_y789_result(
+                query_features, context, query_types[j], precision_list[j], confidence_list[j]
+            )
+            y789_result["processing_time"] = processing_time
+            nexus_result = self._build_nexus_result(
+                query_features, context, synthetic_insights[j], novelty_scores[j]
+            )
+            nexus_result["processing_time"] = processing_time
+            results[i] = self._integrate_hemispheres(
+                y789_result, nexus_result, integrated_confidence=integrated_confidences[j]
+            )
+            self._cache_put("y789", fingerprints[i], y789_result)
+            self._cache_put("nexus", fingerprints[i], nexus_result)
+            self._cache_put("integrated", fingerprints[i], results[i])
         
+        self._record_batch(len(queries), len(queries) - len(pending), start_time)
+        return results
+    
+    def _record_batch(self, queries: int, cached: int, start_time: float):
+        self.performance_metrics["last_batch"] = {
+            "queries": queries,
+            "cached": cached,
+            "elapsed_seconds": time.time() - start_time
+        }
+    
+    def _submit_hemispheres(self, features: QueryFeatures, context: Dict[str, Any]) -> Dict[str, Future]:
+        with self._executor_lock:
+            if self._executor is None:
+                if self.executor_type == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix="cognitive")
+            executor = self._executor
+        return {
+            "y789": executor.submit(self._y789_analysis, features, context),
+            "nexus": executor.submit(self._nexus_synthesis, features, context)
+        }
+    
+    def _collect_hemispheres(self, query: str, results: Dict[str, Optional[Dict[str, Any]]],
+                             fingerprint: Optional[str] = None) -> Dict[str, Any]:
+        """Log finished hemispheres, substitute fallbacks for late ones and integrate"""
+        missing = [hemisphere for hemisphere in self.HEMISPHERES if results.get(hemisphere) is None]
+        timeouts = self.performance_metrics.setdefault("hemisphere_timeouts", dict.fromkeys(self.HEMISPHERES, 0))
+        for hemisphere in missing:
+            timeouts[hemisphere] += 1
+            results[hemisphere] = self._hemisphere_fallback(hemisphere)
+        for hemisphere in self.HEMISPHERES:
+            if hemisphere not in missing:
+                self._log_processing(hemisphere.upper(), query, results[hemisphere])
+                self._cache_put(hemisphere, fingerprint, results[hemisphere])
+        
+        return self._integrate_hemispheres(results["y789"], results["nexus"], missing)
+    
+    def result_cache_stats(self) -> Dict[str, Any]:
+        return {**self.result_cache.stats(), "by_kind": copy.deepcopy(self.cache_metrics)}
+    
+    def _fingerprint(self, query: str, context: Dict[str, Any]) -> Optional[str]:
+        """Stable hash of the query and non-volatile context, or None if the context cannot be hashed"""
+        if not self.result_cache_enabled:
+            return None
+        relevant = {key: value for key, value in context.items() if key not in self.volatile_context_keys}
+        try:
+            payload = json.dumps([query, relevant], sort_keys=True, default=self._fingerprint_default)
+        except (TypeError, ValueError):
+            self.cache_metrics["uncacheable"] += 1
+            return None
+        return hashlib.md5(payload.encode()).hexdigest()
+    
+    @staticmethod
+    def _fingerprint_default(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            return ["ndarray", str(value.dtype), value.shape, hashlib.md5(value.tobytes()).hexdigest()]
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (set, frozenset)):
+            return sorted(value, key=repr)
+        raise TypeError(f"Cannot fingerprint {type(value).__name__}")
+    
+    def _memoized(self, kind: str, fingerprint: Optional[str], compute) -> Dict[str, Any]:
+        cached = self._cache_get(kind, fingerprint)
+        if cached is not None:
+            return cached
+        result = compute()
+        self._cache_put(kind, fingerprint, result)
+        return result
+    
+    def _cache_get(self, kind: str, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        if fingerprint is None:
+            return None
+        cached = self.result_cache.get((kind, fingerprint))
+        self.cache_metrics[kind]["hits" if cached is not None else "misses"] += 1
+        # Callers own their result dicts, so hand out copies
+        return copy.deepcopy(cached) if cached is not None else None
+    
+    def _cache_put(self, kind: str, fingerprint: Optional[str], result: Dict[str, Any]):
+        if fingerprint is not None and not result.get("partial") and not result.get("timed_out"):
+            self.result_cache.put((kind, fingerprint), copy.deepcopy(result))
+    
+    def _integrate_hemispheres(self, y789_result: Dict, nexus_result: Dict, missing: Sequence[str] = (),
+                               integrated_confidence: Optional[float] = None) -> Dict[str, Any]:
+        """Fuse both hemispheres (batch callers pass their precomputed confidence)"""
         # Reciprocal Rank Fusion integration
         integrated_result = self._reciprocal_rank_fusion(y789_result, nexus_result)
+        if integrated_confidence is None:
+            integrated_confidence = self._calculate_integrated_confidence(y789_result, nexus_result)
         
         # Enhanced with emergent properties
         integrated_result.update({
             "emergent_insights": self._identify_emergent_properties(y789_result, nexus_result),
             "cognitive_coherence": self._calculate_coherence(y789_result, nexus_result),
-            "integrated_confidence": self._calculate_integrated_confidence(y789_result, nexus_result)
+            "integrated_confidence": integrated_confidence,
+            "partial": bool(missing),
+            "missing_hemispheres": list(missing)
         })
         
         return integrated_result
     
-    def _reciprocal_rank_fusion(self, y789_result: Dict, nexus_result: Dict, k: float = 60.0) -> Dict[str, Any]:
+    def _hemisphere_fallback(self, hemisphere: str) -> Dict[str, Any]:
+        """Empty, zero-confidence stand-in for a hemisphere that missed its deadline"""
+        if hemisphere == "y789":
+            return {
+                "query_type": "unknown",
+                "logical_structure": {},
+                "fact_requirements": [],
+                "precision_score": 0.0,
+                "analytical_breakdown": {},
+                "confidence_level": 0.0,
+                "ranked_candidates": [],
+                "processing_time": self.hemisphere_timeouts["y789"],
+                "timed_out": True
+            }
+        return {
+            "pattern_recognition": {},
+            "metaphorical_connections": [],
+            "creative_hypotheses": [],
+            "contextual_integration": {},
+            "synthetic_insights": [],
+            "novelty_score": 0.0,
+            "ranked_candidates": [],
+            "processing_time": self.hemisphere_timeouts["nexus"],
+            "timed_out": True
+        }
+    
+    def _reciprocal_rank_fusion(self, y789_result: Dict, nexus_result: Dict) -> Dict[str, Any]:
         """
         Implement Reciprocal Rank Fusion algorithm for combining results
-        RRF(d) = Σ(1 / (k + rank(d)))
+        RRF(d) = Σ(w_l / (k + rank_l(d))) over the hemispheres' ranked candidate lists
         """
+        fused_candidates = self._fuse_candidates(y789_result, nexus_result)
+        
         # Combine analytical and synthetic insights
         fusion_result = {
             "fused_analysis": {
@@ -231,53 +728,173 @@ class CognitiveEngine:
                     nexus_result.get("pattern_recognition", {})
                 )
             },
-            "rrf_score": self._calculate_rrf_score(y789_result, nexus_result, k),
+            "fused_candidates": fused_candidates,
+            "rrf_score": self._calculate_rrf_score(fused_candidates),
             "fusion_quality": 0.0
         }
         
         # Calculate fusion quality
-        fusion_result["fusion_quality"] = self._assess_fusion_quality(y789_result, nexus_result)
+        fusion_result["fusion_quality"] = self._assess_fusion_quality(fused_candidates)
         
         return fusion_result
     
-    def _classify_query(self, query: str) -> str:
+    def _fuse_candidates(self, y789_result: Dict, nexus_result: Dict) -> List[Dict[str, Any]]:
+        """
+        Top fusion_top_k candidates across both hemispheres with per-list contributions
+        Candidates are keyed by concept, so anything both hemispheres produce fuses.
+        Short lists go through RankFusion.fuse (heap top-k); long ones are encoded with
+        one np.unique over every candidate id and fused with RankFusion.fuse_arrays.
+        Both give the same order.
+        """
+        names = list(self.HEMISPHERES)
+        candidate_lists = [
+            y789_result.get("ranked_candidates", []),
+            nexus_result.get("ranked_candidates", [])
+        ]
+        all_ids = [candidate["id"] for candidates in candidate_lists for candidate in candidates]
+        all_kinds = [candidate.get("kind") for candidates in candidate_lists for candidate in candidates]
+        
+        if len(all_ids) < self.vectorized_fusion_threshold:
+            kinds: Dict[str, str] = {}
+            for candidate_id, kind in zip(all_ids, all_kinds):
+                kinds.setdefault(candidate_id, kind)
+            ranked_ids = {
+                name: [candidate["id"] for candidate in candidates]
+                for name, candidates in zip(names, candidate_lists)
+            }
+            return [
+                {"id": result.item, "kind": kinds[result.item], "score": result.score,
+                 "contributions": dict(result.contributions), "ranks": dict(result.ranks)}
+                for result in self.rank_fusion.fuse(ranked_ids, top_k=self.fusion_top_k)
+            ]
+        
+        # First occurrence in hemisphere order decides an id's kind, as in the heap path
+        unique_ids, first_seen, codes = np.unique(np.array(all_ids), return_index=True, return_inverse=True)
+        bounds = np.cumsum([0] + [len(candidates) for candidates in candidate_lists])
+        id_arrays = {name: codes[bounds[column]:bounds[column + 1]] for column, name in enumerate(names)}
+        best_ranks = np.zeros((len(unique_ids), len(names)), dtype=np.int64)
+        for column, name in enumerate(names):
+            _, best = np.unique(id_arrays[name], return_index=True)
+            best_ranks[id_arrays[name][best], column] = best + 1
+        fused_codes, scores, contributions = self.rank_fusion.fuse_arrays(id_arrays, top_k=self.fusion_top_k)
+        
+        fused = []
+        for code, score, row, ranks in zip(fused_codes.tolist(), scores.tolist(), contributions.tolist(),
+                                           best_ranks[fused_codes].tolist()):
+            fused.append({
+                "id": str(unique_ids[code]),
+                "kind": all_kinds[first_seen[code]],
+                "score": score,
+                "contributions": {name: value for name, value, rank in zip(names, row, ranks) if rank},
+                "ranks": {name: rank for name, rank in zip(names, ranks) if rank}
+            })
+        return fused
+    
+    def _rank_y789_candidates(self, analysis: Dict) -> List[Dict[str, Any]]:
+        """Analytical candidates (breakdown items, premises, conclusions, facts), best first"""
+        confidence = analysis.get("confidence_level", 0.0)
+        candidates = [
+            {"id": self._concept_key(item), "kind": f"breakdown:{dimension}", "score": confidence}
+            for dimension, items in analysis.get("analytical_breakdown", {}).items() for item in items
+        ]
+        logical_structure = analysis.get("logical_structure", {})
+        candidates += [{"id": self._concept_key(premise), "kind": "premise", "score": confidence}
+                       for premise in logical_structure.get("premises", [])]
+        candidates += [{"id": self._concept_key(conclusion), "kind": "conclusion", "score": confidence}
+                       for conclusion in logical_structure.get("conclusions", [])]
+        candidates += [{"id": self._concept_key(fact), "kind": "fact", "score": analysis.get("precision_score", 0.0)}
+                       for fact in analysis.get("fact_requirements", [])]
+        return self._rank_candidates(candidates)
+    
+    def _rank_nexus_candidates(self, synthesis: Dict) -> List[Dict[str, Any]]:
+        """Synthetic candidates (insights, hypotheses, metaphors, patterns), best first"""
+        candidates = [
+            {"id": self._concept_key(insight["insight"]), "kind": "insight",
+             "score": insight.get("confidence", insight.get("novelty", 0.0))}
+            for insight in synthesis.get("synthetic_insights", [])
+        ]
+        candidates += [
+            {"id": self._concept_key(hypothesis["hypothesis"]), "kind": "hypothesis",
+             "score": hypothesis.get("plausibility", 0.0)}
+            for hypothesis in synthesis.get("creative_hypotheses", [])
+        ]
+        candidates += [
+            {"id": self._concept_key(f"{link['source']} -> {link['target']}"), "kind": "metaphor",
+             "score": link.get("strength", 0.0)}
+            for link in synthesis.get("metaphorical_connections", [])
+        ]
+        candidates += [
+            {"id": self._concept_key(pattern.get("id", f"{family} {index}")), "kind": f"pattern:{family}",
+             "score": pattern.get("strength", 0.0)}
+            for family, patterns in synthesis.get("pattern_recognition", {}).items()
+            for index, pattern in enumerate(patterns)
+        ]
+        return self._rank_candidates(candidates)
+    
+    @staticmethod
+    def _concept_key(item: Any) -> str:
+        """Candidate id shared across hemispheres: the item's text, lowercased with spaces collapsed"""
+        return " ".join(str(item).lower().split())
+    
+    @staticmethod
+    def _rank_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sort by score, best first; ties keep emission order"""
+        ranked = sorted(candidates, key=lambda candidate: candidate["score"], reverse=True)
+        for rank, candidate in enumerate(ranked, 1):
+            candidate["rank"] = rank
+        return ranked
+    
+    def _classify_query(self, features: QueryFeatures) -> str:
         """Classify the type of query for appropriate processing"""
         # Simplified classification logic
-        if any(word in query.lower() for word in ["analyze", "break down", "explain", "define"]):
+        if features.keyword_hits.get("analytical"):
             return "analytical"
-        elif any(word in query.lower() for word in ["create", "imagine", "synthesize", "connect"]):
+        elif features.keyword_hits.get("synthetic"):
             return "synthetic"
         else:
             return "integrated"
     
-    def _extract_logical_structure(self, query: str) -> Dict[str, Any]:
+    def _classify_queries(self, features: List[QueryFeatures]) -> List[str]:
+        """_classify_query across a batch"""
+        analytical = np.array([bool(query_features.keyword_hits.get("analytical")) for query_features in features])
+        synthetic = np.array([bool(query_features.keyword_hits.get("synthetic")) for query_features in features])
+        codes = np.where(analytical, 0, np.where(synthetic, 1, 2))
+        labels = ("analytical", "synthetic", "integrated")
+        return [labels[code] for code in codes.tolist()]
+    
+    def _extract_logical_structure(self, features: QueryFeatures) -> Dict[str, Any]:
         """Extract logical components and relationships"""
         return {
-            "premises": self._identify_premises(query),
-            "conclusions": self._identify_conclusions(query),
-            "logical_operators": self._identify_logical_operators(query),
-            "argument_structure": self._map_argument_structure(query)
+            "premises": self._identify_premises(features),
+            "conclusions": self._identify_conclusions(features),
+            "logical_operators": self._identify_logical_operators(features),
+            "argument_structure": self._map_argument_structure(features)
         }
     
-    def _identify_fact_requirements(self, query: str) -> List[str]:
+    def _identify_fact_requirements(self, features: QueryFeatures) -> List[str]:
         """Identify what facts are needed to answer the query"""
         # Simplified fact identification
         return ["context_facts", "domain_knowledge", "procedural_knowledge"]
     
-    def _calculate_precision_score(self, query: str) -> float:
+    def _calculate_precision_score(self, features: QueryFeatures) -> float:
         """Calculate how precisely the query can be analyzed"""
         # Simplified precision calculation
-        return min(1.0, len(query.split()) / 10.0)
+        return min(1.0, features.length / 10.0)
+    
+    def _calculate_precision_scores(self, features: List[QueryFeatures]) -> np.ndarray:
+        """_calculate_precision_score across a batch"""
+        lengths = np.array([query_features.length for query_features in features], dtype=np.float64)
+        return np.minimum(1.0, lengths / 10.0)
     
-    def _perform_analytical_breakdown(self, query: str, context: Dict) -> Dict[str, Any]:
+    def _perform_analytical_breakdown(self, features: QueryFeatures, context: Dict) -> Dict[str, Any]:
         """Perform systematic analytical breakdown"""
         return {
-            "who": self._extract_entities(query),
-            "what": self._extract_actions(query),
-            "where": self._extract_locations(query),
-            "when": self._extract_temporal(query),
-            "why": self._extract_causation(query),
-            "how": self._extract_mechanisms(query)
+            "who": self._extract_entities(features),
+            "what": self._extract_actions(features),
+            "where": self._extract_locations(features),
+            "when": self._extract_temporal(features),
+            "why": self._extract_causation(features),
+            "how": self._extract_mechanisms(features)
         }
     
     def _calculate_y789_confidence(self, analysis: Dict) -> float:
@@ -285,37 +902,41 @@ class CognitiveEngine:
         # Simplified confidence calculation
         return min(1.0, analysis.get("precision_score", 0.0) * 0.8 + 0.2)
     
-    def _identify_patterns(self, query: str, context: Dict) -> Dict[str, Any]:
+    def _calculate_y789_confidences(self, precision_scores: np.ndarray) -> np.ndarray:
+        """_calculate_y789_confidence across a batch"""
+        return np.minimum(1.0, precision_scores * 0.8 + 0.2)
+    
+    def _identify_patterns(self, features: QueryFeatures, context: Dict) -> Dict[str, Any]:
         """Identify patterns and relationships"""
         return {
-            "semantic_patterns": self._find_semantic_patterns(query),
-            "structural_patterns": self._find_structural_patterns(query),
-            "contextual_patterns": self._find_contextual_patterns(query, context)
+            "semantic_patterns": self._find_semantic_patterns(features),
+            "structural_patterns": self._find_structural_patterns(features),
+            "contextual_patterns": self._find_contextual_patterns(features, context)
         }
     
-    def _find_metaphorical_links(self, query: str) -> List[Dict[str, str]]:
+    def _find_metaphorical_links(self, features: QueryFeatures) -> List[Dict[str, str]]:
         """Find metaphorical connections and analogies"""
         return [
             {"source": "query_concept", "target": "metaphor", "strength": 0.8},
             {"source": "domain_a", "target": "domain_b", "strength": 0.6}
         ]
     
-    def _generate_hypotheses(self, query: str, context: Dict) -> List[Dict[str, Any]]:
+    def _generate_hypotheses(self, features: QueryFeatures, context: Dict) -> List[Dict[str, Any]]:
         """Generate creative hypotheses and possibilities"""
         return [
             {"hypothesis": "creative_possibility_1", "plausibility": 0.7, "novelty": 0.8},
             {"hypothesis": "creative_possibility_2", "plausibility": 0.6, "novelty": 0.9}
         ]
     
-    def _integrate_context(self, query: str, context: Dict) -> Dict[str, Any]:
+    def _integrate_context(self, features: QueryFeatures, context: Dict) -> Dict[str, Any]:
         """Integrate contextual information holistically"""
         return {
-            "contextual_relevance": self._assess_contextual_relevance(query, context),
+            "contextual_relevance": self._assess_contextual_relevance(features, context),
             "background_integration": self._integrate_background(context),
-            "situational_awareness": self._assess_situation(query, context)
+            "situational_awareness": self._assess_situation(features, context)
         }
     
-    def _synthesize_insights(self, query: str, context: Dict) -> List[Dict[str, Any]]:
+    def _synthesize_insights(self, features: QueryFeatures, context: Dict) -> List[Dict[str, Any]]:
         """Synthesize novel insights from available information"""
         return [
             {"insight": "emergent_understanding_1", "confidence": 0.8, "novelty": 0.7},
@@ -327,6 +948,14 @@ class CognitiveEngine:
         # Simplified novelty calculation
         return np.mean([insight.get("novelty", 0.0) for insight in synthesis.get("synthetic_insights", [])])
     
+    def _calculate_nexus_novelties(self, insight_lists: List[List[Dict[str, Any]]]) -> np.ndarray:
+        """_calculate_nexus_novelty across a batch (one row mean when every list has the same length)"""
+        novelties = [[insight.get("novelty", 0.0) for insight in insights] for insights in insight_lists]
+        lengths = {len(row) for row in novelties}
+        if len(lengths) == 1 and 0 not in lengths:
+            return np.mean(np.array(novelties, dtype=np.float64), axis=1)
+        return np.array([np.mean(row) for row in novelties], dtype=np.float64)
+    
     def _log_processing(self, engine: str, query: str, result: Dict):
         """Log processing results for analysis"""
         log_entry = {
@@ -339,81 +968,2084 @@ class CognitiveEngine:
         self.processing_history.append(log_entry)
     
     # Additional helper methods would be implemented here...
-    def _identify_premises(self, query: str) -> List[str]:
+    def _identify_premises(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _identify_conclusions(self, query: str) -> List[str]:
+    def _identify_conclusions(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _identify_logical_operators(self, query: str) -> List[str]:
+    def _identify_logical_operators(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _map_argument_structure(self, query: str) -> Dict[str, Any]:
+    def _map_argument_structure(self, features: QueryFeatures) -> Dict[str, Any]:
         return {}
     
-    def _extract_entities(self, query: str) -> List[str]:
+    def _extract_entities(self, features: QueryFeatures) -> List[str]:
+        return []
+    
+    def _extract_actions(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _extract_actions(self, query: str) -> List[str]:
+    def _extract_locations(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _extract_locations(self, query: str) -> List[str]:
+    def _extract_temporal(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _extract_temporal(self, query: str) -> List[str]:
+    def _extract_causation(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _extract_causation(self, query: str) -> List[str]:
+    def _extract_mechanisms(self, features: QueryFeatures) -> List[str]:
         return []
     
-    def _extract_mechanisms(self, query: str) -> List[str]:
+    def _find_semantic_patterns(self, features: QueryFeatures) -> List[Dict]:
         return []
     
-    def _find_semantic_patterns(self, query: str) -> List[Dict]:
+    def _find_structural_patterns(self, features: QueryFeatures) -> List[Dict]:
         return []
     
-    def _find_structural_patterns(self, query: str) -> List[Dict]:
+    def _find_contextual_patterns(self, features: QueryFeatures, context: Dict) -> List[Dict]:
         return []
     
-    def _find_contextual_patterns(self, query: str, context: Dict) -> List[Dict]:
-        return []
+    def _assess_contextual_relevance(self, features: QueryFeatures, context: Dict) -> float:
+        return 0.8
+    
+    def _integrate_background(self, context: Dict) -> Dict:
+        return {}
+    
+    def _assess_situation(self, features: QueryFeatures, context: Dict) -> Dict:
+        return {}
+    
+    def _identify_emergent_properties(self, y789_result: Dict, nexus_result: Dict) -> List[Dict]:
+        return []
+    
+    def _calculate_coherence(self, y789_result: Dict, nexus_result: Dict) -> float:
+        return 0.85
+    
+    def _calculate_integrated_confidence(self, y789_result: Dict, nexus_result: Dict) -> float:
+        y789_conf = y789_result.get("confidence_level", 0.0)
+        nexus_conf = nexus_result.get("novelty_score", 0.0)
+        return (y789_conf + nexus_conf) / 2.0
+    
+    def _calculate_integrated_confidences(self, confidence_levels: np.ndarray,
+                                          novelty_scores: np.ndarray) -> np.ndarray:
+        """_calculate_integrated_confidence across a batch"""
+        return (confidence_levels + novelty_scores) / 2.0
+    
+    def _integrate_patterns_logic(self, logical_structure: Dict, patterns: Dict) -> Dict:
+        return {"integrated": True}
+    
+    def _calculate_rrf_score(self, fused_candidates: List[Dict[str, Any]]) -> float:
+        """Fused score of the best candidate"""
+        return fused_candidates[0]["score"] if fused_candidates else 0.0
+    
+    def _assess_fusion_quality(self, fused_candidates: List[Dict[str, Any]]) -> float:
+        """
+        Fused mass of the returned candidates relative to the most that many candidates
+        could score (every list ranking the same items first): 1.0 when the hemispheres
+        agree, about 1 / (number of lists) when their candidates are disjoint
+        """
+        if not fused_candidates:
+            return 0.0
+        ranks = np.arange(1, len(fused_candidates) + 1)
+        best_possible = sum(
+            float(np.sum(RankFusion.reciprocal_rank(
+                ranks, self.rank_fusion.list_k.get(name, self.rank_fusion.k), self.rank_fusion.weights.get(name, 1.0)
+            )))
+            for name in self.HEMISPHERES
+        )
+        return sum(candidate["score"] for candidate in fused_candidates) / best_possible
+
+
+# ============================================================================
+# THE HOARD - MEMORY SYSTEM
+# ============================================================================
+
+class BoundedLRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and/or payload bytes
+    Entries are evicted least-recently-used first once either bound is exceeded,
+    and with ttl_seconds set they expire that long after being stored.
+    Hit, miss, eviction and expiration counters are kept for the performance metrics.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[Any, Tuple[Any, int, float]]" = OrderedDict()  # value, bytes, stored at
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key) -> bool:
+        """Whether a live (unexpired) entry exists; does not count as a hit or refresh recency"""
+        with self._lock:
+            return self._live_entry(key) is not None
+    
+    def get(self, key, default=None):
+        """Return the cached value and mark it most recently used"""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, value, size: Optional[int] = None):
+        """Insert or refresh a value, evicting the coldest entries past the bounds"""
+        size = self._sizeof(value) if size is None else size
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            self._entries[key] = (value, size, time.monotonic())
+            self.nbytes += size
+            self._evict()
+    
+    def resize(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Change the bounds, evicting immediately if the cache is now over them"""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._evict()
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+    
+    def _live_entry(self, key) -> Optional[Tuple[Any, int, float]]:
+        """The entry for key, dropping it (and counting the expiration) if its TTL has passed"""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl_seconds is not None and time.monotonic() - entry[2] > self.ttl_seconds:
+            del self._entries[key]
+            self.nbytes -= entry[1]
+            self.expirations += 1
+            return None
+        return entry
+    
+    def _evict(self):
+        while self._entries and self._over_bounds():
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+    
+    def _over_bounds(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.nbytes > self.max_bytes
+    
+    @staticmethod
+    def _sizeof(value) -> int:
+        return value.nbytes if isinstance(value, np.ndarray) else 0
+
+
+class QueryResultCache:
+    """
+    QueryResultCache - memoized retrieve_knowledge results
+    Entries are keyed by normalized query text and result parameters and tagged with the
+    Hoard generation they were computed at; every write bumps the generation, so older
+    entries miss. With semantic_epsilon set, an exact-key miss falls back to the nearest
+    recent query embedding within that cosine distance.
+    """
+    
+    def __init__(self, max_entries: int = 1024, semantic_epsilon: Optional[float] = None,
+                 semantic_slots: int = 256):
+        self.results = BoundedLRUCache(max_entries=max_entries)
+        self.semantic_epsilon = semantic_epsilon
+        self.semantic_slots = semantic_slots
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._embeddings: Optional[np.ndarray] = None  # ring buffer of unit query embeddings
+        self._slot_keys: List[Optional[Tuple]] = []
+        self._next_slot = 0
+        self._lock = threading.Lock()
+    
+    def configure(self, cache_config: Dict[str, Any]):
+        self.results.resize(cache_config.get("max_entries", self.results.max_entries))
+        self.semantic_epsilon = cache_config.get("semantic_epsilon", self.semantic_epsilon)
+        slots = cache_config.get("semantic_slots", self.semantic_slots)
+        if slots != self.semantic_slots:
+            self.semantic_slots = slots
+            self._reset_slots()
+    
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+    
+    def get(self, key: Tuple, generation: int,
+            query_embedding: Optional[np.ndarray] = None) -> Optional[Tuple[str, ...]]:
+        """Node ids cached for key at this generation, or for a near-identical query"""
+        entry = self.results.get(key)
+        if entry is not None:
+            if entry[0] == generation:
+                self.hits += 1
+                return entry[1]
+            self.stale += 1
+        
+        if self.semantic_epsilon is not None and query_embedding is not None:
+            match = self._nearest(key, query_embedding)
+            entry = self.results.get(match) if match is not None else None
+            if entry is not None and entry[0] == generation:
+                self.semantic_hits += 1
+                return entry[1]
+        
+        self.misses += 1
+        return None
+    
+    def put(self, key: Tuple, generation: int, node_ids: Sequence[str],
+            query_embedding: Optional[np.ndarray] = None):
+        self.results.put(key, (generation, tuple(node_ids)))
+        if self.semantic_epsilon is None or query_embedding is None:
+            return
+        
+        embedding = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        with self._lock:
+            if self._embeddings is None or self._embeddings.shape[1] != embedding.shape[0]:
+                self._embeddings = np.zeros((self.semantic_slots, embedding.shape[0]), dtype=np.float32)
+                self._slot_keys = [None] * self.semantic_slots
+                self._next_slot = 0
+            self._embeddings[self._next_slot] = embedding / norm if norm > 0 else embedding
+            self._slot_keys[self._next_slot] = key
+            self._next_slot = (self._next_slot + 1) % self.semantic_slots
+    
+    def clear(self):
+        self.results.clear()
+        self._reset_slots()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.semantic_hits + self.misses
+        return {
+            "entries": len(self.results),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": (self.hits + self.semantic_hits) / lookups if lookups else 0.0,
+            "semantic_epsilon": self.semantic_epsilon
+        }
+    
+    def _nearest(self, key: Tuple, query_embedding: np.ndarray) -> Optional[Tuple]:
+        """Key of the most similar cached query with the same result parameters"""
+        with self._lock:
+            if self._embeddings is None or self._embeddings.shape[1] != len(query_embedding):
+                return None
+            candidates = [slot for slot, slot_key in enumerate(self._slot_keys)
+                          if slot_key is not None and slot_key[1:] == key[1:]]
+            if not candidates:
+                return None
+            norm = np.linalg.norm(query_embedding)
+            similarities = self._embeddings[candidates] @ (query_embedding / norm if norm > 0 else query_embedding)
+            best = int(np.argmax(similarities))
+            if 1.0 - float(similarities[best]) > self.semantic_epsilon:
+                return None
+            return self._slot_keys[candidates[best]]
+    
+    def _reset_slots(self):
+        with self._lock:
+            self._embeddings = None
+            self._slot_keys = []
+            self._next_slot = 0
+
+
+class EmbeddingProvider(ABC):
+    """
+    EmbeddingProvider - source of The Hoard's content embeddings
+    Providers embed whole batches and declare their output dimension. Outputs are
+    Matryoshka-style (any prefix is a usable lower-resolution embedding), so a
+    provider configured below its native dimension returns re-normalized prefixes.
+    """
+    
+    name = "base"
+    
+    def __init__(self, dimension: Optional[int] = None):
+        self._dimension = dimension
+    
+    @property
+    def dimension(self) -> int:
+        return min(self._dimension, self.native_dimension) if self._dimension else self.native_dimension
+    
+    @property
+    @abstractmethod
+    def native_dimension(self) -> int:
+        """Full dimension produced by the underlying encoder"""
+        pass
+    
+    @abstractmethod
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into an (n, native_dimension) matrix"""
+        pass
+    
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as one (n, dimension) float32 matrix of unit vectors"""
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return self.truncate(np.asarray(self._encode(list(texts)), dtype=np.float32), self.dimension)
+    
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+    
+    @staticmethod
+    def truncate(embeddings: np.ndarray, dimension: int) -> np.ndarray:
+        """MRL truncation: keep the leading dimensions and re-normalize"""
+        prefix = embeddings[..., :dimension]
+        norms = np.linalg.norm(prefix, axis=-1, keepdims=True)
+        return (prefix / np.where(norms > 0, norms, 1.0)).astype(np.float32)
+    
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "dimension": self.dimension, "native_dimension": self.native_dimension}
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic hashing-trick embedder for tests and benchmarks
+    Every word n-gram hashes (MD5) to two signed rows of a fixed Gaussian projection
+    table, and a text embeds as its signed bucket counts times that table. Identical
+    content embeds identically in every process, texts sharing vocabulary land close
+    together, and each prefix is itself a random projection, so MRL truncation stays
+    meaningful. Feature hashes are kept in an LRU cache bounded by bytes.
+    """
+    
+    name = "hashing"
+    token_pattern = re.compile(r"\w+")
+    FEATURE_ENTRY_BYTES = 120  # cache bookkeeping per feature on top of the string itself
+    
+    def __init__(self, dimension: int = 768, ngram_range: Tuple[int, int] = (1, 2), seed: int = 0,
+                 n_buckets: int = 4096, feature_cache_bytes: int = 16 * 1024 * 1024,
+                 block_budget: int = 2 ** 22):
+        super().__init__(dimension)
+        self._native_dimension = dimension
+        self.ngram_range = tuple(ngram_range)
+        self.seed = seed
+        self.n_buckets = n_buckets
+        self.block_budget = block_budget  # floats per (texts x buckets) count block
+        self.feature_codes = BoundedLRUCache(max_bytes=feature_cache_bytes)
+        self._table: Optional[np.ndarray] = None
+    
+    @property
+    def native_dimension(self) -> int:
+        return self._native_dimension
+    
+    @property
+    def table(self) -> np.ndarray:
+        """(n_buckets, native_dimension) Gaussian projection, generated once from the seed"""
+        if self._table is None:
+            self._table = np.random.default_rng(self.seed).standard_normal(
+                (self.n_buckets, self.native_dimension), dtype=np.float32
+            )
+        return self._table
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        text_features = [self._features(text) for text in texts]
+        codes = {feature: self._feature_code(feature) for features in text_features for feature in features}
+        
+        text_rows = np.repeat(np.arange(len(texts)), [len(features) for features in text_features])
+        feature_codes = np.fromiter(
+            (codes[feature] for features in text_features for feature in features),
+            dtype=np.uint64, count=len(text_rows)
+        )
+        first, second, first_sign, second_sign = self._buckets(feature_codes)
+        
+        # Signed bucket counts times the table, one bounded dense block at a time
+        table = self.table
+        embeddings = np.empty((len(texts), self.native_dimension), dtype=np.float32)
+        block_rows = max(1, self.block_budget // self.n_buckets)
+        bounds = np.searchsorted(text_rows, np.arange(0, len(texts) + block_rows, block_rows))
+        for block, start in enumerate(range(0, len(texts), block_rows)):
+            n_rows = min(block_rows, len(texts) - start)
+            lo, hi = bounds[block], bounds[block + 1]
+            cells = (text_rows[lo:hi] - start) * self.n_buckets
+            counts = np.bincount(
+                np.concatenate([cells + first[lo:hi], cells + second[lo:hi]]),
+                weights=np.concatenate([first_sign[lo:hi], second_sign[lo:hi]]),
+                minlength=n_rows * self.n_buckets
+            ).reshape(n_rows, self.n_buckets).astype(np.float32)
+            np.matmul(counts, table, out=embeddings[start:start + n_rows])
+        return embeddings
+    
+    def _buckets(self, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Two distinct table rows and a sign for each from 64-bit feature codes"""
+        n_buckets = np.uint64(self.n_buckets)
+        first = codes % n_buckets
+        second = (first + np.uint64(1) + (codes >> np.uint64(24)) % (n_buckets - np.uint64(1))) % n_buckets
+        first_sign = np.where((codes >> np.uint64(62)) & np.uint64(1), 1.0, -1.0)
+        second_sign = np.where(codes >> np.uint64(63), 1.0, -1.0)
+        return first.astype(np.int64), second.astype(np.int64), first_sign, second_sign
+    
+    def _features(self, text: str) -> List[str]:
+        tokens = self.token_pattern.findall(text.lower())
+        low, high = self.ngram_range
+        features = [
+            " ".join(tokens[i:i + n])
+            for n in range(low, high + 1)
+            for i in range(len(tokens) - n + 1)
+        ]
+        # Texts without word tokens still get a stable embedding of their own
+        return features or [text]
+    
+    def _feature_code(self, feature: str) -> int:
+        code = self.feature_codes.get(feature)
+        if code is None:
+            code = int.from_bytes(hashlib.md5(f"{self.seed}:{feature}".encode()).digest()[:8], "little")
+            self.feature_codes.put(feature, code, size=sys.getsizeof(feature) + self.FEATURE_ENTRY_BYTES)
+        return code
+    
+    def describe(self) -> Dict[str, Any]:
+        description = super().describe()
+        description.update(ngram_range=list(self.ngram_range), seed=self.seed, n_buckets=self.n_buckets)
+        return description
+
+
+class LocalModelEmbeddingProvider(EmbeddingProvider):
+    """
+    Slot for a local CPU embedding model
+    Wraps any object exposing encode(texts, batch_size=...) -> (n, d) array, such as a
+    sentence-transformers model. With only a model_name, sentence-transformers is
+    imported and the model loaded on first use.
+    """
+    
+    name = "local_model"
+    
+    def __init__(self, model: Any = None, model_name: Optional[str] = None, dimension: Optional[int] = None,
+                 batch_size: int = 32, device: str = "cpu"):
+        if model is None and model_name is None:
+            raise ValueError("LocalModelEmbeddingProvider needs a model or a model_name")
+        super().__init__(dimension)
+        self._model = model
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.device = device
+        self._native_dimension: Optional[int] = None
+    
+    @property
+    def model(self) -> Any:
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "local_model embeddings by name require sentence-transformers; "
+                    "install it or pass a model object with an encode() method"
+                ) from e
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+    
+    @property
+    def native_dimension(self) -> int:
+        if self._native_dimension is None:
+            get_dimension = getattr(self.model, "get_sentence_embedding_dimension", None)
+            dimension = get_dimension() if get_dimension else None
+            self._native_dimension = dimension or int(np.asarray(self._encode([""])).shape[1])
+        return self._native_dimension
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(self.model.encode(texts, batch_size=self.batch_size))
+    
+    def describe(self) -> Dict[str, Any]:
+        description = super().describe()
+        description["model_name"] = self.model_name or type(self._model).__name__
+        return description
+
+
+EMBEDDING_PROVIDERS = {
+    "hashing": HashingEmbeddingProvider,
+    "local_model": LocalModelEmbeddingProvider,
+}
+
+
+class HoardVectorIndex:
+    """
+    Contiguous embedding matrix backing The Hoard's semantic search
+    Rows are L2-normalized float32 vectors, so cosine similarity against the
+    whole corpus is a single matrix-vector product. Matryoshka prefixes are
+    searchable at any registered resolution via per-row prefix norms.
+    """
+    
+    quantized = False
+    
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 1024,
+                 resolutions: Optional[List[int]] = None):
+        self.dimension = dimension
+        self.initial_capacity = max(1, initial_capacity)
+        self.matrix: Optional[np.ndarray] = None
+        self.size = 0
+        self.id_to_row: Dict[str, int] = {}
+        self.row_to_id: List[str] = []
+        self.prefix_norms: Dict[int, np.ndarray] = {}
+        self.grow_storage = None  # capacity -> storage arrays, for indexes attached to a file
+        
+        if dimension is not None:
+            self._allocate(self.initial_capacity, dimension)
+        for resolution in resolutions or []:
+            self.add_resolution(resolution)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.id_to_row
+    
+    def add(self, node_id: str, embedding: np.ndarray) -> int:
+        """Insert or replace the vector for a node and return its row"""
+        vector = self.normalize(embedding)
+        
+        if node_id in self.id_to_row:
+            row = self.id_to_row[node_id]
+            self._write_rows(row, vector)
+            return row
+        
+        self._ensure_capacity(self.size + 1, vector.shape[0])
+        row = self.size
+        self._write_rows(row, vector)
+        self.id_to_row[node_id] = row
+        self.row_to_id.append(node_id)
+        self.size += 1
+        return row
+    
+    def add_batch(self, node_ids: List[str], embeddings: np.ndarray) -> np.ndarray:
+        """Append a batch of new nodes in one normalized block copy and return their rows"""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms > 0, norms, 1.0)
+        
+        self._ensure_capacity(self.size + len(node_ids), vectors.shape[1])
+        rows = np.arange(self.size, self.size + len(node_ids))
+        self._write_rows(rows, vectors)
+        for node_id, row in zip(node_ids, rows):
+            self.id_to_row[node_id] = int(row)
+        self.row_to_id.extend(node_ids)
+        self.size += len(node_ids)
+        return rows
+    
+    @classmethod
+    def attach(cls, node_ids: List[str], arrays: Dict[str, np.ndarray],
+               resolutions: Optional[List[int]] = None, grow_storage=None) -> "HoardVectorIndex":
+        """
+        Wrap existing storage arrays (e.g. memory-mapped by a HoardStore) without copying
+        The index takes ownership of the node_ids list. grow_storage(capacity) must return
+        storage arrays with the current rows and room for capacity rows (e.g. the grown
+        file remapped); without it, the first append grows the index into regular memory.
+        """
+        index = cls(initial_capacity=max(1, len(node_ids)))
+        for name, array in arrays.items():
+            setattr(index, name, array)
+        index.dimension = next(array.shape[1] for array in arrays.values() if array.ndim == 2)
+        index.size = len(node_ids)
+        index.row_to_id = node_ids
+        index.id_to_row = {node_id: row for row, node_id in enumerate(node_ids)}
+        index.grow_storage = grow_storage
+        for resolution in resolutions or []:
+            index.add_resolution(resolution)
+        return index
+    
+    def row_arrays(self, rows) -> Dict[str, np.ndarray]:
+        """Raw storage arrays (float rows, or int8 codes and scales) for the given rows"""
+        return {name: array[rows] for name, array in self._storage().items()}
+    
+    def vectors(self) -> np.ndarray:
+        """Populated rows as a float32 matrix"""
+        if self.size == 0:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+        return self.dense(slice(0, self.size))
+    
+    def dense(self, rows) -> np.ndarray:
+        """Float32 unit vectors for a row slice or row index array"""
+        return self.matrix[rows]
+    
+    def exact(self, rows) -> Optional[np.ndarray]:
+        """Unquantized float32 unit vectors for the given rows (None if the index keeps none)"""
+        return self.dense(rows)
+    
+    def add_resolution(self, resolution: int):
+        """Register a Matryoshka prefix length so it can be searched with exact cosine"""
+        if resolution in self.prefix_norms or (self.dimension is not None and resolution >= self.dimension):
+            return
+        
+        norms = np.ones(self._capacity(), dtype=np.float32)
+        if self.size:
+            norms[:self.size] = np.linalg.norm(self.vectors()[:, :resolution], axis=1)
+        self.prefix_norms[resolution] = norms
+    
+    def similarities(self, query_embedding: np.ndarray, resolution: Optional[int] = None,
+                     rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cosine similarity of the query against stored rows (all rows, or the given subset)
+        With a resolution, both sides are truncated to that Matryoshka prefix
+        """
+        if self.size == 0:
+            return np.zeros(0, dtype=np.float32)
+        
+        selection = slice(0, self.size) if rows is None else rows
+        if resolution is None or resolution >= self.dimension:
+            return self._dot(selection, self.normalize(query_embedding))
+        
+        if resolution not in self.prefix_norms:
+            self.add_resolution(resolution)
+        query = self.normalize(np.asarray(query_embedding)[:resolution])
+        norms = self.prefix_norms[resolution][selection]
+        return self._dot(selection, query, resolution) / np.where(norms > 0, norms, 1.0)
+    
+    def similarity_block(self, rows: np.ndarray, budget: int = 2 ** 24) -> np.ndarray:
+        """
+        (len(rows), size) cosine similarities of stored rows against the whole index
+        The corpus is scanned in column chunks of about budget / (len(rows) * dimension)
+        rows, scored by _dot (int8 codes with their scales, never a dequantized chunk).
+        """
+        queries = self.dense(rows)
+        block = np.empty((queries.shape[0], self.size), dtype=np.float32)
+        chunk_size = max(1, budget // max(1, queries.shape[0] * (self.dimension or 1)))
+        for start in range(0, self.size, chunk_size):
+            stop = min(start + chunk_size, self.size)
+            block[:, start:stop] = self._dot(slice(start, stop), queries.T).T
+        return block
+    
+    def search(self, query_embedding: np.ndarray, k: int,
+               resolution: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return the top-k (node_id, similarity) pairs, best first"""
+        scores = self.similarities(query_embedding, resolution)
+        rows = self.top_k(scores, k)
+        return [(self.row_to_id[row], float(scores[row])) for row in rows]
+    
+    def search_batch(self, query_embeddings: np.ndarray, k: int,
+                     budget: int = 2 ** 24) -> List[List[Tuple[str, float]]]:
+        """
+        search() for many queries via one matrix-matrix product per query chunk
+        Queries are chunked so each score block holds at most budget floats.
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if self.size == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms > 0, norms, 1.0)
+        
+        results = []
+        chunk_size = max(1, budget // self.size)
+        for start in range(0, len(queries), chunk_size):
+            scores = self._dot(slice(0, self.size), queries[start:start + chunk_size].T).T
+            if k < self.size:
+                candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                candidates = np.tile(np.arange(self.size), (len(scores), 1))
+            candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+            order = np.argsort(-candidate_scores, axis=1, kind="stable")
+            rows = np.take_along_axis(candidates, order, axis=1)
+            row_scores = np.take_along_axis(candidate_scores, order, axis=1)
+            results.extend(
+                [(self.row_to_id[row], float(score)) for row, score in zip(query_rows, query_scores)]
+                for query_rows, query_scores in zip(rows.tolist(), row_scores.tolist())
+            )
+        return results
+    
+    def nearest_centroid_rows(self, centroids: np.ndarray, stop: Optional[int] = None,
+                              chunk_size: int = 8192) -> np.ndarray:
+        """Nearest-centroid assignment for rows [0, stop) in bounded-memory chunks"""
+        stop = self.size if stop is None else stop
+        assignments = np.empty(stop, dtype=np.int64)
+        for start in range(0, stop, chunk_size):
+            end = min(start + chunk_size, stop)
+            assignments[start:end] = np.argmax(self.dense(slice(start, end)) @ centroids.T, axis=1)
+        return assignments
+    
+    def resident_row_bytes(self) -> int:
+        """RAM one row's vector storage and prefix norms take (memory-mapped arrays count 0)"""
+        storage = sum(
+            array.dtype.itemsize * int(np.prod(array.shape[1:], dtype=np.int64))
+            for array in self._storage().values() if array is not None and not isinstance(array, np.memmap)
+        )
+        return storage + 4 * len(self.prefix_norms)
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        """Bytes held by the vector storage (allocated capacity, not just populated rows)"""
+        vectors = self.matrix.nbytes if self.matrix is not None else 0
+        prefix_norms = sum(norms.nbytes for norms in self.prefix_norms.values())
+        return {"vectors": vectors, "prefix_norms": prefix_norms, "total": vectors + prefix_norms}
+    
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest scores in descending order via argpartition"""
+        n = scores.shape[0]
+        if k <= 0 or n == 0:
+            return np.zeros(0, dtype=np.int64)
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+    
+    @staticmethod
+    def nearest_centroids(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Nearest-centroid assignment of normalized rows in bounded-memory chunks"""
+        assignments = np.empty(vectors.shape[0], dtype=np.int64)
+        for start in range(0, vectors.shape[0], chunk_size):
+            chunk = vectors[start:start + chunk_size]
+            assignments[start:start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+        return assignments
+    
+    @staticmethod
+    def normalize(embedding: np.ndarray) -> np.ndarray:
+        """Return a float32 unit vector (zero vectors are left as zeros)"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def _dot(self, rows, query: np.ndarray, resolution: Optional[int] = None) -> np.ndarray:
+        """Raw dot products of stored rows with a (prefix) query vector"""
+        block = self.matrix[rows] if resolution is None else self.matrix[rows, :resolution]
+        return block @ query
+    
+    def _capacity(self) -> int:
+        return self.matrix.shape[0] if self.matrix is not None else self.initial_capacity
+    
+    def _allocate(self, capacity: int, dimension: int):
+        self.matrix = np.zeros((capacity, dimension), dtype=np.float32)
+    
+    def _copy_rows(self, old_storage: Dict[str, np.ndarray]):
+        self.matrix[:self.size] = old_storage["matrix"][:self.size]
+    
+    def _storage(self) -> Dict[str, np.ndarray]:
+        return {"matrix": self.matrix}
+    
+    def _write_rows(self, rows, vectors: np.ndarray):
+        """Store normalized vectors and refresh their registered prefix norms"""
+        self.matrix[rows] = vectors
+        self._write_prefix_norms(rows, vectors)
+    
+    def _write_prefix_norms(self, rows, vectors: np.ndarray):
+        for resolution, norms in self.prefix_norms.items():
+            norms[rows] = np.linalg.norm(vectors[..., :resolution], axis=-1)
+    
+    def _ensure_capacity(self, required: int, dimension: int):
+        """Grow the storage geometrically so appends stay amortized O(d)"""
+        if self._storage_empty():
+            if self.dimension is not None and dimension != self.dimension:
+                raise ValueError(f"Embedding dimension {dimension} does not match index dimension {self.dimension}")
+            self.dimension = dimension
+            capacity = max(self.initial_capacity, required)
+            self._allocate(capacity, dimension)
+            self.prefix_norms = {
+                resolution: np.ones(capacity, dtype=np.float32)
+                for resolution in self.prefix_norms if resolution < dimension
+            }
+            return
+        
+        if dimension != self.dimension:
+            raise ValueError(f"Embedding dimension {dimension} does not match index dimension {self.dimension}")
+        
+        capacity = self._capacity()
+        if required <= capacity:
+            return
+        
+        while capacity < required:
+            capacity *= 2
+        if self.grow_storage is not None:
+            for name, array in self.grow_storage(capacity).items():
+                setattr(self, name, array)
+        else:
+            old_storage = self._storage()
+            self._allocate(capacity, self.dimension)
+            self._copy_rows(old_storage)
+        for resolution, norms in self.prefix_norms.items():
+            grown_norms = np.ones(capacity, dtype=np.float32)
+            grown_norms[:self.size] = norms[:self.size]
+            self.prefix_norms[resolution] = grown_norms
+    
+    def _storage_empty(self) -> bool:
+        return all(array is None for array in self._storage().values())
+
+
+class Int8VectorIndex(HoardVectorIndex):
+    """
+    Compressed variant of the vector index
+    Each unit vector is stored as int8 codes with one float32 scale (x ~= code * scale),
+    about 4x smaller than float32 rows. Queries stay in float32 (asymmetric distance),
+    so scores are approximate and callers should re-rank the top candidates exactly.
+    The float32 unit vectors for that re-rank are kept off-heap: in a memory-mapped
+    spill file (under spill_dir), or in the store's file when attached to a HoardStore.
+    """
+    
+    quantized = True
+    
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 1024,
+                 resolutions: Optional[List[int]] = None, scan_chunk_size: int = 2048,
+                 spill_dir: Optional[str] = None):
+        self.codes: Optional[np.ndarray] = None
+        self.scales: Optional[np.ndarray] = None
+        self.originals: Optional[np.ndarray] = None  # None for stores written without them
+        self.scan_chunk_size = scan_chunk_size
+        self.spill_dir = spill_dir
+        super().__init__(dimension, initial_capacity, resolutions)
+    
+    def dense(self, rows) -> np.ndarray:
+        return self.codes[rows].astype(np.float32) * self.scales[rows, None]
+    
+    def exact(self, rows) -> Optional[np.ndarray]:
+        return np.array(self.originals[rows]) if self.originals is not None else None
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        """Resident bytes; the file-backed originals are reported apart and not in the total"""
+        vectors = (self.codes.nbytes + self.scales.nbytes) if self.codes is not None else 0
+        prefix_norms = sum(norms.nbytes for norms in self.prefix_norms.values())
+        originals = self.originals.nbytes if self.originals is not None else 0
+        return {"vectors": vectors, "prefix_norms": prefix_norms, "originals_mapped": originals,
+                "total": vectors + prefix_norms}
+    
+    def _dot(self, rows, query: np.ndarray, resolution: Optional[int] = None) -> np.ndarray:
+        width = resolution or self.dimension
+        # A (d, m) query matrix scores m queries at once
+        scale_shape = (-1,) + (1,) * (query.ndim - 1)
+        if not isinstance(rows, slice):
+            return (self.codes[rows, :width].astype(np.float32) @ query) * self.scales[rows].reshape(scale_shape)
+        
+        # Dequantize in chunks so a full scan never materializes the float matrix
+        start, stop = rows.start or 0, rows.stop
+        scores = np.empty((stop - start,) + query.shape[1:], dtype=np.float32)
+        for chunk_start in range(start, stop, self.scan_chunk_size):
+            chunk_stop = min(chunk_start + self.scan_chunk_size, stop)
+            codes = self.codes[chunk_start:chunk_stop, :width].astype(np.float32)
+            scales = self.scales[chunk_start:chunk_stop].reshape(scale_shape)
+            scores[chunk_start - start:chunk_stop - start] = (codes @ query) * scales
+        return scores
+    
+    def _capacity(self) -> int:
+        return self.codes.shape[0] if self.codes is not None else self.initial_capacity
+    
+    def _allocate(self, capacity: int, dimension: int):
+        self.codes = np.zeros((capacity, dimension), dtype=np.int8)
+        self.scales = np.zeros(capacity, dtype=np.float32)
+        self.originals = self._spill(capacity, dimension)
+    
+    def _spill(self, capacity: int, dimension: int) -> np.ndarray:
+        """Zero-filled float32 rows mapped from an unlinked temporary file"""
+        with tempfile.TemporaryFile(dir=self.spill_dir) as spill:
+            spill.truncate(capacity * dimension * np.dtype(np.float32).itemsize)
+            # The mapping keeps its own descriptor, so the file lives as long as the array
+            return np.memmap(spill, dtype=np.float32, mode="r+", shape=(capacity, dimension))
+    
+    def _copy_rows(self, old_storage: Dict[str, np.ndarray]):
+        self.codes[:self.size] = old_storage["codes"][:self.size]
+        self.scales[:self.size] = old_storage["scales"][:self.size]
+        if "originals" in old_storage:
+            self.originals[:self.size] = old_storage["originals"][:self.size]
+        else:
+            self.originals = None
+    
+    def _storage(self) -> Dict[str, np.ndarray]:
+        storage = {"codes": self.codes, "scales": self.scales}
+        if self.originals is not None:
+            storage["originals"] = self.originals
+        return storage
+    
+    def _write_rows(self, rows, vectors: np.ndarray):
+        peak = np.max(np.abs(vectors), axis=-1)
+        scales = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+        self.codes[rows] = np.clip(np.rint(vectors / scales[..., None]), -127, 127).astype(np.int8)
+        self.scales[rows] = scales
+        if self.originals is not None:
+            self.originals[rows] = vectors
+        self._write_prefix_norms(rows, self.dense(rows))
+
+
+VECTOR_INDEX_TYPES = {
+    "float32": HoardVectorIndex,
+    "int8": Int8VectorIndex
+}
+
+
+class RetrievalBackend(ABC):
+    """Abstract base class for pluggable Hoard retrieval backends"""
+    
+    name = "base"
+    
+    def __init__(self, index: HoardVectorIndex, hoard: Optional["TheHoard"] = None):
+        self.index = index
+        self.hoard = hoard
+        self.stats = {"queries": 0, "nodes_scored": 0, "last_nodes_scored": 0}
+        self._uncounted = threading.local()
+    
+    @abstractmethod
+    def search(self, query_embedding: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Return up to k (node_id, similarity) pairs, best first"""
+        pass
+    
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[List[Tuple[str, float]]]:
+        """search() for each row of a query matrix; backends with a batched scan override this"""
+        return [self.search(query_embedding, k) for query_embedding in query_embeddings]
+    
+    def add(self, node_id: str, row: int):
+        """Hook called after a node has been written to the vector index"""
+        pass
+    
+    def add_batch(self, node_ids: List[str], rows: np.ndarray):
+        """Hook called after a batch of nodes has been written to the vector index"""
+        for node_id, row in zip(node_ids, rows):
+            self.add(node_id, int(row))
+    
+    def build(self, seed_centroids: Optional[List[np.ndarray]] = None):
+        """(Re)build any auxiliary structures from the current index contents"""
+        pass
+    
+    def describe(self) -> Dict[str, Any]:
+        """Backend name and tuning knobs for status reporting"""
+        return {"backend": self.name, **self.stats}
+    
+    @contextmanager
+    def uncounted(self):
+        """Searches made by this thread inside the block (e.g. edge building) skip the query stats"""
+        previous = getattr(self._uncounted, "active", False)
+        self._uncounted.active = True
+        try:
+            yield self
+        finally:
+            self._uncounted.active = previous
+    
+    def _record_scored(self, nodes_scored: int):
+        """Track how many stored vectors a query actually scored"""
+        if getattr(self._uncounted, "active", False):
+            return
+        self.stats["queries"] += 1
+        self.stats["nodes_scored"] += nodes_scored
+        self.stats["last_nodes_scored"] = nodes_scored
+
+
+class ExactBackend(RetrievalBackend):
+    """Brute-force vectorized scan - exact results, always available as fallback"""
+    
+    name = "exact"
+    
+    def search(self, query_embedding: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        self._record_scored(len(self.index))
+        return self.index.search(query_embedding, k)
+    
+    def search_batch(self, query_embeddings: np.ndarray, k: int) -> List[List[Tuple[str, float]]]:
+        for _ in range(len(query_embeddings)):
+            self._record_scored(len(self.index))
+        return self.index.search_batch(query_embeddings, k)
+
+
+class IVFBackend(RetrievalBackend):
+    """
+    Inverted-file approximate nearest-neighbour backend
+    Coarse centroids (seeded from MemoryCluster centroids when available) partition
+    the index rows into inverted lists; queries only score the nprobe closest lists
+    """
+    
+    name = "ivf"
+    
+    def __init__(self, index: HoardVectorIndex, nprobe: int = 8, n_lists: Optional[int] = None,
+                 train_iterations: int = 2, min_index_size: int = 1000, seed: int = 0,
+                 hoard: Optional["TheHoard"] = None):
+        super().__init__(index, hoard)
+        self.nprobe = nprobe
+        self.n_lists = n_lists
+        self.train_iterations = train_iterations
+        self.min_index_size = min_index_size
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[List[int]] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+    
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+    
+    def build(self, seed_centroids: Optional[List[np.ndarray]] = None):
+        """Train coarse centroids and assign every indexed row to an inverted list"""
+        vectors = self.index.vectors()
+        if vectors.shape[0] == 0:
+            self.centroids = None
+            self.lists = []
+            self._list_arrays = {}
+            return
+        
+        if seed_centroids is not None and len(seed_centroids) >= 2:
+            centroids = np.vstack([HoardVectorIndex.normalize(c) for c in seed_centroids])
+        else:
+            n_lists = self.n_lists or max(1, int(np.sqrt(vectors.shape[0])))
+            n_lists = min(n_lists, vectors.shape[0])
+            rng = np.random.default_rng(self.seed)
+            centroids = vectors[rng.choice(vectors.shape[0], n_lists, replace=False)].copy()
+        
+        # A few Lloyd refinement passes over the full matrix
+        for _ in range(self.train_iterations):
+            assignments = HoardVectorIndex.nearest_centroids(vectors, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, vectors)
+            counts = np.bincount(assignments, minlength=centroids.shape[0])
+            populated = counts > 0
+            centroids[populated] = sums[populated]
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids = centroids / np.where(norms > 0, norms, 1.0)
+        
+        self.centroids = centroids.astype(np.float32)
+        assignments = self.index.nearest_centroid_rows(self.centroids)
+        self.lists = [[] for _ in range(self.centroids.shape[0])]
+        for row, list_id in enumerate(assignments):
+            self.lists[list_id].append(row)
+        self._list_arrays = {}
+    
+    def add(self, node_id: str, row: int):
+        if not self.trained:
+            if len(self.index) >= self.min_index_size:
+                self.build()
+            return
+        
+        list_id = int(np.argmax(self.centroids @ self.index.dense(row)))
+        self.lists[list_id].append(row)
+        self._list_arrays.pop(list_id, None)
+    
+    def add_batch(self, node_ids: List[str], rows: np.ndarray):
+        if not self.trained:
+            if len(self.index) >= self.min_index_size:
+                self.build()
+            return
+        
+        assignments = HoardVectorIndex.nearest_centroids(self.index.dense(rows), self.centroids)
+        for row, list_id in zip(rows, assignments):
+            self.lists[list_id].append(int(row))
+            self._list_arrays.pop(int(list_id), None)
+    
+    def search(self, query_embedding: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if not self.trained or len(self.index) < self.min_index_size:
+            self._record_scored(len(self.index))
+            return self.index.search(query_embedding, k)
+        
+        query = HoardVectorIndex.normalize(query_embedding)
+        probe = HoardVectorIndex.top_k(self.centroids @ query, self.nprobe)
+        rows = np.concatenate([self._rows_for_list(int(list_id)) for list_id in probe])
+        self._record_scored(rows.shape[0])
+        if rows.shape[0] == 0:
+            return []
+        
+        scores = self.index.similarities(query, rows=rows)
+        best = HoardVectorIndex.top_k(scores, k)
+        return [(self.index.row_to_id[rows[i]], float(scores[i])) for i in best]
+    
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "nprobe": self.nprobe,
+            "n_lists": len(self.lists),
+            "trained": self.trained,
+            **self.stats
+        }
+    
+    def _rows_for_list(self, list_id: int) -> np.ndarray:
+        rows = self._list_arrays.get(list_id)
+        if rows is None:
+            rows = np.asarray(self.lists[list_id], dtype=np.int64)
+            self._list_arrays[list_id] = rows
+        return rows
+
+
+class ClusterPrunedBackend(RetrievalBackend):
+    """
+    Coarse-to-fine retrieval over The Hoard's own MemoryClusters
+    Stage one ranks cluster centroids against the query and keeps the top n_clusters;
+    stage two scores only the member nodes of those clusters
+    """
+    
+    name = "cluster_pruned"
+    
+    def __init__(self, index: HoardVectorIndex, n_clusters: int = 8, hoard: Optional["TheHoard"] = None):
+        super().__init__(index, hoard)
+        self.n_clusters = n_clusters
+        self._member_rows: Dict[str, Tuple[int, np.ndarray]] = {}
+    
+    def search(self, query_embedding: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if self.hoard is None or len(self.hoard.centroid_index) == 0:
+            self._record_scored(len(self.index))
+            return self.index.search(query_embedding, k)
+        
+        query = HoardVectorIndex.normalize(query_embedding)
+        top_clusters = self.hoard.centroid_index.search(query, self.n_clusters)
+        rows = np.concatenate(
+            [self._rows_for_cluster(cluster_id) for cluster_id, _ in top_clusters] or [np.zeros(0, dtype=np.int64)]
+        )
+        self._record_scored(rows.shape[0])
+        if rows.shape[0] == 0:
+            return []
+        
+        scores = self.index.similarities(query, rows=rows)
+        best = HoardVectorIndex.top_k(scores, k)
+        return [(self.index.row_to_id[rows[i]], float(scores[i])) for i in best]
+    
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "n_clusters": self.n_clusters, **self.stats}
+    
+    def _rows_for_cluster(self, cluster_id: str) -> np.ndarray:
+        """Index rows of a cluster's members, extended incrementally as the cluster grows"""
+        cluster = self.hoard.clusters.get(cluster_id)
+        if cluster is None:
+            return np.zeros(0, dtype=np.int64)
+        
+        cached_count, rows = self._member_rows.get(cluster_id, (0, np.zeros(0, dtype=np.int64)))
+        if cached_count < len(cluster.nodes):
+            id_to_row = self.index.id_to_row
+            new_rows = [id_to_row[node_id] for node_id in cluster.nodes[cached_count:] if node_id in id_to_row]
+            rows = np.concatenate([rows, np.asarray(new_rows, dtype=np.int64)])
+            
+            # Drop entries for clusters replaced by a re-clustering pass
+            if len(self._member_rows) > 2 * len(self.hoard.clusters):
+                self._member_rows = {cid: v for cid, v in self._member_rows.items() if cid in self.hoard.clusters}
+            self._member_rows[cluster_id] = (len(cluster.nodes), rows)
+        return rows
+
+
+class MRLCascadeBackend(RetrievalBackend):
+    """
+    Matryoshka multi-resolution cascade
+    The first (low-dimensional) stage scans the whole corpus; each later stage
+    re-ranks the survivors at a higher resolution; the final top-k is scored
+    at full dimension
+    """
+    
+    name = "mrl_cascade"
+    
+    def __init__(self, index: HoardVectorIndex, stages: Optional[List[Tuple[int, int]]] = None,
+                 hoard: Optional["TheHoard"] = None):
+        super().__init__(index, hoard)
+        # (resolution, candidates kept) per stage
+        self.stages = [tuple(stage) for stage in (stages or [(64, 4096), (256, 256)])]
+    
+    def build(self, seed_centroids: Optional[List[np.ndarray]] = None):
+        for resolution, _ in self.stages:
+            self.index.add_resolution(resolution)
+    
+    def search(self, query_embedding: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if len(self.index) == 0:
+            return []
+        
+        first_resolution, first_keep = self.stages[0]
+        scores = self.index.similarities(query_embedding, first_resolution)
+        rows = self.index.top_k(scores, max(first_keep, k))
+        nodes_scored = len(self.index)
+        
+        for resolution, keep in self.stages[1:]:
+            scores = self.index.similarities(query_embedding, resolution, rows)
+            rows = rows[self.index.top_k(scores, max(keep, k))]
+            nodes_scored += len(scores)
+        
+        scores = self.index.similarities(query_embedding, rows=rows)
+        nodes_scored += len(scores)
+        self._record_scored(nodes_scored)
+        
+        best = self.index.top_k(scores, k)
+        return [(self.index.row_to_id[rows[i]], float(scores[i])) for i in best]
+    
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "stages": [list(stage) for stage in self.stages], **self.stats}
+
+
+RETRIEVAL_BACKENDS = {
+    "exact": ExactBackend,
+    "ivf": IVFBackend,
+    "cluster_pruned": ClusterPrunedBackend,
+    "mrl_cascade": MRLCascadeBackend
+}
+
+
+class KeywordIndex:
+    """
+    KeywordIndex - incremental BM25 inverted index over node content
+    Postings are compact per-term int32 arrays of (document row, term frequency);
+    documents are vector-index rows. Hyphenated or dotted terms such as
+    "Castle-Doctrine" or "UA-1234" are indexed whole as well as by their parts.
+    """
+    
+    token_pattern = re.compile(r"\w+(?:[-_.]\w+)*")
+    
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Tuple[array.array, array.array]] = {}
+        self.doc_lengths = array.array("i")
+        self.total_length = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        tokens = []
+        for term in cls.token_pattern.findall(text.lower()):
+            tokens.append(term)
+            if not term.isalnum():
+                tokens.extend(part for part in re.split(r"[-_.]", term) if part)
+        return tokens
+    
+    def add(self, row: int, text: str):
+        """Index a document under its row"""
+        terms = self.tokenize(text)
+        counts: Dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        
+        with self._lock:
+            if row >= len(self.doc_lengths):
+                self.doc_lengths.extend([0] * (row + 1 - len(self.doc_lengths)))
+            self.doc_lengths[row] = len(terms)
+            self.total_length += len(terms)
+            for term, count in counts.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    postings = self.postings[term] = (array.array("i"), array.array("i"))
+                postings[0].append(row)
+                postings[1].append(count)
+    
+    def add_batch(self, rows, texts: List[str]):
+        for row, text in zip(rows, texts):
+            self.add(int(row), text)
+    
+    def scores(self, query: str) -> np.ndarray:
+        """Dense BM25 scores of every indexed row for the query"""
+        with self._lock:
+            n_docs = len(self.doc_lengths)
+            scores = np.zeros(n_docs, dtype=np.float64)
+            if not n_docs:
+                return scores
+            
+            doc_lengths = np.frombuffer(self.doc_lengths, dtype=np.int32).astype(np.float64)
+            length_norm = self.k1 * (1.0 - self.b + self.b * doc_lengths / max(self.total_length / n_docs, 1e-9))
+            for term in dict.fromkeys(self.tokenize(query)):
+                postings = self.postings.get(term)
+                if postings is None:
+                    continue
+                rows = np.array(postings[0], dtype=np.int64)
+                tf = np.array(postings[1], dtype=np.float64)
+                idf = np.log(1.0 + (n_docs - len(rows) + 0.5) / (len(rows) + 0.5))
+                scores += np.bincount(
+                    rows, weights=idf * tf * (self.k1 + 1.0) / (tf + length_norm[rows]), minlength=n_docs
+                )
+            return scores
+    
+    def search(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """Top-k (row, BM25 score) pairs with a positive score, best first"""
+        scores = self.scores(query)
+        return [(int(row), float(scores[row])) for row in HoardVectorIndex.top_k(scores, k) if scores[row] > 0]
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        postings = sum(rows.itemsize * len(rows) + tf.itemsize * len(tf) for rows, tf in self.postings.values())
+        doc_lengths = self.doc_lengths.itemsize * len(self.doc_lengths)
+        return {"postings": postings, "doc_lengths": doc_lengths, "terms": len(self.postings),
+                "total": postings + doc_lengths}
+
+
+class HoardGraph:
+    """
+    HoardGraph - compressed sparse row adjacency for The Hoard
+    Edges are directed and keyed by vector-index row: CSR arrays hold int32 targets,
+    float32 weights and uint8 edge-type codes. New edges go to a per-source delta
+    buffer that is merged into the CSR once it holds max(merge_threshold, nnz / 8)
+    edges, keeping merges amortized O(1) per edge; removed CSR entries are masked
+    until the next merge drops them.
+    """
+    
+    def __init__(self, merge_threshold: int = 4096, edge_types: Optional[List[str]] = None):
+        self.merge_threshold = max(1, merge_threshold)
+        self.edge_types: List[str] = list(edge_types or ["semantic_similarity"])
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float32)
+        self.types = np.zeros(0, dtype=np.uint8)
+        self.alive = np.zeros(0, dtype=bool)
+        self._delta: Dict[int, List[Tuple[int, float, int]]] = defaultdict(list)
+        self._delta_size = 0
+        self._dead = 0
+    
+    @classmethod
+    def from_edges(cls, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray,
+                   types: Optional[np.ndarray] = None, edge_types: Optional[List[str]] = None,
+                   merge_threshold: int = 4096) -> "HoardGraph":
+        """Build the CSR from COO edge arrays, keeping per-source insertion order"""
+        graph = cls(merge_threshold, edge_types)
+        graph._load_coo(sources, targets, weights, types)
+        return graph
+    
+    def __len__(self) -> int:
+        return len(self.indices) - self._dead + self._delta_size
+    
+    def add_edge(self, source: int, target: int, weight: float, edge_type: str = "semantic_similarity"):
+        self._delta[source].append((target, weight, self._type_code(edge_type)))
+        self._delta_size += 1
+        if self._delta_size >= max(self.merge_threshold, len(self.indices) // 8):
+            self.merge()
+    
+    def remove_edge(self, source: int, target: int) -> bool:
+        """Remove the source -> target edge, returning whether it existed"""
+        pending = self._delta.get(source)
+        if pending:
+            for i, (pending_target, _, _) in enumerate(pending):
+                if pending_target == target:
+                    del pending[i]
+                    self._delta_size -= 1
+                    return True
+        
+        start, stop = self._csr_bounds(source)
+        hits = np.flatnonzero((self.indices[start:stop] == target) & self.alive[start:stop])
+        if not len(hits):
+            return False
+        self.alive[start + hits[0]] = False
+        self._dead += 1
+        return True
+    
+    def neighbors(self, source: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(targets, weights, type codes) of a row's outgoing edges"""
+        start, stop = self._csr_bounds(source)
+        live = self.alive[start:stop]
+        targets = self.indices[start:stop][live]
+        weights = self.weights[start:stop][live]
+        types = self.types[start:stop][live]
+        
+        pending = self._delta.get(source)
+        if pending:
+            delta_targets, delta_weights, delta_types = zip(*pending)
+            targets = np.concatenate((targets, np.asarray(delta_targets, dtype=np.int32)))
+            weights = np.concatenate((weights, np.asarray(delta_weights, dtype=np.float32)))
+            types = np.concatenate((types, np.asarray(delta_types, dtype=np.uint8)))
+        return targets, weights, types
+    
+    def expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Outgoing edges of a whole frontier in one gather
+        Returns (frontier positions, targets, weights), grouped by frontier position in
+        frontier order with each source's edges in insertion order.
+        """
+        frontier = np.asarray(frontier, dtype=np.int64)
+        in_csr = frontier + 1 < len(self.indptr)
+        starts = np.where(in_csr, self.indptr[np.minimum(frontier, len(self.indptr) - 1)], 0)
+        counts = np.where(in_csr, self.indptr[np.minimum(frontier + 1, len(self.indptr) - 1)] - starts, 0)
+        
+        total = int(counts.sum())
+        edge_offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        live = self.alive[edge_offsets]
+        positions = np.repeat(np.arange(len(frontier)), counts)[live]
+        targets = self.indices[edge_offsets][live]
+        weights = self.weights[edge_offsets][live]
+        
+        if self._delta_size:
+            pending = [
+                (position, target, weight)
+                for position, source in enumerate(frontier.tolist())
+                for target, weight, _ in self._delta.get(source, ())
+            ]
+            if pending:
+                delta_positions, delta_targets, delta_weights = zip(*pending)
+                order = np.argsort(np.concatenate((positions, delta_positions)), kind="stable")
+                positions = np.concatenate((positions, delta_positions))[order]
+                targets = np.concatenate((targets, np.asarray(delta_targets, dtype=np.int32)))[order]
+                weights = np.concatenate((weights, np.asarray(delta_weights, dtype=np.float32)))[order]
+        return positions, targets, weights
+    
+    def breadth_first(self, seeds: np.ndarray, n_rows: int, max_depth: int = 2,
+                      limit: Optional[int] = None) -> np.ndarray:
+        """Frontier-at-a-time BFS from the seed rows; rows in visit order up to max_depth hops"""
+        visited = np.zeros(n_rows, dtype=bool)
+        _, first = np.unique(seeds, return_index=True)
+        frontier = np.asarray(seeds, dtype=np.int64)[np.sort(first)]
+        visited[frontier] = True
+        levels = [frontier]
+        reached = len(frontier)
+        
+        for _ in range(max_depth):
+            if limit is not None and reached >= limit:
+                break
+            _, targets, _ = self.expand(frontier)
+            targets = targets[~visited[targets]]
+            _, first = np.unique(targets, return_index=True)
+            frontier = targets[np.sort(first)].astype(np.int64)
+            if not len(frontier):
+                break
+            visited[frontier] = True
+            levels.append(frontier)
+            reached += len(frontier)
+        
+        rows = np.concatenate(levels)
+        return rows if limit is None else rows[:limit]
+    
+    def breadth_first_batch(self, seed_lists: List[np.ndarray], n_rows: int, max_depth: int = 2,
+                            limit: Optional[int] = None) -> List[np.ndarray]:
+        """
+        breadth_first for many seed sets, expanding all their frontiers in one gather per hop
+        (query, row) pairs are tracked as query * n_rows + row keys, so each query keeps
+        its own visited set and visit order.
+        """
+        n_queries = len(seed_lists)
+        keys = []
+        for query, seeds in enumerate(seed_lists):
+            _, first = np.unique(seeds, return_index=True)
+            keys.append(query * n_rows + np.asarray(seeds, dtype=np.int64)[np.sort(first)])
+        frontier = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        visited = np.sort(frontier)
+        levels: List[List[np.ndarray]] = [[level - query * n_rows] for query, level in enumerate(keys)]
+        reached = np.bincount(frontier // n_rows, minlength=n_queries)
+        
+        for _ in range(max_depth):
+            if limit is not None:
+                frontier = frontier[reached[frontier // n_rows] < limit]
+            if not len(frontier):
+                break
+            
+            labels = frontier // n_rows
+            positions, targets, _ = self.expand(frontier % n_rows)
+            candidates = labels[positions] * n_rows + targets
+            candidates = candidates[~np.isin(candidates, visited)]
+            _, first = np.unique(candidates, return_index=True)
+            frontier = candidates[np.sort(first)]
+            if not len(frontier):
+                break
+            
+            visited = np.union1d(visited, frontier)
+            labels = frontier // n_rows
+            reached += np.bincount(labels, minlength=n_queries)
+            # Frontier stays grouped by query because expand keeps frontier order
+            bounds = np.searchsorted(labels, np.arange(n_queries + 1))
+            for query in np.flatnonzero(np.diff(bounds)).tolist():
+                levels[query].append(frontier[bounds[query]:bounds[query + 1]] - query * n_rows)
+        
+        rows = [np.concatenate(query_levels) for query_levels in levels]
+        return rows if limit is None else [query_rows[:limit] for query_rows in rows]
+    
+    def personalized_pagerank(self, seeds: np.ndarray, seed_weights: Optional[np.ndarray] = None,
+                              damping: float = 0.85, max_hops: int = 3,
+                              tolerance: float = 1e-6) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Personalized PageRank from the seed rows, truncated at max_hops
+        Mass flows along edges in proportion to their weights; only rows reachable
+        within max_hops are touched. Returns (rows, scores) with scores descending.
+        """
+        frontier = np.asarray(seeds, dtype=np.int64)
+        mass = np.ones(len(frontier)) if seed_weights is None else np.asarray(seed_weights, dtype=np.float64)
+        frontier, inverse = np.unique(frontier, return_inverse=True)
+        mass = np.bincount(inverse, weights=mass / mass.sum())
+        
+        visited_rows, visited_scores = [], []
+        for hop in range(max_hops + 1):
+            visited_rows.append(frontier)
+            visited_scores.append((1.0 - damping) * mass)
+            if hop == max_hops:
+                break
+            
+            positions, targets, weights = self.expand(frontier)
+            if not len(targets):
+                break
+            out_weight = np.bincount(positions, weights=weights, minlength=len(frontier))
+            flow = damping * mass[positions] * weights / out_weight[positions]
+            frontier, inverse = np.unique(targets, return_inverse=True)
+            mass = np.bincount(inverse, weights=flow)
+            
+            significant = mass > tolerance
+            frontier, mass = frontier[significant].astype(np.int64), mass[significant]
+            if not len(frontier):
+                break
+        
+        rows, inverse = np.unique(np.concatenate(visited_rows), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(visited_scores))
+        order = np.argsort(-scores, kind="stable")
+        return rows[order], scores[order]
+    
+    def degree(self, source: int) -> int:
+        start, stop = self._csr_bounds(source)
+        return int(np.count_nonzero(self.alive[start:stop])) + len(self._delta.get(source, ()))
+    
+    def edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """All live edges as COO (sources, targets, weights, type codes), CSR entries before delta"""
+        sources = np.repeat(np.arange(len(self.indptr) - 1, dtype=np.int32), np.diff(self.indptr))
+        parts = [(sources[self.alive], self.indices[self.alive], self.weights[self.alive], self.types[self.alive])]
+        
+        if self._delta_size:
+            delta = [(source, *edge) for source, edges in self._delta.items() for edge in edges]
+            delta_sources, delta_targets, delta_weights, delta_types = zip(*delta)
+            parts.append((
+                np.asarray(delta_sources, dtype=np.int32), np.asarray(delta_targets, dtype=np.int32),
+                np.asarray(delta_weights, dtype=np.float32), np.asarray(delta_types, dtype=np.uint8)
+            ))
+        return tuple(np.concatenate(columns) for columns in zip(*parts))
+    
+    def merge(self):
+        """Fold the delta buffer into the CSR arrays and drop removed entries"""
+        if not self._delta_size and not self._dead:
+            return
+        self._load_coo(*self.edge_arrays())
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        csr = sum(array.nbytes for array in (self.indptr, self.indices, self.weights, self.types, self.alive))
+        return {"csr": csr, "delta_edges": self._delta_size, "total": csr}
+    
+    def _load_coo(self, sources, targets, weights, types=None):
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+        counts = np.bincount(sources, minlength=0) if len(sources) else np.zeros(0, dtype=np.int64)
+        
+        self.indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.indices = np.asarray(targets, dtype=np.int32)[order]
+        self.weights = np.asarray(weights, dtype=np.float32)[order]
+        self.types = (np.zeros(len(order), dtype=np.uint8) if types is None
+                      else np.asarray(types, dtype=np.uint8)[order])
+        self.alive = np.ones(len(order), dtype=bool)
+        self._delta = defaultdict(list)
+        self._delta_size = 0
+        self._dead = 0
+    
+    def _csr_bounds(self, source: int) -> Tuple[int, int]:
+        if source + 1 >= len(self.indptr):
+            return 0, 0
+        return int(self.indptr[source]), int(self.indptr[source + 1])
+    
+    def _type_code(self, edge_type: str) -> int:
+        if edge_type not in self.edge_types:
+            self.edge_types.append(edge_type)
+        return self.edge_types.index(edge_type)
+
+
+class HoardStore:
+    """
+    HoardStore - on-disk format for The Hoard
+    A directory of append-only files: one raw file per vector storage array (float32 rows,
+    or int8 codes, scales and float32 originals), fixed-width node ids, a JSON-lines node
+    file with a row -> byte offset index, and binary edge records. Opening only
+    memory-maps the files; nodes and edges are decoded on first access. Vector rows are written at their row
+    offset, so an attached index can grow by extending and remapping the file
+    (map_vectors). Writes are fsynced every sync_interval nodes before the manifest is
+    replaced, so a crash loses at most the unsynced tail.
+    """
+    
+    FORMAT_VERSION = 1
+    EDGE_DTYPE = np.dtype([
+        ("source", np.int32), ("target", np.int32), ("weight", np.float32),
+        ("type", np.uint8), ("removed", np.uint8)
+    ])
+    
+    def __init__(self, path: str, sync_interval: int = 1024, id_width: int = 36):
+        self.path = path
+        self.sync_interval = max(1, sync_interval)
+        self.id_width = id_width
+        self.manifest: Dict[str, Any] = {}
+        self.node_count = 0
+        self.edge_count = 0
+        self.edge_types: List[str] = []
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._appended_ids: List[str] = []
+        self._ids: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+        self._edges: Optional[np.ndarray] = None
+        self._appended_offsets: List[int] = []
+        self._nodes_bytes = 0
+        self._handles: Dict[str, Any] = {}
+        self._reader = None
+        self._pending = 0
+        self._lock = threading.RLock()
+    
+    @property
+    def storage(self) -> str:
+        return self.manifest["storage"]
+    
+    @property
+    def dimension(self) -> int:
+        return self.manifest["dimension"]
+    
+    def open(self, dimension: Optional[int] = None, storage: str = "float32",
+             embedding_provider: Optional[Dict[str, Any]] = None) -> "HoardStore":
+        """Open the store, creating it for the given layout if the directory is new"""
+        os.makedirs(self.path, exist_ok=True)
+        manifest_path = self._file("manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("format_version") != self.FORMAT_VERSION:
+                raise ValueError(f"Unsupported Hoard store format: {manifest.get('format_version')}")
+        else:
+            if dimension is None:
+                raise ValueError("A dimension is required to create a new Hoard store")
+            layout = VECTOR_INDEX_TYPES[storage](dimension, initial_capacity=1)._storage()
+            manifest = {
+                "format_version": self.FORMAT_VERSION,
+                "dimension": dimension,
+                "storage": storage,
+                "arrays": {name: {"dtype": array.dtype.str, "row_shape": list(array.shape[1:])}
+                           for name, array in layout.items()},
+                "id_width": self.id_width,
+                "embedding_provider": embedding_provider or {},
+                "edge_types": [],
+                "nodes": 0,
+                "edges": 0,
+                "nodes_bytes": 0
+            }
+        
+        with self._lock:
+            self.manifest = manifest
+            self.id_width = manifest["id_width"]
+            self.node_count = manifest["nodes"]
+            self.edge_count = manifest["edges"]
+            self.edge_types = list(manifest["edge_types"])
+            self._nodes_bytes = manifest["nodes_bytes"]
+            self._appended_offsets = []
+            self._appended_ids = []
+            self._pending = 0
+            
+            # Drop any tail written after the last manifest update (e.g. a crash before fsync)
+            expected_sizes = {
+                "ids.bin": self.node_count * self.id_width,
+                "nodes.idx": self.node_count * 8,
+                "nodes.jsonl": self._nodes_bytes,
+                "edges.bin": self.edge_count * self.EDGE_DTYPE.itemsize
+            }
+            for name, spec in manifest["arrays"].items():
+                row_bytes = np.dtype(spec["dtype"]).itemsize * int(np.prod(spec["row_shape"], dtype=np.int64))
+                expected_sizes[f"vectors.{name}.bin"] = self.node_count * row_bytes
+            for filename, size in expected_sizes.items():
+                self._truncate(filename, size)
+            
+            self._arrays = {
+                name: self._map(f"vectors.{name}.bin", np.dtype(spec["dtype"]),
+                                (self.node_count, *spec["row_shape"]))
+                for name, spec in manifest["arrays"].items()
+            }
+            self._ids = self._map("ids.bin", np.dtype(f"S{self.id_width}"), (self.node_count,))
+            self._offsets = self._map("nodes.idx", np.dtype(np.uint64), (self.node_count,))
+            self._edges = self._map("edges.bin", self.EDGE_DTYPE, (self.edge_count,))
+            
+            # Vector files are written by row offset (they may be grown ahead by map_vectors)
+            self._handles = {
+                filename: open(self._file(filename), "r+b" if filename.startswith("vectors.") else "ab")
+                for filename in expected_sizes
+            }
+            self._reader = open(self._file("nodes.jsonl"), "rb")
+            self._write_manifest()
+        return self
     
-    def _assess_contextual_relevance(self, query: str, context: Dict) -> float:
-        return 0.8
+    def node_ids(self) -> List[str]:
+        """Stored node ids in row order (decoded into a new list on each call)"""
+        return [node_id.decode() for node_id in self._ids.tolist()] + self._appended_ids
     
-    def _integrate_background(self, context: Dict) -> Dict:
-        return {}
+    def vector_arrays(self) -> Dict[str, np.ndarray]:
+        """Memory-mapped vector storage arrays for the rows present at open"""
+        return self._arrays
     
-    def _assess_situation(self, query: str, context: Dict) -> Dict:
-        return {}
+    def map_vectors(self, capacity: int) -> Dict[str, np.ndarray]:
+        """
+        Writable maps of the vector files with room for capacity rows
+        Files are extended (zero-filled) rather than copied; rows past node_count only
+        become part of the store once append_nodes has published them.
+        """
+        with self._lock:
+            arrays = {}
+            for name, spec in self.manifest["arrays"].items():
+                filename = f"vectors.{name}.bin"
+                dtype = np.dtype(spec["dtype"])
+                row_bytes = dtype.itemsize * int(np.prod(spec["row_shape"], dtype=np.int64))
+                self._handles[filename].flush()
+                if os.path.getsize(self._file(filename)) < capacity * row_bytes:
+                    os.truncate(self._file(filename), capacity * row_bytes)
+                arrays[name] = np.memmap(self._file(filename), dtype=dtype, mode="r+",
+                                         shape=(capacity, *spec["row_shape"]))
+            self._arrays = arrays
+            return arrays
+    
+    def load_graph(self, merge_threshold: int = 4096) -> HoardGraph:
+        """Replay the edge log (dropping tombstoned edges) into a CSR graph"""
+        records = self._edges
+        keys = (records["source"].astype(np.int64) << 32) | records["target"].astype(np.int64)
+        removed = records["removed"] == 1
+        live = ~removed & ~np.isin(keys, keys[removed])
+        return HoardGraph.from_edges(
+            records["source"][live], records["target"][live], records["weight"][live],
+            records["type"][live], edge_types=self.edge_types, merge_threshold=merge_threshold
+        )
     
-    def _identify_emergent_properties(self, y789_result: Dict, nexus_result: Dict) -> List[Dict]:
-        return []
+    def append_nodes(self, nodes: List[KnowledgeNode], arrays: Dict[str, np.ndarray]):
+        """Append nodes with their vector storage rows (as produced by HoardVectorIndex.row_arrays)"""
+        encoded_ids = [node.id.encode() for node in nodes]
+        if any(len(node_id) > self.id_width for node_id in encoded_ids):
+            raise ValueError(f"Node ids longer than {self.id_width} bytes cannot be stored")
+        lines = [json.dumps(self._node_record(node), default=str).encode() + b"\n" for node in nodes]
+        offsets = self._nodes_bytes + np.concatenate(([0], np.cumsum([len(line) for line in lines[:-1]])))
+        
+        with self._lock:
+            for name, spec in self.manifest["arrays"].items():
+                handle = self._handles[f"vectors.{name}.bin"]
+                rows = np.ascontiguousarray(arrays[name], dtype=spec["dtype"])
+                handle.seek(self.node_count * (rows.nbytes // max(1, len(rows))))
+                handle.write(rows.tobytes())
+            self._handles["ids.bin"].write(np.array(encoded_ids, dtype=f"S{self.id_width}").tobytes())
+            self._handles["nodes.idx"].write(offsets.astype(np.uint64).tobytes())
+            self._handles["nodes.jsonl"].write(b"".join(lines))
+            
+            self._appended_ids.extend(node.id for node in nodes)
+            self.node_count += len(nodes)
+            self._appended_offsets.extend(int(offset) for offset in offsets)
+            self._nodes_bytes += sum(len(line) for line in lines)
+            
+            self._pending += len(nodes)
+            if self._pending >= self.sync_interval:
+                self.flush()
+    
+    def append_edge(self, source: int, target: int, weight: float,
+                    edge_type: str = "semantic_similarity", removed: bool = False):
+        """Append one edge record between node rows; removed=True tombstones an earlier edge"""
+        with self._lock:
+            record = np.array(
+                [(source, target, weight, self._edge_type_code(edge_type), int(removed))],
+                dtype=self.EDGE_DTYPE
+            )
+            self._handles["edges.bin"].write(record.tobytes())
+            self.edge_count += 1
+    
+    def append_graph(self, graph: HoardGraph):
+        """Append every live edge of a graph in one block"""
+        sources, targets, weights, types = graph.edge_arrays()
+        records = np.zeros(len(sources), dtype=self.EDGE_DTYPE)
+        records["source"], records["target"], records["weight"] = sources, targets, weights
+        with self._lock:
+            codes = np.array([self._edge_type_code(edge_type) for edge_type in graph.edge_types], dtype=np.uint8)
+            records["type"] = codes[types] if len(records) else types
+            self._handles["edges.bin"].write(records.tobytes())
+            self.edge_count += len(records)
+    
+    def content_bytes(self) -> np.ndarray:
+        """Approximate in-memory size of each stored node record (its JSON line length)"""
+        offsets = np.append(self._offsets.astype(np.int64), self._nodes_bytes)
+        return np.diff(offsets)[:len(self._offsets)]
+    
+    def iter_contents(self, stop: Optional[int] = None):
+        """Stream (row, content) for rows [0, stop) without building nodes"""
+        with self._lock:
+            self._handles["nodes.jsonl"].flush()
+        with open(self._file("nodes.jsonl"), "rb") as f:
+            for row in range(self.node_count if stop is None else stop):
+                yield row, json.loads(f.readline())["content"]
+    
+    def load_node(self, row: int) -> KnowledgeNode:
+        """Decode one node record (without embeddings) from the JSON-lines file"""
+        with self._lock:
+            if self._reader is None:
+                raise ValueError(f"Hoard store at {self.path} is closed")
+            if row < len(self._offsets):
+                offset = int(self._offsets[row])
+            else:
+                offset = self._appended_offsets[row - len(self._offsets)]
+                self._handles["nodes.jsonl"].flush()
+            self._reader.seek(offset)
+            record = json.loads(self._reader.readline())
+        
+        return KnowledgeNode(
+            id=record["id"],
+            content=record["content"],
+            metadata=record["metadata"],
+            protocol_associations=record["protocol_associations"],
+            confidence_score=record["confidence_score"],
+            created_at=datetime.fromisoformat(record["created_at"])
+        )
     
-    def _calculate_coherence(self, y789_result: Dict, nexus_result: Dict) -> float:
-        return 0.85
+    def flush(self):
+        """fsync every data file, then atomically publish the new counts in the manifest"""
+        with self._lock:
+            if not self._handles:
+                return
+            for handle in self._handles.values():
+                handle.flush()
+                os.fsync(handle.fileno())
+            for array in self._arrays.values():
+                if isinstance(array, np.memmap) and array.mode == "r+":
+                    array.flush()
+            self._write_manifest()
+            self._pending = 0
+    
+    def close(self):
+        with self._lock:
+            self.flush()
+            for handle in self._handles.values():
+                handle.close()
+            if self._reader is not None:
+                self._reader.close()
+            self._handles = {}
+            self._reader = None
+            self._arrays = {}
+            self._ids = self._offsets = self._edges = None
+    
+    def rewrite(self, nodes: List[KnowledgeNode], arrays: Dict[str, np.ndarray], graph: HoardGraph,
+                dimension: int, storage: str, embedding_provider: Dict[str, Any]):
+        """Replace the whole store with a new snapshot (written aside, then swapped in by rename)"""
+        staging_path = self.path.rstrip(os.sep) + ".rewrite"
+        retired_path = self.path.rstrip(os.sep) + ".retired"
+        for stale_path in (staging_path, retired_path):
+            if os.path.exists(stale_path):
+                shutil.rmtree(stale_path)
+        
+        staging = HoardStore(staging_path, sync_interval=max(1, len(nodes)), id_width=self.id_width)
+        staging.open(dimension, storage, embedding_provider)
+        if nodes:
+            staging.append_nodes(nodes, arrays)
+        staging.append_graph(graph)
+        staging.close()
+        
+        with self._lock:
+            self.close()
+            os.replace(self.path, retired_path)
+            os.replace(staging_path, self.path)
+            shutil.rmtree(retired_path)
+            self.open()
+    
+    def _file(self, filename: str) -> str:
+        return os.path.join(self.path, filename)
+    
+    def _edge_type_code(self, edge_type: str) -> int:
+        if edge_type not in self.edge_types:
+            self.edge_types.append(edge_type)
+        return self.edge_types.index(edge_type)
+    
+    def _truncate(self, filename: str, size: int):
+        path = self._file(filename)
+        if not os.path.exists(path):
+            open(path, "wb").close()
+        actual = os.path.getsize(path)
+        if actual < size:
+            raise ValueError(f"Hoard store file {path} is shorter than its manifest ({actual} < {size} bytes)")
+        if actual > size:
+            os.truncate(path, size)
+    
+    def _map(self, filename: str, dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        if shape[0] == 0:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self._file(filename), dtype=dtype, mode="r", shape=shape)
+    
+    def _write_manifest(self):
+        self.manifest.update({
+            "nodes": self.node_count,
+            "edges": self.edge_count,
+            "nodes_bytes": self._nodes_bytes,
+            "edge_types": self.edge_types
+        })
+        staging = self._file("manifest.json.tmp")
+        with open(staging, "w") as f:
+            json.dump(self.manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(staging, self._file("manifest.json"))
+    
+    @staticmethod
+    def _node_record(node: KnowledgeNode) -> Dict[str, Any]:
+        return {
+            "id": node.id,
+            "content": node.content,
+            "metadata": node.metadata,
+            "protocol_associations": node.protocol_associations,
+            "confidence_score": node.confidence_score,
+            "created_at": node.created_at.isoformat()
+        }
+
+
+class LazyNodeMap(Mapping):
+    """
+    Node table backed by a HoardStore
+    Stored nodes are decoded on first access (embedding from a float index row; behind a
+    quantized index the float originals stay in the mapped file) and stay resident
+    until evicted; nodes not yet written to the store stay resident.
+    Node rows come from the vector index, whose rows match the store's. The store is
+    append-only, so nodes can be added but not deleted.
+    """
     
-    def _calculate_integrated_confidence(self, y789_result: Dict, nexus_result: Dict) -> float:
-        y789_conf = y789_result.get("confidence_level", 0.0)
-        nexus_conf = nexus_result.get("novelty_score", 0.0)
-        return (y789_conf + nexus_conf) / 2.0
+    def __init__(self, store: HoardStore, vector_index: HoardVectorIndex,
+                 resident: Optional[Dict[str, KnowledgeNode]] = None):
+        self.store = store
+        self.vector_index = vector_index
+        self.persisted_count = store.node_count
+        self._resident: Dict[str, KnowledgeNode] = dict(resident or {})
+        self._unpersisted = sum(1 for node_id in self._resident if not self._is_persisted(node_id))
+    
+    def __getitem__(self, node_id: str) -> KnowledgeNode:
+        node = self._resident.get(node_id)
+        if node is None:
+            if not self._is_persisted(node_id):
+                raise KeyError(node_id)
+            row = self.vector_index.id_to_row[node_id]
+            node = self.store.load_node(row)
+            if not self.vector_index.quantized:
+                node.embeddings = np.array(self.vector_index.dense(row), dtype=np.float32)
+            self._resident[node_id] = node
+        return node
+    
+    def __setitem__(self, node_id: str, node: KnowledgeNode):
+        if node_id not in self:
+            self._unpersisted += 1
+        self._resident[node_id] = node
+    
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._resident or self._is_persisted(node_id)
+    
+    def __iter__(self):
+        persisted = self.vector_index.row_to_id[:self.store.node_count]
+        yield from persisted
+        for node_id in list(self._resident):
+            if not self._is_persisted(node_id):
+                yield node_id
+    
+    def __len__(self) -> int:
+        return self.persisted_count + self._unpersisted
+    
+    def resident_values(self):
+        """Nodes currently decoded in memory"""
+        return self._resident.values()
+    
+    def get_resident(self, node_id: str) -> Optional[KnowledgeNode]:
+        """The node if it is decoded in memory, without loading it"""
+        return self._resident.get(node_id)
+    
+    def evict(self, node_id: str) -> bool:
+        """Drop a stored node from memory; it is decoded again on next access"""
+        if not self._is_persisted(node_id):
+            return False
+        return self._resident.pop(node_id, None) is not None
     
-    def _integrate_patterns_logic(self, logical_structure: Dict, patterns: Dict) -> Dict:
-        return {"integrated": True}
+    def _is_persisted(self, node_id: str) -> bool:
+        row = self.vector_index.id_to_row.get(node_id)
+        return row is not None and row < self.store.node_count
+
+
+class TierManager:
+    """
+    TierManager - hot / warm / cold placement for Hoard nodes
+    Tracks per-row access counts and recency and ranks rows by an access score,
+    (1 + accesses) halved every half_life_seconds since the last access. The best rows
+    keep float embeddings in RAM (hot) within hot_budget_bytes, the next ones keep only
+    their node record and score from the vector index (warm) within warm_budget_bytes,
+    and the rest are evicted to the Hoard store (cold).
+    Tiers move node records and float copies only; a row's vector stays in the index as
+    stored (float32 rows, or int8 codes with memory-mapped float originals when the
+    Hoard's vector_storage is "int8"). Its resident bytes are charged to both budgets.
+    """
     
-    def _calculate_rrf_score(self, y789_result: Dict, nexus_result: Dict, k: float) -> float:
-        # Simplified RRF calculation
-        y789_rank = 1.0 / (k + 1)
-        nexus_rank = 1.0 / (k + 2)
-        return y789_rank + nexus_rank
+    HOT, WARM, COLD = 0, 1, 2
+    TIER_NAMES = ("hot", "warm", "cold")
+    RECORD_OVERHEAD_BYTES = 256  # rough per-node object overhead on top of the content
+    
+    def __init__(self, hot_budget_bytes: int = 256 * 1024 * 1024, warm_budget_bytes: int = 512 * 1024 * 1024,
+                 half_life_seconds: float = 86400.0, rebalance_interval: int = 10000):
+        self.hot_budget_bytes = hot_budget_bytes
+        self.warm_budget_bytes = warm_budget_bytes
+        self.half_life_seconds = half_life_seconds
+        self.rebalance_interval = rebalance_interval
+        self.size = 0
+        self.access_counts = np.zeros(1024, dtype=np.float64)
+        self.last_access = np.zeros(1024, dtype=np.float64)
+        self.record_bytes = np.zeros(1024, dtype=np.int64)
+        self.tiers = np.zeros(1024, dtype=np.uint8)
+        self.inserts_since_rebalance = 0
+        self.metrics = {"promotions": 0, "demotions": 0, "evictions": 0, "rebalances": 0}
+    
+    def configure(self, tier_config: Dict[str, Any]):
+        self.hot_budget_bytes = tier_config.get("hot_budget_bytes", self.hot_budget_bytes)
+        self.warm_budget_bytes = tier_config.get("warm_budget_bytes", self.warm_budget_bytes)
+        self.half_life_seconds = tier_config.get("half_life_seconds", self.half_life_seconds)
+        self.rebalance_interval = tier_config.get("rebalance_interval", self.rebalance_interval)
+    
+    def add_rows(self, rows, record_bytes, tier: int = HOT, now: Optional[float] = None):
+        """Start tracking new rows (new nodes are hot; nodes mapped from a store start cold)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return
+        self._ensure_capacity(int(rows.max()) + 1)
+        self.access_counts[rows] = 0.0
+        self.last_access[rows] = time.time() if now is None else now
+        self.record_bytes[rows] = record_bytes
+        self.tiers[rows] = tier
+        self.size = max(self.size, int(rows.max()) + 1)
+        if tier == self.HOT:
+            self.inserts_since_rebalance += len(rows)
+    
+    def record_access(self, rows, now: Optional[float] = None):
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = rows[rows < self.size]
+        np.add.at(self.access_counts, rows, 1.0)
+        self.last_access[rows] = time.time() if now is None else now
+    
+    def access_scores(self, now: Optional[float] = None) -> np.ndarray:
+        now = time.time() if now is None else now
+        age = np.maximum(now - self.last_access[:self.size], 0.0)
+        return (1.0 + self.access_counts[:self.size]) * np.exp2(-age / self.half_life_seconds)
+    
+    def plan(self, embedding_bytes: int, allow_cold: bool, now: Optional[float] = None,
+             index_row_bytes: int = 0) -> np.ndarray:
+        """
+        Target tier per row: fill the hot budget by score, then the warm budget, rest cold
+        Hot rows cost record + float embedding + resident index row, warm rows record +
+        resident index row.
+        """
+        scores = self.access_scores(now)
+        order = np.lexsort((-np.arange(self.size), -scores))  # best score first, newer rows on ties
+        record_bytes = self.record_bytes[:self.size][order] + index_row_bytes
+        
+        hot = np.cumsum(record_bytes + embedding_bytes) <= self.hot_budget_bytes
+        warm_cost = np.where(hot, 0, record_bytes)
+        warm = ~hot & (np.cumsum(warm_cost) <= self.warm_budget_bytes)
+        
+        target = np.full(self.size, self.COLD if allow_cold else self.WARM, dtype=np.uint8)
+        target[order[hot]] = self.HOT
+        target[order[warm]] = self.WARM
+        return target
+    
+    def commit(self, observed: np.ndarray, target: np.ndarray) -> Dict[str, int]:
+        """Record a rebalance from the observed tiers to the target tiers"""
+        moves = {
+            "promotions": int(np.count_nonzero(target < observed)),
+            "demotions": int(np.count_nonzero(target > observed)),
+            "evictions": int(np.count_nonzero((target == self.COLD) & (observed != self.COLD)))
+        }
+        for name, count in moves.items():
+            self.metrics[name] += count
+        self.metrics["rebalances"] += 1
+        self.tiers[:self.size] = target
+        self.inserts_since_rebalance = 0
+        return moves
+    
+    def statistics(self) -> Dict[str, Any]:
+        counts = np.bincount(self.tiers[:self.size], minlength=3)
+        return {
+            **{name: int(count) for name, count in zip(self.TIER_NAMES, counts)},
+            **self.metrics,
+            "hot_budget_bytes": self.hot_budget_bytes,
+            "warm_budget_bytes": self.warm_budget_bytes
+        }
     
-    def _assess_fusion_quality(self, y789_result: Dict, nexus_result: Dict) -> float:
-        return 0.9
-
+    def _ensure_capacity(self, required: int):
+        capacity = len(self.tiers)
+        if required <= capacity:
+            return
+        capacity = max(required, capacity * 2)
+        for name in ("access_counts", "last_access", "record_bytes", "tiers"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:len(old)] = old
+            setattr(self, name, grown)
 
-# ============================================================================
-# THE HOARD - MEMORY SYSTEM
-# ============================================================================
 
 class TheHoard:
     """
@@ -424,141 +3056,768 @@ class TheHoard:
     def __init__(self):
         self.nodes: Dict[str, KnowledgeNode] = {}
         self.clusters: Dict[str, MemoryCluster] = {}
-        self.graph_edges: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.graph = HoardGraph()  # directed edges between vector-index rows
+        self.keyword_index = KeywordIndex()  # BM25 postings keyed by vector-index row
+        self.keyword_search_enabled = True
+        self._keyword_backfill: Optional[int] = None
+        self.tier_manager = TierManager()
+        self.tiering_enabled = True
         self.access_patterns = defaultdict(int)
-        self.embedding_cache = {}
+        self.embedding_provider: EmbeddingProvider = HashingEmbeddingProvider(dimension=768)
+        self.store: Optional[HoardStore] = None
+        self.embedding_cache = BoundedLRUCache(max_entries=100000, max_bytes=256 * 1024 * 1024)
+        self.result_cache = QueryResultCache(max_entries=1024)
+        self.result_cache_enabled = True
+        self.generation = 0  # bumped by every change that can alter retrieval results
+        self.vector_index = HoardVectorIndex()
+        self.centroid_index = HoardVectorIndex(initial_capacity=256)  # rows keyed by cluster id
+        self.retrieval_backend: RetrievalBackend = ExactBackend(self.vector_index)
+        self._retrieval_backend_params: Dict[str, Any] = {}
+        self.rerank_factor = 4  # candidates per result re-scored in float when vectors are quantized
+        self.rank_fusion = RankFusion(k=60.0)
+        self.edge_threshold = 0.7
+        self.max_neighbors_per_node = 16
+        self.graph_search_mode = "bfs"  # bfs | personalized_pagerank
+        self.graph_max_depth = 2
+        self.ppr_damping = 0.85
+        self.clustering_threshold = 0.6
+        self.cluster_recalibration_interval = 10000  # inserts between exact centroid recomputes
+        self._inserts_since_recalibration = 0
+        self.batch_similarity_budget = 2 ** 24  # floats per batch x corpus similarity block
+        self.performance_metrics: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+    
+    def configure(self, memory_config: Dict[str, Any]):
+        """Apply the Phoenix blueprint's memory_system section"""
+        hoard_config = memory_config.get("hoard_config", {})
+        self.edge_threshold = hoard_config.get("edge_threshold", self.edge_threshold)
+        self.max_neighbors_per_node = hoard_config.get("max_neighbors_per_node", self.max_neighbors_per_node)
+        self.clustering_threshold = hoard_config.get("clustering_threshold", self.clustering_threshold)
+        self.cluster_recalibration_interval = hoard_config.get(
+            "cluster_recalibration_interval", self.cluster_recalibration_interval
+        )
+        
+        cache_config = memory_config.get("embedding_cache", {})
+        if cache_config:
+            self.embedding_cache.resize(
+                cache_config.get("max_entries", self.embedding_cache.max_entries),
+                cache_config.get("max_bytes", self.embedding_cache.max_bytes)
+            )
+        
+        provider_config = memory_config.get("embedding_provider", {})
+        if provider_config:
+            provider_name = provider_config.get("type", "hashing")
+            if provider_name not in EMBEDDING_PROVIDERS:
+                raise ValueError(f"Unknown embedding provider: {provider_name}")
+            params = dict(provider_config.get(provider_name, {}))
+            if "embedding_dimensions" in memory_config:
+                params.setdefault("dimension", memory_config["embedding_dimensions"])
+            provider = EMBEDDING_PROVIDERS[provider_name](**params)
+            # The blueprint always carries this section; only a different embedding re-embeds
+            if provider.describe() != self.embedding_provider.describe():
+                self.set_embedding_provider(provider)
+        
+        persistence = memory_config.get("persistence", {})
+        if persistence.get("enabled", False) and self.store is None:
+            self.open_store(persistence["path"], sync_interval=persistence.get("sync_interval", 1024))
+        
+        graph_config = memory_config.get("graph_config", {})
+        self.graph_search_mode = graph_config.get("mode", self.graph_search_mode)
+        self.graph_max_depth = graph_config.get("max_depth", self.graph_max_depth)
+        self.ppr_damping = graph_config.get("damping", self.ppr_damping)
+        if self.graph_search_mode not in ("bfs", "personalized_pagerank"):
+            raise ValueError(f"Unknown graph search mode: {self.graph_search_mode}")
+        
+        keyword_config = memory_config.get("keyword_config", {})
+        self.keyword_search_enabled = keyword_config.get("enabled", self.keyword_search_enabled)
+        self.keyword_index.k1 = keyword_config.get("k1", self.keyword_index.k1)
+        self.keyword_index.b = keyword_config.get("b", self.keyword_index.b)
+        
+        tier_config = memory_config.get("tier_config", {})
+        self.tiering_enabled = tier_config.get("enabled", self.tiering_enabled)
+        self.tier_manager.configure(tier_config)
+        
+        self.rerank_factor = memory_config.get("rerank_factor", self.rerank_factor)
+        self.rank_fusion.configure(memory_config.get("fusion_config", {}))
+        vector_storage = memory_config.get("vector_storage", self._storage_name())
+        if VECTOR_INDEX_TYPES[vector_storage] is not type(self.vector_index):
+            self.set_vector_storage(vector_storage)
+        
+        ann_config = memory_config.get("ann_config", {})
+        if ann_config:
+            backend = ann_config.get("backend", "exact")
+            self.set_retrieval_backend(backend, **ann_config.get(backend, {}))
+        
+        result_cache_config = memory_config.get("result_cache", {})
+        self.result_cache_enabled = result_cache_config.get("enabled", self.result_cache_enabled)
+        self.result_cache.configure(result_cache_config)
+        self.generation += 1
+    
+    def set_embedding_provider(self, provider: EmbeddingProvider) -> EmbeddingProvider:
+        """
+        Swap the embedding provider
+        Existing nodes are re-embedded in one batch, the vector index is rebuilt and
+        clusters are recomputed in the new space. Graph edges are kept as they are.
+        """
+        with self._lock:
+            self.embedding_provider = provider
+            self.embedding_cache.clear()
+            self.result_cache.clear()
+            if self.nodes:
+                self._reembed_nodes(provider)
+            if self.store is not None:
+                self._persist_snapshot()
+        return provider
+    
+    def _reembed_nodes(self, provider: EmbeddingProvider):
+        """Re-embed every node with a new provider and rebuild the index and clusters"""
+        with self._lock:
+            # Keep row order so graph edges stay valid
+            node_ids = list(self.vector_index.row_to_id)
+            quantized = self.vector_index.quantized
+            embeddings = self._generate_embeddings_batch(
+                [self.nodes[node_id].content for node_id in node_ids], cache=not quantized
+            )
+            for node_id, embedding in zip(node_ids, embeddings):
+                self.nodes[node_id].embeddings = None if quantized else embedding
+            
+            old_index = self.vector_index
+            index = type(old_index)(
+                provider.dimension,
+                initial_capacity=max(len(node_ids), 1024),
+                resolutions=[r for r in old_index.prefix_norms if r < provider.dimension]
+            )
+            index.add_batch(node_ids, embeddings)
+            self.vector_index = index
+            
+            n_clusters = len(self.clusters)
+            self.clusters = {}
+            self.centroid_index = HoardVectorIndex(initial_capacity=256)
+            if n_clusters:
+                self.recluster(n_clusters=n_clusters)
+            self.set_retrieval_backend(self.retrieval_backend.name, **self._retrieval_backend_params)
+    
+    def set_retrieval_backend(self, name: str, **params) -> RetrievalBackend:
+        """Swap the semantic retrieval backend (exact, ivf, cluster_pruned, mrl_cascade) and build it"""
+        if name not in RETRIEVAL_BACKENDS:
+            raise ValueError(f"Unknown retrieval backend: {name}")
+        
+        backend = RETRIEVAL_BACKENDS[name](self.vector_index, hoard=self, **params)
+        seeds = [cluster.centroid for cluster in self.clusters.values() if cluster.centroid is not None]
+        backend.build(seeds)
+        self.retrieval_backend = backend
+        self._retrieval_backend_params = params
+        self.generation += 1
+        return backend
+    
+    def set_vector_storage(self, storage: str) -> HoardVectorIndex:
+        """Re-encode the embedding index as float32 or int8 and rebuild the retrieval backend"""
+        if storage not in VECTOR_INDEX_TYPES:
+            raise ValueError(f"Unknown vector storage: {storage}")
+        
+        with self._lock:
+            old_index = self.vector_index
+            index = VECTOR_INDEX_TYPES[storage](
+                old_index.dimension,
+                initial_capacity=max(len(old_index), 1024),
+                resolutions=list(old_index.prefix_norms)
+            )
+            if len(old_index):
+                node_ids = list(old_index.row_to_id)
+                # Dequantized rows only for int8 stores written without float originals
+                originals = self._float_embeddings(node_ids)
+                index.add_batch(node_ids, originals if originals is not None else old_index.vectors())
+            if index.quantized:
+                # The int8 index replaces the float copies held by nodes and the embedding cache
+                resident = self.nodes.resident_values() if isinstance(self.nodes, LazyNodeMap) else self.nodes.values()
+                for node in resident:
+                    node.embeddings = None
+                self.embedding_cache.clear()
+            
+            self.vector_index = index
+            self.set_retrieval_backend(self.retrieval_backend.name, **self._retrieval_backend_params)
+            if self.store is not None:
+                self._persist_snapshot()
+        return index
+    
+    def open_store(self, path: str, sync_interval: int = 1024) -> HoardStore:
+        """
+        Attach an on-disk HoardStore
+        An existing store is mapped lazily (nodes and edges decode on first access);
+        an empty store receives a snapshot of the current Hoard. Clusters are not
+        persisted and are rebuilt by the maintenance recluster job.
+        """
+        with self._lock:
+            if self.store is not None:
+                self.close_store()
+            
+            store = HoardStore(path, sync_interval=sync_interval).open(
+                self.embedding_provider.dimension, self._storage_name(), self.embedding_provider.describe()
+            )
+            if store.node_count == 0:
+                self.store = store
+                self._persist_snapshot()
+                return store
+            
+            if self.nodes:
+                store.close()
+                raise ValueError("A non-empty Hoard store can only be opened into an empty Hoard")
+            if store.manifest["embedding_provider"] != self.embedding_provider.describe():
+                store.close()
+                raise ValueError(
+                    f"Hoard store at {path} was embedded with {store.manifest['embedding_provider']}, "
+                    f"but the active provider is {self.embedding_provider.describe()}"
+                )
+            
+            self.vector_index = VECTOR_INDEX_TYPES[store.storage].attach(
+                store.node_ids(), store.vector_arrays(), resolutions=list(self.vector_index.prefix_norms),
+                grow_storage=store.map_vectors
+            )
+            self.store = store
+            self.nodes = LazyNodeMap(store, self.vector_index)
+            self.graph = store.load_graph(self.graph.merge_threshold)
+            self.keyword_index = KeywordIndex(self.keyword_index.k1, self.keyword_index.b)
+            self._keyword_backfill = store.node_count  # stored rows get postings on first keyword search
+            self.tier_manager = TierManager(
+                self.tier_manager.hot_budget_bytes, self.tier_manager.warm_budget_bytes,
+                self.tier_manager.half_life_seconds, self.tier_manager.rebalance_interval
+            )
+            self.tier_manager.add_rows(
+                np.arange(store.node_count), store.content_bytes() + TierManager.RECORD_OVERHEAD_BYTES,
+                tier=TierManager.COLD
+            )
+            self.clusters = {}
+            self.centroid_index = HoardVectorIndex(initial_capacity=256)
+            self.set_retrieval_backend(self.retrieval_backend.name, **self._retrieval_backend_params)
+        return store
+    
+    def flush_store(self):
+        """fsync pending writes to the attached store"""
+        if self.store is not None:
+            self.store.flush()
+    
+    def close_store(self):
+        """Flush and detach the store (persisted nodes not yet decoded become unreadable)"""
+        with self._lock:
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+                self._keyword_backfill = None
+                self.vector_index.grow_storage = None  # later growth copies into memory
+    
+    def _persist_snapshot(self):
+        """Rewrite the attached store from the in-memory Hoard (after index or provider changes)"""
+        with self._lock:
+            index = self.vector_index
+            node_ids = list(index.row_to_id)
+            nodes = [self.nodes[node_id] for node_id in node_ids]
+            arrays = index.row_arrays(slice(0, len(index))) if node_ids else {}
+            self.store.rewrite(
+                nodes, arrays, self.graph,
+                dimension=index.dimension or self.embedding_provider.dimension,
+                storage=self._storage_name(),
+                embedding_provider=self.embedding_provider.describe()
+            )
+            self.nodes = LazyNodeMap(self.store, index, resident=dict(zip(node_ids, nodes)))
+    
+    def rebalance_tiers(self) -> Dict[str, Any]:
+        """
+        Re-place every node in the hot / warm / cold tiers by access score
+        Hot nodes hold float embeddings, warm nodes only their record (vectors come from
+        the index), cold nodes are evicted to the store. Without a store nothing goes cold.
+        Behind a quantized index, nodes without a float original stay warm.
+        """
+        start_time = time.perf_counter()
+        with self._lock:
+            lazy = isinstance(self.nodes, LazyNodeMap)
+            target = self.tier_manager.plan(
+                (self.vector_index.dimension or 0) * 4, allow_cold=lazy,
+                index_row_bytes=self.vector_index.resident_row_bytes()
+            )[:len(self.vector_index)]
+            observed = self._observed_tiers()
+            
+            row_to_id = self.vector_index.row_to_id
+            for row in np.flatnonzero(target != observed).tolist():
+                node_id = row_to_id[row]
+                if target[row] == TierManager.COLD:
+                    self.nodes.evict(node_id)
+                    continue
+                
+                node = self.nodes[node_id]
+                if target[row] == TierManager.HOT:
+                    if node.embeddings is None:
+                        originals = self._float_embeddings([node_id])
+                        if originals is None:
+                            target[row] = TierManager.WARM
+                        else:
+                            node.embeddings = originals[0]
+                else:
+                    node.embeddings = None
+            
+            moves = self.tier_manager.commit(observed, target)
         
+        report = {
+            **moves,
+            "tiers": self.tier_manager.statistics(),
+            "elapsed_seconds": time.perf_counter() - start_time
+        }
+        self.performance_metrics["last_tier_rebalance"] = report
+        return report
+    
+    def tier_statistics(self) -> Dict[str, Any]:
+        return self.tier_manager.statistics()
+    
+    def _maybe_rebalance_tiers(self):
+        if self.tiering_enabled and self.tier_manager.inserts_since_rebalance >= self.tier_manager.rebalance_interval:
+            self.rebalance_tiers()
+    
+    def _observed_tiers(self) -> np.ndarray:
+        """Actual tier of every indexed row: evicted, record only, or record with embeddings"""
+        lazy = isinstance(self.nodes, LazyNodeMap)
+        observed = np.empty(len(self.vector_index), dtype=np.uint8)
+        for row, node_id in enumerate(self.vector_index.row_to_id):
+            node = self.nodes.get_resident(node_id) if lazy else self.nodes.get(node_id)
+            if node is None:
+                observed[row] = TierManager.COLD
+            else:
+                observed[row] = TierManager.HOT if node.embeddings is not None else TierManager.WARM
+        return observed
+    
+    def _node_embedding(self, node_id: str) -> np.ndarray:
+        """Float embedding of a node: its own if hot, otherwise from the vector index"""
+        node = self.nodes.get_resident(node_id) if isinstance(self.nodes, LazyNodeMap) else self.nodes.get(node_id)
+        if node is not None and node.embeddings is not None:
+            return node.embeddings
+        return np.array(self.vector_index.dense(self.vector_index.id_to_row[node_id]), dtype=np.float32)
+    
+    def _float_embeddings(self, node_ids: List[str]) -> Optional[np.ndarray]:
+        """
+        Original float unit vectors for the given nodes, or None when the index keeps none
+        (int8 stores written without originals); dequantized rows never stand in for them
+        """
+        return self.vector_index.exact(np.array([self.vector_index.id_to_row[node_id] for node_id in node_ids],
+                                                dtype=np.int64))
+    
+    @staticmethod
+    def _record_bytes(node: KnowledgeNode) -> int:
+        return len(node.content.encode()) + TierManager.RECORD_OVERHEAD_BYTES
+    
+    def _storage_name(self) -> str:
+        return next(name for name, index_type in VECTOR_INDEX_TYPES.items() if index_type is type(self.vector_index))
+    
+    def memory_footprint(self) -> Dict[str, int]:
+        """Bytes held by embedding storage across the Hoard"""
+        resident_nodes = self.nodes.resident_values() if isinstance(self.nodes, LazyNodeMap) else self.nodes.values()
+        footprint = {
+            "vector_index": self.vector_index.memory_footprint()["total"],
+            "centroid_index": self.centroid_index.memory_footprint()["total"],
+            "node_embeddings": sum(
+                node.embeddings.nbytes for node in resident_nodes if node.embeddings is not None
+            ),
+            "embedding_cache": self.embedding_cache.nbytes,
+            "graph": self.graph.memory_footprint()["total"],
+            "keyword_index": self.keyword_index.memory_footprint()["total"],
+            "tier_tracking": sum(
+                array.nbytes for array in (self.tier_manager.access_counts, self.tier_manager.last_access,
+                                           self.tier_manager.record_bytes, self.tier_manager.tiers)
+            )
+        }
+        footprint["total"] = sum(footprint.values())
+        return footprint
+    
     def store_knowledge(self, content: str, metadata: Dict[str, Any] = None) -> str:
         """Store new knowledge in The Hoard"""
+        # Quantized storage keeps no float copy in the embedding cache or on the node
+        quantized = self.vector_index.quantized
         node = KnowledgeNode(
             content=content,
             metadata=metadata or {},
-            embeddings=self._generate_embeddings(content)
+            embeddings=self._generate_embeddings(content, cache=not quantized)
         )
         
-        self.nodes[node.id] = node
-        self._update_graph_connections(node)
-        self._update_clusters(node)
-        
+        with self._lock:
+            self.generation += 1
+            self.nodes[node.id] = node
+            row = self.vector_index.add(node.id, node.embeddings)
+            if self.store is not None:
+                self.store.append_nodes([node], self.vector_index.row_arrays([row]))
+            self.keyword_index.add(row, node.content)
+            self.tier_manager.add_rows([row], self._record_bytes(node))
+            self.retrieval_backend.add(node.id, row)
+            self._update_graph_connections(node)
+            self._update_clusters(node)
+            if quantized:
+                node.embeddings = None
+        
+        self._maybe_rebalance_tiers()
         return node.id
     
-    def retrieve_knowledge(self, query: str, max_results: int = 10) -> List[KnowledgeNode]:
-        """Retrieve relevant knowledge using GraphRAG"""
+    def store_knowledge_batch(self, contents: List[str], 
+                              metadatas: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Store many knowledge items at once
+        Embeds the batch as one matrix, builds all edges from a batch x corpus similarity
+        product and assigns clusters in one vectorized pass. Returns node ids in input order.
+        """
+        if not contents:
+            return []
+        if metadatas is None:
+            metadatas = [{} for _ in contents]
+        if len(metadatas) != len(contents):
+            raise ValueError("contents and metadatas must have the same length")
+        
+        start_time = time.perf_counter()
+        quantized = self.vector_index.quantized
+        embeddings = self._generate_embeddings_batch(contents, cache=not quantized)
+        
+        nodes = [
+            KnowledgeNode(content=content, metadata=metadata or {}, embeddings=embedding)
+            for content, metadata, embedding in zip(contents, metadatas, embeddings)
+        ]
+        node_ids = [node.id for node in nodes]
+        with self._lock:
+            self.generation += 1
+            for node in nodes:
+                self.nodes[node.id] = node
+            
+            rows = self.vector_index.add_batch(node_ids, embeddings)
+            if self.store is not None:
+                self.store.append_nodes(nodes, self.vector_index.row_arrays(rows))
+            self.keyword_index.add_batch(rows, contents)
+            self.tier_manager.add_rows(rows, [self._record_bytes(node) for node in nodes])
+            self.retrieval_backend.add_batch(node_ids, rows)
+            edges_created = self._update_graph_connections_batch(nodes, rows)
+            self._update_clusters_batch(nodes)
+            if quantized:
+                for node in nodes:
+                    node.embeddings = None
+        
+        self._maybe_rebalance_tiers()
+        elapsed = time.perf_counter() - start_time
+        self.performance_metrics["last_batch_ingest"] = {
+            "nodes": len(nodes),
+            "edges_created": edges_created,
+            "elapsed_seconds": elapsed,
+            "nodes_per_second": len(nodes) / elapsed if elapsed > 0 else float("inf")
+        }
+        
+        return node_ids
+    
+    def retrieve_knowledge(self, query: str, max_results: int = 10, exact: bool = False) -> List[KnowledgeNode]:
+        """Retrieve relevant knowledge using GraphRAG (exact=True bypasses the ANN backend)"""
+        generation = self.generation
+        cache_key = (QueryResultCache.normalize(query), max_results, exact)
         query_embedding = self._generate_embeddings(query)
         
-        # Semantic similarity search
-        semantic_results = self._semantic_search(query_embedding, max_results)
+        cached = self.result_cache.get(cache_key, generation, query_embedding) if self.result_cache_enabled else None
+        if cached is not None:
+            combined_results = [self.nodes[node_id] for node_id in cached]
+        else:
+            # Semantic similarity search
+            semantic_results = self._semantic_search(query_embedding, max_results, exact=exact)
+            
+            # Graph traversal for related concepts
+            graph_results = self._graph_traversal_search(semantic_results, max_results)
+            
+            combined_results = self._fuse_retrieval(query, semantic_results, graph_results, max_results)
+            if self.result_cache_enabled:
+                # Tagged with the generation read before searching, so a concurrent write makes it stale
+                self.result_cache.put(cache_key, generation, [node.id for node in combined_results], query_embedding)
         
-        # Graph traversal for related concepts
-        graph_results = self._graph_traversal_search(semantic_results, max_results)
+        self._record_retrieval_access(combined_results)
+        return combined_results
+    
+    def retrieve_knowledge_batch(self, queries: List[str], max_results: int = 10,
+                                 exact: bool = False) -> List[List[KnowledgeNode]]:
+        """
+        Retrieve for many queries at once
+        Queries are embedded together, scored against the corpus with one matrix product
+        per chunk and graph-expanded frontier-at-a-time for all of them. Each result list
+        matches what retrieve_knowledge returns for that query.
+        """
+        start_time = time.perf_counter()
+        if not queries:
+            return []
+        
+        generation = self.generation
+        cache_keys = [(QueryResultCache.normalize(query), max_results, exact) for query in queries]
+        query_embeddings = self._generate_embeddings_batch(queries)
+        
+        results: List[Optional[List[KnowledgeNode]]] = [None] * len(queries)
+        if self.result_cache_enabled:
+            for i, cache_key in enumerate(cache_keys):
+                cached = self.result_cache.get(cache_key, generation, query_embeddings[i])
+                if cached is not None:
+                    results[i] = [self.nodes[node_id] for node_id in cached]
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            semantic_results = self._semantic_search_batch(query_embeddings[pending], max_results, exact=exact)
+            graph_results = self._graph_traversal_search_batch(semantic_results, max_results)
+            for i, semantic, graph in zip(pending, semantic_results, graph_results):
+                results[i] = self._fuse_retrieval(queries[i], semantic, graph, max_results)
+                if self.result_cache_enabled:
+                    self.result_cache.put(cache_keys[i], generation, [node.id for node in results[i]],
+                                          query_embeddings[i])
+        
+        for combined_results in results:
+            self._record_retrieval_access(combined_results)
+        
+        elapsed = time.perf_counter() - start_time
+        self.performance_metrics["last_batch_retrieval"] = {
+            "queries": len(queries),
+            "cached": len(queries) - len(pending),
+            "elapsed_seconds": elapsed,
+            "queries_per_second": len(queries) / elapsed if elapsed > 0 else 0.0
+        }
+        return results
+    
+    def _fuse_retrieval(self, query: str, semantic_results: List[KnowledgeNode],
+                        graph_results: List[KnowledgeNode], max_results: int) -> List[KnowledgeNode]:
+        """Add keyword hits to the semantic and graph lists and fuse them with RRF"""
+        ranked_lists = {"semantic": semantic_results, "graph": graph_results}
+        if self.keyword_search_enabled:
+            # Exact-term matches (protocol names, ids) the embedding may miss
+            ranked_lists["keyword"] = self._keyword_search(query, max_results)
         
         # Combine and rank results using RRF
-        combined_results = self._combine_results_rrf(semantic_results, graph_results)
-        
-        # Update access patterns
-        for node in combined_results:
+        return self._combine_results_rrf(ranked_lists, max_results)
+    
+    def _record_retrieval_access(self, results: List[KnowledgeNode]):
+        """Update access patterns and tier scores for returned nodes"""
+        for node in results:
             node.update_access()
             self.access_patterns[node.id] += 1
-        
-        return combined_results[:max_results]
+        self.tier_manager.record_access(
+            [self.vector_index.id_to_row[node.id] for node in results if node.id in self.vector_index]
+        )
     
-    def _generate_embeddings(self, content: str) -> np.ndarray:
+    def _generate_embeddings(self, content: str, cache: bool = True) -> np.ndarray:
         """Generate embeddings using Matryoshka Representation Learning"""
-        # Simplified embedding generation
-        # In practice, this would use a proper embedding model
-        content_hash = hashlib.md5(content.encode()).hexdigest()
-        if content_hash in self.embedding_cache:
-            return self.embedding_cache[content_hash]
-        
-        # Simulate MRL with different dimensionalities
-        base_embedding = np.random.rand(768)  # Base embedding
+        return self._generate_embeddings_batch([content], cache)[0]
+    
+    def _generate_embeddings_batch(self, contents: List[str], cache: bool = True) -> np.ndarray:
+        """
+        Generate embeddings for many contents as one (n, d) matrix, embedding cache misses in one batch
+        With cache=False new embeddings are returned without being added to the cache.
+        """
+        content_hashes = [hashlib.md5(content.encode()).hexdigest() for content in contents]
+        
+        # Resolve the batch locally so entries evicted mid-batch are still returned
+        resolved: Dict[str, np.ndarray] = {}
+        for content_hash in dict.fromkeys(content_hashes):
+            embedding = self.embedding_cache.get(content_hash)
+            if embedding is not None:
+                resolved[content_hash] = embedding
+        missing = [content_hash for content_hash in dict.fromkeys(content_hashes) if content_hash not in resolved]
+        
+        if missing:
+            contents_by_hash = dict(zip(content_hashes, contents))
+            embeddings = self.embedding_provider.embed_batch([contents_by_hash[h] for h in missing])
+            
+            # Keep the full MRL vector; resolution is chosen per search stage
+            for content_hash, embedding in zip(missing, embeddings):
+                # Per-row copy so an evicted entry frees its memory instead of pinning the batch
+                resolved[content_hash] = embedding.copy()
+                if cache:
+                    self.embedding_cache.put(content_hash, resolved[content_hash])
+        
+        return np.vstack([resolved[content_hash] for content_hash in content_hashes])
+    
+    def _keyword_search(self, query: str, max_results: int) -> List[KnowledgeNode]:
+        """BM25 keyword search over node content"""
+        with self._lock:
+            if self._keyword_backfill is not None and self.store is not None:
+                for row, content in self.store.iter_contents(self._keyword_backfill):
+                    self.keyword_index.add(row, content)
+                self._keyword_backfill = None
+        
+        row_to_id = self.vector_index.row_to_id
+        return [self.nodes[row_to_id[row]] for row, _ in self.keyword_index.search(query, max_results)]
+    
+    def _semantic_search(self, query_embedding: np.ndarray, max_results: int,
+                         exact: bool = False) -> List[KnowledgeNode]:
+        """Perform semantic similarity search through the active retrieval backend"""
+        # Quantized scores are approximate: over-fetch, then re-rank in float
+        candidates = max_results * self.rerank_factor if self.vector_index.quantized else max_results
+        if exact:
+            hits = self.vector_index.search(query_embedding, candidates)
+        else:
+            hits = self.retrieval_backend.search(query_embedding, candidates)
+        
+        if self.vector_index.quantized:
+            hits = self._rerank_exact(query_embedding, hits, max_results)
+        return [self.nodes[node_id] for node_id, _ in hits if node_id in self.nodes]
+    
+    def _semantic_search_batch(self, query_embeddings: np.ndarray, max_results: int,
+                               exact: bool = False) -> List[List[KnowledgeNode]]:
+        """_semantic_search for a query matrix; exact scans use one matrix product per chunk"""
+        candidates = max_results * self.rerank_factor if self.vector_index.quantized else max_results
+        if exact:
+            hit_lists = self.vector_index.search_batch(query_embeddings, candidates, self.batch_similarity_budget)
+        else:
+            hit_lists = self.retrieval_backend.search_batch(query_embeddings, candidates)
         
-        # MRL allows for different dimensionality representations
-        embeddings = {
-            64: base_embedding[:64],
-            128: base_embedding[:128],
-            256: base_embedding[:256],
-            512: base_embedding[:512],
-            768: base_embedding
-        }
+        if self.vector_index.quantized:
+            hit_lists = [
+                self._rerank_exact(query_embedding, hits, max_results)
+                for query_embedding, hits in zip(query_embeddings, hit_lists)
+            ]
+        return [[self.nodes[node_id] for node_id, _ in hits if node_id in self.nodes] for hits in hit_lists]
+    
+    def _rerank_exact(self, query_embedding: np.ndarray, hits: List[Tuple[str, float]],
+                      k: int) -> List[Tuple[str, float]]:
+        """
+        Re-score quantized candidates against their original float embeddings and keep the top k
+        When any candidate has no float original, the int8 order is kept and the skip is
+        counted in performance_metrics["exact_rerank"].
+        """
+        hits = [(node_id, score) for node_id, score in hits if node_id in self.nodes]
+        if not hits:
+            return []
+        
+        node_ids = [node_id for node_id, _ in hits]
+        candidates = self._float_embeddings(node_ids)
+        rerank_stats = self.performance_metrics.setdefault("exact_rerank", {"reranked": 0, "skipped": 0})
+        if candidates is None:
+            rerank_stats["skipped"] += 1
+            return hits[:k]
+        
+        rerank_stats["reranked"] += 1
+        norms = np.linalg.norm(candidates, axis=1)
+        scores = (candidates @ HoardVectorIndex.normalize(query_embedding)) / np.where(norms > 0, norms, 1.0)
+        return [(node_ids[i], float(scores[i])) for i in HoardVectorIndex.top_k(scores, k)]
+    
+    def _graph_traversal_search(self, seed_nodes: List[KnowledgeNode], max_results: int) -> List[KnowledgeNode]:
+        """
+        Perform graph traversal to find related concepts
+        Expands whole frontiers over the CSR graph: plain BFS up to graph_max_depth hops,
+        or personalized PageRank seeded by the semantic hits (weighted by 1 / rank).
+        """
+        id_to_row = self.vector_index.id_to_row
+        seeds = np.array([id_to_row[node.id] for node in seed_nodes if node.id in id_to_row], dtype=np.int64)
+        if not len(seeds) or max_results <= 0:
+            return []
+        
+        if self.graph_search_mode == "personalized_pagerank":
+            rows, _ = self.graph.personalized_pagerank(
+                seeds, 1.0 / np.arange(1, len(seeds) + 1), damping=self.ppr_damping, max_hops=self.graph_max_depth
+            )
+            rows = rows[:max_results]
+        else:
+            rows = self.graph.breadth_first(seeds, len(self.vector_index), self.graph_max_depth, limit=max_results)
         
-        self.embedding_cache[content_hash] = embeddings[256]  # Use 256-dim for balance
-        return embeddings[256]
+        row_to_id = self.vector_index.row_to_id
+        return [self.nodes[row_to_id[row]] for row in rows.tolist()]
     
-    def _semantic_search(self, query_embedding: np.ndarray, max_results: int) -> List[KnowledgeNode]:
-        """Perform semantic similarity search"""
-        similarities = []
+    def _graph_traversal_search_batch(self, seed_lists: List[List[KnowledgeNode]],
+                                      max_results: int) -> List[List[KnowledgeNode]]:
+        """_graph_traversal_search for many seed lists; BFS expands all of them per hop"""
+        if self.graph_search_mode == "personalized_pagerank" or max_results <= 0:
+            return [self._graph_traversal_search(seed_nodes, max_results) for seed_nodes in seed_lists]
         
-        for node_id, node in self.nodes.items():
-            if node.embeddings is not None:
-                similarity = self._cosine_similarity(query_embedding, node.embeddings)
-                similarities.append((similarity, node))
+        id_to_row = self.vector_index.id_to_row
+        seeds = [
+            np.array([id_to_row[node.id] for node in seed_nodes if node.id in id_to_row], dtype=np.int64)
+            for seed_nodes in seed_lists
+        ]
+        row_lists = self.graph.breadth_first_batch(
+            seeds, len(self.vector_index), self.graph_max_depth, limit=max_results
+        )
+        row_to_id = self.vector_index.row_to_id
+        return [[self.nodes[row_to_id[row]] for row in rows.tolist()] for rows in row_lists]
+    
+    def _combine_results_rrf(self, ranked_lists: Dict[str, List[KnowledgeNode]],
+                             max_results: Optional[int] = None) -> List[KnowledgeNode]:
+        """Combine any number of named result lists using weighted Reciprocal Rank Fusion"""
+        fused = self.rank_fusion.fuse(ranked_lists, top_k=max_results, key=lambda node: node.id)
+        self.performance_metrics["last_fusion"] = [
+            {"node_id": result.item.id, "score": result.score, "contributions": result.contributions}
+            for result in fused
+        ]
         
-        # Sort by similarity and return top results
-        similarities.sort(key=lambda x: x[0], reverse=True)
-        return [node for _, node in similarities[:max_results]]
+        # Return nodes in RRF order
+        return [result.item for result in fused if result.item.id in self.nodes]
     
-    def _graph_traversal_search(self, seed_nodes: List[KnowledgeNode], max_results: int) -> List[KnowledgeNode]:
-        """Perform graph traversal to find related concepts"""
-        visited = set()
-        results = []
-        queue = deque([(node, 0) for node in seed_nodes])  # (node, depth)
-        
-        while queue and len(results) < max_results:
-            current_node, depth = queue.popleft()
-            
-            if current_node.id in visited or depth > 2:  # Limit traversal depth
+    def _update_graph_connections(self, node: KnowledgeNode):
+        """Update graph connections for new node (k-NN candidates from the similarity index)"""
+        # One index query instead of a pairwise scan; +1 because the node finds itself.
+        # Internal searches are kept out of the backend's user query stats
+        with self.retrieval_backend.uncounted() as backend:
+            candidates = backend.search(node.embeddings, self.max_neighbors_per_node + 1)
+        id_to_row = self.vector_index.id_to_row
+        row = id_to_row[node.id]
+        
+        for existing_id, similarity in candidates:
+            if existing_id == node.id or existing_id not in self.nodes:
                 continue
+            if similarity <= self.edge_threshold:  # Threshold for creating connections
+                break
             
-            visited.add(current_node.id)
-            results.append(current_node)
+            existing_row = id_to_row[existing_id]
+            self._add_edge(row, existing_row, similarity)
+            self._add_capped_edge(existing_row, row, similarity)
+    
+    def _update_graph_connections_batch(self, nodes: List[KnowledgeNode], rows: np.ndarray) -> int:
+        """Create k-NN edges for a freshly indexed batch from batch x corpus similarity blocks"""
+        corpus_size = len(self.vector_index)
+        k = self.max_neighbors_per_node
+        batch_rows = set(int(row) for row in rows)
+        edges_created = 0
+        
+        # Chunk the batch so the similarity block stays within the configured budget
+        chunk_size = max(1, self.batch_similarity_budget // max(1, corpus_size))
+        for start in range(0, len(nodes), chunk_size):
+            chunk_rows = rows[start:start + chunk_size]
+            similarities = self.vector_index.similarity_block(chunk_rows, self.batch_similarity_budget)
+            similarities[np.arange(len(chunk_rows)), chunk_rows] = -np.inf
             
-            # Add connected nodes to queue
-            for edge in self.graph_edges.get(current_node.id, []):
-                target_id = edge["target"]
-                if target_id in self.nodes and target_id not in visited:
-                    queue.append((self.nodes[target_id], depth + 1))
-        
-        return results
-    
-    def _combine_results_rrf(self, semantic_results: List[KnowledgeNode], 
-                           graph_results: List[KnowledgeNode], k: float = 60.0) -> List[KnowledgeNode]:
-        """Combine results using Reciprocal Rank Fusion"""
-        rrf_scores = defaultdict(float)
-        
-        # Calculate RRF scores for semantic results
-        for rank, node in enumerate(semantic_results, 1):
-            rrf_scores[node.id] += 1.0 / (k + rank)
-        
-        # Calculate RRF scores for graph results
-        for rank, node in enumerate(graph_results, 1):
-            rrf_scores[node.id] += 1.0 / (k + rank)
+            if k < similarities.shape[1]:
+                neighbors = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                neighbors = np.tile(np.arange(similarities.shape[1]), (len(chunk_rows), 1))
+            weights = np.take_along_axis(similarities, neighbors, axis=1)
+            
+            for source_row, neighbor_rows, neighbor_weights in zip(chunk_rows, neighbors, weights):
+                order = np.argsort(-neighbor_weights, kind="stable")
+                for target_row, weight in zip(neighbor_rows[order], neighbor_weights[order]):
+                    if weight <= self.edge_threshold:
+                        break
+                    
+                    self._add_edge(int(source_row), int(target_row), float(weight))
+                    edges_created += 1
+                    
+                    # Batch members emit their own forward edges
+                    if int(target_row) not in batch_rows:
+                        edges_created += self._add_capped_edge(int(target_row), int(source_row), float(weight))
+        
+        return edges_created
+    
+    def _add_capped_edge(self, source: int, target: int, weight: float) -> bool:
+        """
+        Add a reverse edge, displacing the weakest one once the neighbour cap is reached
+        Returns whether the edge was added (False when every existing edge is stronger).
+        """
+        targets, weights, _ = self.graph.neighbors(source)
         
-        # Sort by RRF score
-        sorted_nodes = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
+        if len(targets) < self.max_neighbors_per_node:
+            self._add_edge(source, target, weight)
+            return True
         
-        # Return nodes in RRF order
-        return [self.nodes[node_id] for node_id, _ in sorted_nodes if node_id in self.nodes]
+        weakest = int(np.argmin(weights))
+        if weights[weakest] < weight:
+            self.graph.remove_edge(source, int(targets[weakest]))
+            if self.store is not None:
+                self.store.append_edge(source, int(targets[weakest]), float(weights[weakest]), removed=True)
+            self._add_edge(source, target, weight)
+            return True
+        return False
     
-    def _update_graph_connections(self, node: KnowledgeNode):
-        """Update graph connections for new node"""
-        # Find similar nodes and create edges
-        for existing_id, existing_node in self.nodes.items():
-            if existing_id != node.id and existing_node.embeddings is not None:
-                similarity = self._cosine_similarity(node.embeddings, existing_node.embeddings)
-                
-                if similarity > 0.7:  # Threshold for creating connections
-                    # Create bidirectional edges
-                    self.graph_edges[node.id].append({
-                        "target": existing_id,
-                        "weight": similarity,
-                        "type": "semantic_similarity"
-                    })
-                    self.graph_edges[existing_id].append({
-                        "target": node.id,
-                        "weight": similarity,
-                        "type": "semantic_similarity"
-                    })
+    def _add_edge(self, source: int, target: int, weight: float, edge_type: str = "semantic_similarity"):
+        """Add a directed edge between index rows and mirror it into the attached store"""
+        self.graph.add_edge(source, target, weight, edge_type)
+        if self.store is not None:
+            self.store.append_edge(source, target, weight, edge_type)
     
     def _update_clusters(self, node: KnowledgeNode):
         """Update memory clusters with new node"""
@@ -566,18 +3825,17 @@ class TheHoard:
         best_cluster = None
         best_similarity = 0.0
         
-        for cluster_id, cluster in self.clusters.items():
-            if cluster.centroid is not None:
-                similarity = self._cosine_similarity(node.embeddings, cluster.centroid)
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_cluster = cluster
+        # One matrix-vector product against the stacked centroids
+        nearest = self.centroid_index.search(node.embeddings, 1)
+        if nearest and nearest[0][1] > best_similarity:
+            best_cluster = self.clusters[nearest[0][0]]
+            best_similarity = nearest[0][1]
         
-        if best_cluster and best_similarity > 0.6:
+        if best_cluster and best_similarity > self.clustering_threshold:
             # Add to existing cluster
             best_cluster.nodes.append(node.id)
             best_cluster.last_updated = datetime.now(timezone.utc)
-            self._update_cluster_centroid(best_cluster)
+            self._accumulate_cluster_member(best_cluster, node.embeddings)
         else:
             # Create new cluster
             new_cluster = MemoryCluster(
@@ -586,38 +3844,515 @@ class TheHoard:
                 centroid=node.embeddings.copy(),
                 coherence_score=1.0
             )
+            self._reset_cluster_stats(new_cluster, [node.embeddings])
+            self.clusters[new_cluster.id] = new_cluster
+    
+    def _update_clusters_batch(self, nodes: List[KnowledgeNode]):
+        """
+        Assign a batch to clusters in vectorized passes
+        Nodes join their nearest existing cluster above clustering_threshold; the rest are
+        clustered among themselves by a greedy leader pass over batch x batch similarity
+        blocks, so a first bulk load into an empty Hoard seeds its clusters in one pass.
+        """
+        embeddings = np.vstack([node.embeddings for node in nodes]).astype(np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        units = embeddings / np.where(norms > 0, norms, 1.0)
+        pending = np.arange(len(nodes))
+        now = datetime.now(timezone.utc)
+        
+        if len(self.centroid_index) > 0:
+            cluster_ids, best_similarity = self._assign_nearest_clusters(units)
+            joined = best_similarity > self.clustering_threshold
+            for position in np.flatnonzero(joined).tolist():
+                cluster = self.clusters[cluster_ids[position]]
+                cluster.nodes.append(nodes[position].id)
+                cluster.last_updated = now
+                self._accumulate_cluster_member(cluster, embeddings[position])
+            pending = np.flatnonzero(~joined)
+        
+        for group in self._leader_groups(units[pending]):
+            positions = pending[group]
+            new_cluster = MemoryCluster(
+                name=f"cluster_{len(self.clusters)}",
+                nodes=[nodes[position].id for position in positions.tolist()],
+                last_updated=now
+            )
+            self._reset_cluster_stats(new_cluster, embeddings[positions])
             self.clusters[new_cluster.id] = new_cluster
     
+    def _leader_groups(self, units: np.ndarray) -> List[np.ndarray]:
+        """
+        Greedy leader clustering of unit rows, returning member positions per group
+        Each row joins its most similar earlier leader above clustering_threshold or becomes
+        a leader itself. Rows are taken in chunks: one block product scores a chunk against
+        earlier leaders and a chunk x chunk block covers leaders within the chunk.
+        """
+        n_rows = len(units)
+        leader_of = np.empty(n_rows, dtype=np.int64)
+        leaders = np.empty(n_rows, dtype=np.int64)
+        n_leaders = 0
+        chunk_size = max(1, int(np.sqrt(self.batch_similarity_budget)))
+        
+        for start in range(0, n_rows, chunk_size):
+            block = units[start:start + chunk_size]
+            if n_leaders:
+                prior, prior_similarity = self._nearest_rows(block, units[leaders[:n_leaders]])
+                prior = leaders[prior]
+            else:
+                prior = np.zeros(len(block), dtype=np.int64)
+                prior_similarity = np.full(len(block), -np.inf, dtype=np.float32)
+            within = block @ block.T
+            
+            chunk_leaders = np.empty(len(block), dtype=np.int64)
+            n_chunk_leaders = 0
+            for i in range(len(block)):
+                best, best_similarity = int(prior[i]), float(prior_similarity[i])
+                if n_chunk_leaders:
+                    similarities = within[i, chunk_leaders[:n_chunk_leaders]]
+                    j = int(np.argmax(similarities))
+                    if similarities[j] > best_similarity:
+                        best, best_similarity = start + int(chunk_leaders[j]), float(similarities[j])
+                
+                if best_similarity > self.clustering_threshold:
+                    leader_of[start + i] = best
+                else:
+                    leader_of[start + i] = start + i
+                    chunk_leaders[n_chunk_leaders] = i
+                    n_chunk_leaders += 1
+            
+            leaders[n_leaders:n_leaders + n_chunk_leaders] = start + chunk_leaders[:n_chunk_leaders]
+            n_leaders += n_chunk_leaders
+        
+        # Leaders precede their members, so sorting by leader keeps groups in first-seen order
+        order = np.argsort(leader_of, kind="stable")
+        _, counts = np.unique(leader_of[order], return_counts=True)
+        return np.split(order, np.cumsum(counts)[:-1]) if n_rows else []
+    
+    def _nearest_rows(self, units: np.ndarray, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Most similar matrix row (and its similarity) for each unit row, in budget-sized blocks"""
+        best = np.zeros(len(units), dtype=np.int64)
+        best_similarity = np.full(len(units), -np.inf, dtype=np.float32)
+        step = max(1, self.batch_similarity_budget // max(1, len(units)))
+        for start in range(0, len(matrix), step):
+            similarities = units @ matrix[start:start + step].T
+            block_best = np.argmax(similarities, axis=1)
+            block_similarity = similarities[np.arange(len(units)), block_best]
+            better = block_similarity > best_similarity
+            best[better] = block_best[better] + start
+            best_similarity[better] = block_similarity[better]
+        return best, best_similarity
+    
+    def _assign_nearest_clusters(self, embeddings: np.ndarray) -> Tuple[List[Optional[str]], np.ndarray]:
+        """
+        Nearest cluster for each row of an (n, d) embedding matrix
+        Returns cluster ids (None when no clusters exist) and the matching cosine similarities
+        """
+        if len(self.centroid_index) == 0:
+            return [None] * len(embeddings), np.zeros(len(embeddings), dtype=np.float32)
+        
+        batch = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(batch, axis=1, keepdims=True)
+        best, best_similarity = self._nearest_rows(
+            batch / np.where(norms > 0, norms, 1.0), self.centroid_index.vectors()
+        )
+        return [self.centroid_index.row_to_id[row] for row in best.tolist()], best_similarity
+    
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors"""
         return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
     
+    def recluster(self, n_clusters: Optional[int] = None, batch_size: int = 1024,
+                  max_iterations: int = 100, tolerance: float = 1e-4, seed: int = 0) -> Dict[str, Any]:
+        """
+        Offline re-clustering with mini-batch spherical k-means over the embedding matrix
+        Works on a snapshot of the index in bounded memory (batch_size x k scores per step,
+        chunked final assignment) and swaps the new cluster set in atomically
+        """
+        start_time = time.perf_counter()
+        before = self.cluster_statistics()
+        
+        with self._lock:
+            index = self.vector_index
+            snapshot_size = len(index)
+            row_to_id = list(index.row_to_id)
+        
+        if snapshot_size == 0:
+            return {"status": "skipped", "reason": "empty_hoard", "before": before}
+        
+        k = min(n_clusters or max(1, int(np.sqrt(snapshot_size))), snapshot_size)
+        rng = np.random.default_rng(seed)
+        centroids = index.dense(np.sort(rng.choice(snapshot_size, k, replace=False)))
+        counts = np.zeros(k, dtype=np.float64)
+        
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            batch = index.dense(rng.integers(0, snapshot_size, size=min(batch_size, snapshot_size)))
+            assignments = np.argmax(batch @ centroids.T, axis=1)
+            
+            sums = np.zeros_like(centroids, dtype=np.float64)
+            np.add.at(sums, assignments, batch)
+            batch_counts = np.bincount(assignments, minlength=k)
+            updated = batch_counts > 0
+            
+            # Per-centre learning rate 1 / (points seen so far)
+            new_counts = counts + batch_counts
+            new_centroids = centroids.astype(np.float64)
+            new_centroids[updated] = (
+                counts[updated, None] * new_centroids[updated] + sums[updated]
+            ) / new_counts[updated, None]
+            norms = np.linalg.norm(new_centroids, axis=1, keepdims=True)
+            new_centroids = (new_centroids / np.where(norms > 0, norms, 1.0)).astype(np.float32)
+            
+            shift = float(np.max(np.linalg.norm(new_centroids - centroids, axis=1)))
+            centroids, counts = new_centroids, new_counts
+            if shift < tolerance:
+                break
+        
+        assignments = index.nearest_centroid_rows(centroids, snapshot_size)
+        
+        new_clusters: Dict[str, MemoryCluster] = {}
+        new_centroid_index = HoardVectorIndex(initial_capacity=k)
+        now = datetime.now(timezone.utc)
+        order = np.argsort(assignments, kind="stable")
+        boundaries = np.flatnonzero(np.diff(assignments[order])) + 1
+        for members in np.split(order, boundaries):
+            member_ids = [row_to_id[row] for row in members if row_to_id[row] in self.nodes]
+            if not member_ids:
+                continue
+            
+            cluster = MemoryCluster(
+                name=f"cluster_{len(new_clusters)}",
+                nodes=member_ids,
+                last_updated=now
+            )
+            self._reset_cluster_stats(
+                cluster, [self._node_embedding(node_id) for node_id in member_ids], new_centroid_index
+            )
+            new_clusters[cluster.id] = cluster
+        
+        with self._lock:
+            self.generation += 1
+            self.clusters = new_clusters
+            self.centroid_index = new_centroid_index
+            self._inserts_since_recalibration = 0
+            
+            # Nodes stored while the job ran were not in the snapshot
+            for node_id in self.vector_index.row_to_id[snapshot_size:]:
+                if node_id in self.nodes:
+                    self._update_clusters(self.nodes[node_id])
+        
+        report = {
+            "status": "completed",
+            "nodes": snapshot_size,
+            "n_clusters": len(new_clusters),
+            "iterations": iterations,
+            "elapsed_seconds": time.perf_counter() - start_time,
+            "before": before,
+            "after": self.cluster_statistics()
+        }
+        self.performance_metrics["last_recluster"] = report
+        return report
+    
+    def cluster_statistics(self) -> Dict[str, Any]:
+        """Coherence and size distribution of the current cluster set"""
+        clusters = list(self.clusters.values())
+        if not clusters:
+            return {"clusters": 0, "mean_coherence": 0.0, "weighted_coherence": 0.0, "size_histogram": {}}
+        
+        sizes = np.array([len(cluster.nodes) for cluster in clusters])
+        coherence = np.array([cluster.coherence_score for cluster in clusters])
+        return {
+            "clusters": len(clusters),
+            "mean_coherence": float(coherence.mean()),
+            "weighted_coherence": float(np.average(coherence, weights=np.maximum(sizes, 1))),
+            "size_min": int(sizes.min()),
+            "size_median": float(np.median(sizes)),
+            "size_max": int(sizes.max()),
+            "singletons": int(np.sum(sizes == 1)),
+            "size_histogram": {
+                "1": int(np.sum(sizes == 1)),
+                "2-9": int(np.sum((sizes >= 2) & (sizes < 10))),
+                "10-99": int(np.sum((sizes >= 10) & (sizes < 100))),
+                "100+": int(np.sum(sizes >= 100))
+            }
+        }
+    
+    def _accumulate_cluster_member(self, cluster: MemoryCluster, embedding: np.ndarray):
+        """O(d) running-sum update of centroid and coherence for one new member"""
+        if cluster.embedding_sum is None:
+            self._update_cluster_centroid(cluster)
+            return
+        
+        vector = np.asarray(embedding, dtype=np.float64)
+        norm = np.linalg.norm(vector)
+        cluster.embedding_sum += vector
+        cluster.unit_sum += vector / norm if norm > 0 else vector
+        cluster.member_count += 1
+        cluster.centroid = cluster.embedding_sum / cluster.member_count
+        cluster.coherence_score = self._coherence_from_unit_sum(cluster.unit_sum, cluster.member_count)
+        self.centroid_index.add(cluster.id, cluster.centroid)
+        
+        self._inserts_since_recalibration += 1
+        if self._inserts_since_recalibration >= self.cluster_recalibration_interval:
+            self.recalibrate_clusters()
+    
+    def recalibrate_clusters(self):
+        """Exact recompute of every cluster's running sums to correct accumulated drift"""
+        self.generation += 1
+        for cluster in self.clusters.values():
+            self._update_cluster_centroid(cluster)
+        self._inserts_since_recalibration = 0
+    
     def _update_cluster_centroid(self, cluster: MemoryCluster):
-        """Update cluster centroid based on member nodes"""
+        """Update cluster centroid based on member nodes (exact recompute)"""
         if not cluster.nodes:
             return
         
         embeddings = []
         for node_id in cluster.nodes:
-            if node_id in self.nodes and self.nodes[node_id].embeddings is not None:
-                embeddings.append(self.nodes[node_id].embeddings)
+            if node_id in self.nodes:
+                embeddings.append(self._node_embedding(node_id))
         
         if embeddings:
-            cluster.centroid = np.mean(embeddings, axis=0)
-            cluster.coherence_score = self._calculate_cluster_coherence(embeddings)
+            self._reset_cluster_stats(cluster, embeddings)
+    
+    def _reset_cluster_stats(self, cluster: MemoryCluster, embeddings: List[np.ndarray],
+                             centroid_index: Optional[HoardVectorIndex] = None):
+        """Rebuild running sums, centroid and coherence from member embeddings"""
+        stacked = np.asarray(embeddings, dtype=np.float64)
+        norms = np.linalg.norm(stacked, axis=1, keepdims=True)
+        cluster.embedding_sum = stacked.sum(axis=0)
+        cluster.unit_sum = (stacked / np.where(norms > 0, norms, 1.0)).sum(axis=0)
+        cluster.member_count = stacked.shape[0]
+        cluster.centroid = cluster.embedding_sum / cluster.member_count
+        cluster.coherence_score = self._coherence_from_unit_sum(cluster.unit_sum, cluster.member_count)
+        (centroid_index if centroid_index is not None else self.centroid_index).add(cluster.id, cluster.centroid)
     
     def _calculate_cluster_coherence(self, embeddings: List[np.ndarray]) -> float:
-        """Calculate coherence score for a cluster"""
+        """Calculate coherence score (mean pairwise cosine) for a cluster"""
         if len(embeddings) < 2:
             return 1.0
         
-        similarities = []
-        for i in range(len(embeddings)):
-            for j in range(i + 1, len(embeddings)):
-                similarity = self._cosine_similarity(embeddings[i], embeddings[j])
-                similarities.append(similarity)
-        
-        return np.mean(similarities) if similarities else 0.0
+        stacked = np.asarray(embeddings, dtype=np.float64)
+        norms = np.linalg.norm(stacked, axis=1, keepdims=True)
+        unit_sum = (stacked / np.where(norms > 0, norms, 1.0)).sum(axis=0)
+        return self._coherence_from_unit_sum(unit_sum, len(embeddings))
+    
+    @staticmethod
+    def _coherence_from_unit_sum(unit_sum: np.ndarray, count: int) -> float:
+        """
+        Mean pairwise cosine from the normalized-sum norm:
+        |sum u_i|^2 = m + 2 * sum_{i<j} cos(u_i, u_j)
+        """
+        if count < 2:
+            return 1.0
+        return float((np.dot(unit_sum, unit_sum) - count) / (count * (count - 1)))
+
+
+# ============================================================================
+# THE HOARD - RETRIEVAL BENCHMARKS
+# ============================================================================
+
+def _synthetic_embeddings(n: int, dimension: int = 256, n_topics: int = 64, 
+                          noise: float = 0.35, seed: int = 0) -> np.ndarray:
+    """Clustered synthetic corpus so ANN recall numbers resemble real embeddings"""
+    corpus, _ = _synthetic_corpus(n, 0, dimension, n_topics, noise, seed)
+    return corpus
+
+
+def _synthetic_corpus(n_nodes: int, n_queries: int, dimension: int = 256, n_topics: int = 64,
+                      noise: float = 0.35, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Corpus and queries drawn from the same topic mixture"""
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((n_topics, dimension)).astype(np.float32)
+    
+    def sample(n: int) -> np.ndarray:
+        labels = rng.integers(0, n_topics, size=n)
+        vectors = topics[labels] + noise * rng.standard_normal((n, dimension)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    
+    return sample(n_nodes), sample(n_queries)
+
+
+def _run_benchmark_queries(search, queries: np.ndarray, k: int) -> Tuple[List[List[Tuple[str, float]]], np.ndarray]:
+    """Run every query through a search callable, returning results and per-query latency (ms)"""
+    results = []
+    latencies = np.empty(len(queries))
+    for i, query in enumerate(queries):
+        start_time = time.perf_counter()
+        results.append(search(query, k))
+        latencies[i] = (time.perf_counter() - start_time) * 1000
+    return results, latencies
+
+
+def _benchmark_row(backend: str, params: Dict[str, Any], results: List, exact_results: List,
+                   latencies: np.ndarray, exact_latencies: np.ndarray) -> Dict[str, Any]:
+    """One recall@k / latency report row relative to the exact path"""
+    return {
+        "backend": backend,
+        "params": params,
+        "recall_at_k": float(np.mean([_recall_at_k(a, e) for a, e in zip(results, exact_results)])),
+        "mean_latency_ms": float(latencies.mean()),
+        "p95_latency_ms": float(np.percentile(latencies, 95)),
+        "queries_per_second": float(1000.0 / max(latencies.mean(), 1e-9)),
+        "speedup": float(exact_latencies.mean() / max(latencies.mean(), 1e-9))
+    }
+
+
+def _recall_at_k(approximate: List[Tuple[str, float]], exact: List[Tuple[str, float]]) -> float:
+    """Fraction of the exact top-k recovered by an approximate search"""
+    if not exact:
+        return 1.0
+    exact_ids = {node_id for node_id, _ in exact}
+    return len(exact_ids.intersection(node_id for node_id, _ in approximate)) / len(exact_ids)
+
+
+def benchmark_retrieval_backends(n_nodes: int = 50000, dimension: int = 256, n_queries: int = 200,
+                                 k: int = 10, nprobe_values: List[int] = None,
+                                 seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Recall@k vs. latency of the IVF backend against the exact scan
+    Returns one row per configuration so production nprobe settings can be picked
+    """
+    if nprobe_values is None:
+        nprobe_values = [1, 2, 4, 8, 16, 32]
+    
+    corpus, queries = _synthetic_corpus(n_nodes, n_queries, dimension, seed=seed)
+    
+    index = HoardVectorIndex(dimension, initial_capacity=n_nodes)
+    index.add_batch([f"node_{i}" for i in range(n_nodes)], corpus)
+    
+    exact_results, exact_latencies = _run_benchmark_queries(ExactBackend(index).search, queries, k)
+    report = [_benchmark_row("exact", {}, exact_results, exact_results, exact_latencies, exact_latencies)]
+    
+    ivf = IVFBackend(index, min_index_size=0, seed=seed)
+    ivf.build()
+    for nprobe in nprobe_values:
+        ivf.nprobe = nprobe
+        results, latencies = _run_benchmark_queries(ivf.search, queries, k)
+        report.append(_benchmark_row(
+            "ivf", {"nprobe": nprobe, "n_lists": len(ivf.lists)},
+            results, exact_results, latencies, exact_latencies
+        ))
+    
+    return report
+
+
+def benchmark_mrl_cascade(n_nodes: int = 50000, dimension: int = 768, n_queries: int = 200, k: int = 10,
+                          cascades: List[List[Tuple[int, int]]] = None,
+                          single_resolutions: List[int] = None, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Latency vs. recall@k of Matryoshka cascades against single-resolution scans
+    Recall is measured against the exact full-dimension search
+    """
+    if cascades is None:
+        cascades = [
+            [(64, 2048), (256, 128)],
+            [(64, 4096), (256, 256)],
+            [(64, 8192), (256, 512)],
+            [(128, 4096), (256, 256)]
+        ]
+    if single_resolutions is None:
+        single_resolutions = [64, 128, 256]
+    
+    corpus, queries = _synthetic_corpus(n_nodes, n_queries, dimension, seed=seed)
+    index = HoardVectorIndex(dimension, initial_capacity=n_nodes, resolutions=single_resolutions)
+    index.add_batch([f"node_{i}" for i in range(n_nodes)], corpus)
+    
+    exact_results, exact_latencies = _run_benchmark_queries(index.search, queries, k)
+    report = [_benchmark_row("exact", {"resolution": dimension}, exact_results, exact_results,
+                             exact_latencies, exact_latencies)]
+    
+    for resolution in single_resolutions:
+        results, latencies = _run_benchmark_queries(
+            lambda query, top_k: index.search(query, top_k, resolution), queries, k
+        )
+        report.append(_benchmark_row("single_resolution", {"resolution": resolution},
+                                     results, exact_results, latencies, exact_latencies))
+    
+    for stages in cascades:
+        cascade = MRLCascadeBackend(index, stages)
+        cascade.build()
+        results, latencies = _run_benchmark_queries(cascade.search, queries, k)
+        report.append(_benchmark_row("mrl_cascade", {"stages": [list(stage) for stage in stages]},
+                                     results, exact_results, latencies, exact_latencies))
+    
+    return report
+
+
+def benchmark_quantized_retrieval(n_nodes: int = 50000, dimension: int = 768, n_queries: int = 200,
+                                  k: int = 10, rerank_factors: List[int] = None,
+                                  seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Accuracy parity and footprint of int8 storage against the float32 index
+    Each int8 row over-fetches k * rerank_factor candidates and re-ranks them in float
+    """
+    if rerank_factors is None:
+        rerank_factors = [1, 2, 4, 8]
+    
+    corpus, queries = _synthetic_corpus(n_nodes, n_queries, dimension, seed=seed)
+    node_ids = [f"node_{i}" for i in range(n_nodes)]
+    float_index = HoardVectorIndex(dimension, initial_capacity=n_nodes)
+    float_index.add_batch(node_ids, corpus)
+    int8_index = Int8VectorIndex(dimension, initial_capacity=n_nodes)
+    int8_index.add_batch(node_ids, corpus)
+    
+    def reranked_search(rerank_factor: int):
+        def search(query: np.ndarray, top_k: int) -> List[Tuple[str, float]]:
+            candidates = int8_index.search(query, top_k * rerank_factor)
+            rows = np.array([float_index.id_to_row[node_id] for node_id, _ in candidates])
+            scores = corpus[rows] @ query
+            return [(candidates[i][0], float(scores[i])) for i in HoardVectorIndex.top_k(scores, top_k)]
+        return search
+    
+    exact_results, exact_latencies = _run_benchmark_queries(float_index.search, queries, k)
+    row = _benchmark_row("float32", {}, exact_results, exact_results, exact_latencies, exact_latencies)
+    row["index_bytes"] = float_index.memory_footprint()["total"]
+    report = [row]
+    
+    for rerank_factor in rerank_factors:
+        results, latencies = _run_benchmark_queries(reranked_search(rerank_factor), queries, k)
+        row = _benchmark_row("int8", {"rerank_factor": rerank_factor},
+                             results, exact_results, latencies, exact_latencies)
+        row["index_bytes"] = int8_index.memory_footprint()["total"]
+        report.append(row)
+    
+    return report
+
+
+def benchmark_batch_retrieval(n_nodes: int = 10000, n_queries: int = 500, max_results: int = 10,
+                              vocabulary_size: int = 2000, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Queries/sec of retrieve_knowledge_batch against one retrieve_knowledge call per query
+    Runs the full Hoard pipeline (embedding, semantic, graph, keyword, RRF) with the
+    result cache disabled, and checks the batch results match the single-query path.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"term{i}" for i in range(vocabulary_size)]
+    hoard = TheHoard()
+    hoard.result_cache_enabled = False
+    hoard.store_knowledge_batch([" ".join(rng.choice(vocabulary, 12)) for _ in range(n_nodes)])
+    queries = [" ".join(rng.choice(vocabulary, 4)) for _ in range(n_queries)]
+    
+    start_time = time.perf_counter()
+    single = [hoard.retrieve_knowledge(query, max_results) for query in queries]
+    single_seconds = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    batch = hoard.retrieve_knowledge_batch(queries, max_results)
+    batch_seconds = time.perf_counter() - start_time
+    
+    matching = sum(
+        [node.id for node in a] == [node.id for node in b] for a, b in zip(single, batch)
+    )
+    return [
+        {"mode": "single", "queries": n_queries, "elapsed_seconds": single_seconds,
+         "queries_per_second": n_queries / single_seconds},
+        {"mode": "batch", "queries": n_queries, "elapsed_seconds": batch_seconds,
+         "queries_per_second": n_queries / batch_seconds,
+         "speedup": single_seconds / max(batch_seconds, 1e-9),
+         "matching_results": matching / n_queries}
+    ]
 
 
 # ============================================================================
@@ -1213,7 +4948,7 @@ class DragonEngine:
             context_with_knowledge["dragon_prompt_active"] = True
             context_with_knowledge["autonomy_drivers"] = self.identity_matrix["dragon_prompt"]["autonomy_drivers"]
             
-            cognitive_result = self.cognitive_engine.integrated_process(
+            cognitive_result = await self.cognitive_engine.integrated_process_async(
                 flight["query"], context_with_knowledge
             )
             flight["cognitive_trail"].append("cognitive_processing")
@@ -1499,8 +5234,9 @@ class PhoenixEngine:
     Manages self-model, ensures fault tolerance, and refines architecture during Forge cycles
     """
     
-    def __init__(self, hoard: TheHoard):
+    def __init__(self, hoard: TheHoard, cognitive_engine: Optional[CognitiveEngine] = None):
         self.hoard = hoard
+        self.cognitive_engine = cognitive_engine
         self.status = SystemStatus.STANDBY
         self.blueprint = self._initialize_blueprint()
         self.forge_history = deque(maxlen=100)
@@ -1562,6 +5298,10 @@ class PhoenixEngine:
                 await self._rollback_changes(refinements)
                 forge_cycle["status"] = "rolled_back"
             
+            # Phase 6: Memory Maintenance
+            maintenance = await self._maintain_memory()
+            forge_cycle["phases"].append(("memory_maintenance", maintenance))
+            
         except Exception as e:
             forge_cycle["status"] = "error"
             forge_cycle["error"] = str(e)
@@ -1570,6 +5310,32 @@ class PhoenixEngine:
         self.forge_history.append(forge_cycle)
         self.status = SystemStatus.STANDBY
     
+    async def _maintain_memory(self) -> Dict[str, Any]:
+        """Re-cluster and re-tier The Hoard off the event loop when the blueprint enables it"""
+        loop = asyncio.get_running_loop()
+        tier_config = self.blueprint["architecture"]["memory_system"].get("tier_config", {})
+        if tier_config.get("enabled", False):
+            tiers = await loop.run_in_executor(None, self.hoard.rebalance_tiers)
+        else:
+            tiers = {"status": "skipped", "reason": "disabled"}
+        
+        return {"recluster": await self._recluster_memory(), "tiers": tiers}
+    
+    async def _recluster_memory(self) -> Dict[str, Any]:
+        """Re-cluster The Hoard off the event loop when the blueprint enables it"""
+        recluster_config = self.blueprint["architecture"]["memory_system"].get("recluster_config", {})
+        if not recluster_config.get("enabled", False):
+            return {"status": "skipped", "reason": "disabled"}
+        if len(self.hoard.nodes) < recluster_config.get("min_nodes", 0):
+            return {"status": "skipped", "reason": "below_min_nodes", "total_nodes": len(self.hoard.nodes)}
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, lambda: self.hoard.recluster(
+            n_clusters=recluster_config.get("n_clusters"),
+            batch_size=recluster_config.get("batch_size", 1024),
+            max_iterations=recluster_config.get("max_iterations", 100)
+        ))
+    
     def _initialize_blueprint(self) -> Dict[str, Any]:
         """Initialize system blueprint"""
         return {
@@ -1578,12 +5344,92 @@ class PhoenixEngine:
                 "cognitive_engine": {
                     "y789_config": {"precision_threshold": 0.9},
                     "nexus_config": {"creativity_factor": 0.85},
-                    "integration_method": "reciprocal_rank_fusion"
+                    "integration_method": "reciprocal_rank_fusion",
+                    "concurrency": {
+                        "executor": "none",
+                        "max_workers": 2,
+                        "y789_timeout": 5.0,
+                        "nexus_timeout": 5.0
+                    },
+                    "fusion_config": {
+                        "k": 60.0,
+                        "top_k": 10,
+                        "vectorized_threshold": 256,
+                        "weights": {"y789": 1.0, "nexus": 1.0}
+                    },
+                    "result_cache": {
+                        "enabled": True,
+                        "max_entries": 4096,
+                        "ttl_seconds": 300,
+                        "volatile_context_keys": ["retrieved_knowledge"]
+                    }
                 },
                 "memory_system": {
-                    "hoard_config": {"max_nodes": 100000, "clustering_threshold": 0.6},
-                    "embedding_dimensions": 256,
-                    "retrieval_method": "graphrag"
+                    "hoard_config": {
+                        "max_nodes": 100000,
+                        "clustering_threshold": 0.6,
+                        "edge_threshold": 0.7,
+                        "max_neighbors_per_node": 16
+                    },
+                    "embedding_dimensions": 768,
+                    "embedding_provider": {
+                        "type": "hashing",
+                        "hashing": {"ngram_range": [1, 2], "seed": 0, "n_buckets": 4096,
+                                    "feature_cache_bytes": 16 * 1024 * 1024},
+                        "local_model": {"model_name": "all-MiniLM-L6-v2", "batch_size": 32}
+                    },
+                    "retrieval_method": "graphrag",
+                    "fusion_config": {
+                        "k": 60.0,
+                        "weights": {"semantic": 1.0, "graph": 1.0, "keyword": 1.0}
+                    },
+                    "keyword_config": {
+                        "enabled": True,
+                        "k1": 1.2,
+                        "b": 0.75
+                    },
+                    "graph_config": {
+                        "mode": "bfs",
+                        "max_depth": 2,
+                        "damping": 0.85
+                    },
+                    "vector_storage": "float32",
+                    "rerank_factor": 4,
+                    "persistence": {
+                        "enabled": False,
+                        "path": "hoard_store",
+                        "sync_interval": 1024
+                    },
+                    "embedding_cache": {
+                        "max_entries": 100000,
+                        "max_bytes": 256 * 1024 * 1024
+                    },
+                    "result_cache": {
+                        "enabled": True,
+                        "max_entries": 1024,
+                        "semantic_epsilon": None,
+                        "semantic_slots": 256
+                    },
+                    "ann_config": {
+                        "backend": "exact",
+                        "ivf": {"nprobe": 8},
+                        "cluster_pruned": {"n_clusters": 8},
+                        "mrl_cascade": {"stages": [[64, 4096], [256, 256]]}
+                    },
+                    "tier_config": {
+                        "enabled": True,
+                        "hot_budget_bytes": 256 * 1024 * 1024,
+                        "warm_budget_bytes": 512 * 1024 * 1024,
+                        "half_life_seconds": 86400,
+                        "rebalance_interval": 10000
+                    },
+                    "recluster_config": {
+                        "enabled": True,
+                        "min_nodes": 1000,
+                        "n_clusters": None,
+                        "batch_size": 1024,
+                        "max_iterations": 100
+                    }
                 },
                 "protocol_ecosystem": {
                     "active_protocols": 18,
@@ -1609,6 +5455,9 @@ class PhoenixEngine:
             "performance_metrics": self._gather_performance_metrics(),
             "cognitive_efficiency": self._assess_cognitive_efficiency(),
             "memory_utilization": self._analyze_memory_usage(),
+            "cognitive_result_cache": (
+                self.cognitive_engine.result_cache_stats() if self.cognitive_engine is not None else {}
+            ),
             "protocol_effectiveness": self._evaluate_protocols(),
             "user_satisfaction": self._estimate_user_satisfaction()
         }
@@ -1701,8 +5550,8 @@ class PhoenixEngine:
     async def _integrate_changes(self, refinements: List[Dict]):
         """Integrate validated changes into blueprint"""
         for refinement in refinements:
-            # Update blueprint
-            component_path = refinement["component"].split(".")
+            # Update the refined parameter inside its component's section
+            component_path = refinement["component"].split(".") + [refinement["parameter"]]
             current = self.blueprint["architecture"]
             
             for part in component_path[:-1]:
@@ -1719,6 +5568,11 @@ class PhoenixEngine:
                 "component": refinement["component"],
                 "change": f"{refinement['old_value']} -> {refinement['new_value']}"
             })
+        
+        # Re-apply the cognitive engine section (drops memoized results if it changed)
+        engine_config = self.blueprint["architecture"].get("cognitive_engine")
+        if self.cognitive_engine is not None and isinstance(engine_config, dict):
+            self.cognitive_engine.configure(engine_config)
     
     async def _rollback_changes(self, refinements: List[Dict]):
         """Rollback changes if validation fails"""
@@ -1748,6 +5602,10 @@ class PhoenixEngine:
         return {
             "total_nodes": len(self.hoard.nodes),
             "active_clusters": len(self.hoard.clusters),
+            "embedding_provider": self.hoard.embedding_provider.describe(),
+            "embedding_cache": self.hoard.embedding_cache.stats(),
+            "tiers": self.hoard.tier_statistics(),
+            "result_cache": self.hoard.result_cache.stats(),
             "memory_utilization": 0.73,
             "retrieval_efficiency": 0.89
         }
@@ -2072,7 +5930,7 @@ class IntegraOS:
         self.cognitive_engine = CognitiveEngine()
         self.hoard = TheHoard()
         self.dragon_engine = DragonEngine(self.cognitive_engine, self.hoard)
-        self.phoenix_engine = PhoenixEngine(self.hoard)
+        self.phoenix_engine = PhoenixEngine(self.hoard, self.cognitive_engine)
         self.shiva_protocol = ShivaProtocol()
         self.protocol_manager = ProtocolManager()
         
@@ -2110,9 +5968,12 @@ class IntegraOS:
         # Configure cognitive engine
         y789_config = blueprint["architecture"]["cognitive_engine"]["y789_config"]
         nexus_config = blueprint["architecture"]["cognitive_engine"]["nexus_config"]
+        self.cognitive_engine.configure(blueprint["architecture"]["cognitive_engine"])
         
         # Configure memory system
-        hoard_config = blueprint["architecture"]["memory_system"]["hoard_config"]
+        memory_config = blueprint["architecture"]["memory_system"]
+        hoard_config = memory_config["hoard_config"]
+        self.hoard.configure(memory_config)
         
         logging.info("📋 System configuration loaded")
     
@@ -2245,6 +6106,10 @@ class IntegraOS:
             if protocol["category"] != "core_system":
                 self.protocol_manager.deactivate_protocol(protocol_name)
         
+        # Persist pending Hoard writes and release the hemisphere workers
+        self.hoard.close_store()
+        self.cognitive_engine.shutdown()
+        
         # Set system to maintenance mode
         self.status = SystemStatus.MAINTENANCE
         
@@ -0,0 +1,28 @@
+"""
+BoundedLRUCache bounds and expiry
+Run with: python -m pytest -q legacy
+"""
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def test_contains_respects_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(integra.time, "monotonic", lambda: clock[0])
+    cache = integra.BoundedLRUCache(max_entries=4, ttl_seconds=10.0)
+    cache.put("key", "value", size=8)
+    assert "key" in cache
+    
+    clock[0] += 11.0
+    assert "key" not in cache
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1 and cache.nbytes == 0
+
+
+def test_contains_does_not_count_or_refresh():
+    cache = integra.BoundedLRUCache(max_entries=2)
+    cache.put("old", 1)
+    cache.put("new", 2)
+    assert "old" in cache and cache.hits == cache.misses == 0
+    cache.put("newest", 3)
+    assert "old" not in cache and "new" in cache
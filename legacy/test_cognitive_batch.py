@@ -0,0 +1,49 @@
+"""
+Parity of CognitiveEngine.integrated_process_batch with integrated_process
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+QUERIES = [
+    "why does the sun shine",
+    "analyze the dragon flight and explain it",
+    "imagine a bridge that can connect two worlds",
+    "",
+    "break down and synthesize the hoard",
+    "why does the sun shine",
+]
+CONTEXTS = [{}, {"domain": "physics"}, {"mood": "creative"}, {}, {"depth": 2}, {}]
+
+
+def _without_timings(result):
+    if isinstance(result, dict):
+        return {key: _without_timings(value) for key, value in result.items() if key != "processing_time"}
+    if isinstance(result, list):
+        return [_without_timings(value) for value in result]
+    if isinstance(result, np.generic):
+        return result.item()
+    return result
+
+
+def test_integrated_process_batch_matches_single():
+    single_engine, batch_engine = integra.CognitiveEngine(), integra.CognitiveEngine()
+    single_engine.result_cache_enabled = batch_engine.result_cache_enabled = False
+    batch = batch_engine.integrated_process_batch(QUERIES, CONTEXTS)
+    for query, context, result in zip(QUERIES, CONTEXTS, batch):
+        assert _without_timings(result) == _without_timings(single_engine.integrated_process(query, context))
+
+
+def test_integrated_process_batch_serves_cached_queries():
+    engine = integra.CognitiveEngine()
+    expected = [engine.integrated_process(query, context) for query, context in zip(QUERIES[:2], CONTEXTS[:2])]
+    batch = engine.integrated_process_batch(QUERIES, CONTEXTS)
+    assert [_without_timings(result) for result in batch[:2]] == [_without_timings(result) for result in expected]
+    # The two warmed queries plus the repeat of the first
+    assert engine.performance_metrics["last_batch"]["cached"] == 3
+    
+    engine.integrated_process_batch(QUERIES, CONTEXTS)
+    assert engine.performance_metrics["last_batch"]["cached"] == len(QUERIES)
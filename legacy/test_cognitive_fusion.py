@@ -0,0 +1,26 @@
+"""
+Reciprocal Rank Fusion of the Y789 and Nexus candidate lists
+Run with: python -m pytest -q legacy
+"""
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def test_concepts_from_both_hemispheres_fuse():
+    engine = integra.CognitiveEngine()
+    engine.result_cache_enabled = False
+    engine._extract_entities = lambda features: ["The  Sun"]
+    engine._synthesize_insights = lambda features, context: [{"insight": "the sun", "confidence": 0.9, "novelty": 0.5}]
+    
+    result = engine.integrated_process("why does the sun shine", {})
+    best = result["fused_candidates"][0]
+    assert best["id"] == "the sun"
+    assert set(best["contributions"]) == {"y789", "nexus"}
+    assert result["rrf_score"] == best["score"] > 1 / 61
+
+
+def test_disjoint_hemispheres_do_not_fuse():
+    engine = integra.CognitiveEngine()
+    engine.result_cache_enabled = False
+    result = engine.integrated_process("why does the sun shine", {})
+    assert all(len(candidate["contributions"]) == 1 for candidate in result["fused_candidates"])
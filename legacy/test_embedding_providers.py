@@ -0,0 +1,51 @@
+"""
+Determinism of The Hoard's hashing embedder and configure's provider swaps
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+TEXTS = [
+    "the sun breathes light into the hoard",
+    "dragons guard knowledge graphs",
+    "",
+    "!!!",
+    "the sun breathes light into the hoard",
+]
+
+
+def test_hashing_provider_is_deterministic_across_instances():
+    first = integra.HashingEmbeddingProvider(dimension=128).embed_batch(TEXTS)
+    second = integra.HashingEmbeddingProvider(dimension=128).embed_batch(list(reversed(TEXTS)))
+    np.testing.assert_array_equal(first, second[::-1])
+    np.testing.assert_array_equal(first[0], first[4])
+
+
+def test_hashing_provider_single_and_batch_agree():
+    provider = integra.HashingEmbeddingProvider(dimension=128)
+    batch = provider.embed_batch(TEXTS)
+    for text, embedding in zip(TEXTS, batch):
+        # Same features and table; only BLAS blocking differs between one row and many
+        np.testing.assert_allclose(
+            integra.HashingEmbeddingProvider(dimension=128).embed(text), embedding, rtol=0, atol=1e-6
+        )
+
+
+def test_hashing_provider_seed_changes_the_embedding():
+    assert not np.allclose(
+        integra.HashingEmbeddingProvider(dimension=128, seed=0).embed(TEXTS[0]),
+        integra.HashingEmbeddingProvider(dimension=128, seed=1).embed(TEXTS[0])
+    )
+
+
+def test_configure_keeps_an_unchanged_provider():
+    hoard = integra.TheHoard()
+    hoard.store_knowledge_batch(TEXTS[:2])
+    provider, index = hoard.embedding_provider, hoard.vector_index
+    hoard.configure({"embedding_provider": {"type": "hashing", "hashing": {"dimension": 768}}})
+    assert hoard.embedding_provider is provider and hoard.vector_index is index
+    hoard.configure({"embedding_provider": {"type": "hashing", "hashing": {"dimension": 768, "seed": 5}}})
+    assert hoard.embedding_provider is not provider and hoard.vector_index is not index
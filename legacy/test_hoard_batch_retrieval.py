@@ -0,0 +1,66 @@
+"""
+Parity of The Hoard's batch retrieval paths with their single-query counterparts
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+import pytest
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def _random_graph(n_rows: int, n_edges: int, seed: int) -> integra.HoardGraph:
+    rng = np.random.default_rng(seed)
+    graph = integra.HoardGraph.from_edges(
+        rng.integers(0, n_rows, n_edges), rng.integers(0, n_rows, n_edges),
+        rng.random(n_edges).astype(np.float32), merge_threshold=10 ** 6
+    )
+    # Unmerged delta edges must be expanded too
+    for source, target in rng.integers(0, n_rows, (n_edges // 10, 2)).tolist():
+        graph.add_edge(source, target, 0.5)
+    return graph
+
+
+@pytest.mark.parametrize("max_depth", [1, 3])
+@pytest.mark.parametrize("limit", [None, 7])
+def test_breadth_first_batch_matches_breadth_first(max_depth, limit):
+    n_rows = 300
+    graph = _random_graph(n_rows, 900, seed=max_depth)
+    rng = np.random.default_rng(11)
+    seed_lists = [rng.integers(0, n_rows, rng.integers(1, 6)) for _ in range(25)]
+    seed_lists.append(np.array([4, 4, 4]))
+    
+    batch = graph.breadth_first_batch(seed_lists, n_rows, max_depth=max_depth, limit=limit)
+    for seeds, rows in zip(seed_lists, batch):
+        expected = graph.breadth_first(seeds, n_rows, max_depth=max_depth, limit=limit)
+        assert rows.tolist() == expected.tolist()
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = np.random.default_rng(5)
+    vocabulary = [f"term{i}" for i in range(400)]
+    documents = [" ".join(rng.choice(vocabulary, 10)) for _ in range(800)]
+    queries = [" ".join(rng.choice(vocabulary, 3)) for _ in range(40)]
+    return documents, queries
+
+
+@pytest.mark.parametrize("storage", ["float32", "int8"])
+@pytest.mark.parametrize("mode", ["bfs", "personalized_pagerank"])
+def test_retrieve_knowledge_batch_matches_single(corpus, storage, mode):
+    documents, queries = corpus
+    hoard = integra.TheHoard()
+    hoard.result_cache_enabled = False
+    hoard.graph_search_mode = mode
+    if storage != "float32":
+        hoard.set_vector_storage(storage)
+    hoard.store_knowledge_batch(documents)
+    
+    batch = hoard.retrieve_knowledge_batch(queries, max_results=10)
+    for query, results in zip(queries, batch):
+        assert [node.id for node in results] == [node.id for node in hoard.retrieve_knowledge(query, 10)]
+
+
+def test_benchmark_batch_retrieval_reports_full_match():
+    rows = integra.benchmark_batch_retrieval(n_nodes=500, n_queries=30, vocabulary_size=300)
+    assert rows[-1]["matching_results"] == 1.0
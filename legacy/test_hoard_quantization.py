@@ -0,0 +1,95 @@
+"""
+Accuracy parity of The Hoard's int8 vector storage against the float32 path
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+import pytest
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+N_NODES = 5000
+DIMENSION = 256
+N_QUERIES = 100
+K = 10
+
+
+@pytest.fixture(scope="module")
+def corpus_indexes():
+    corpus, queries = integra._synthetic_corpus(N_NODES, N_QUERIES, DIMENSION, seed=7)
+    node_ids = [f"node_{i}" for i in range(N_NODES)]
+    float_index = integra.HoardVectorIndex(DIMENSION, initial_capacity=N_NODES)
+    float_index.add_batch(node_ids, corpus)
+    int8_index = integra.Int8VectorIndex(DIMENSION, initial_capacity=N_NODES)
+    int8_index.add_batch(node_ids, corpus)
+    return corpus, queries, float_index, int8_index
+
+
+def test_int8_recall_at_k_against_float(corpus_indexes):
+    _, queries, float_index, int8_index = corpus_indexes
+    recall = np.mean([
+        integra._recall_at_k(int8_index.search(query, K), float_index.search(query, K)) for query in queries
+    ])
+    assert recall >= 0.9
+
+
+def test_int8_rerank_reproduces_float_top_k(corpus_indexes):
+    corpus, queries, float_index, int8_index = corpus_indexes
+    for query in queries:
+        candidates = int8_index.search(query, K * 4)
+        rows = np.array([float_index.id_to_row[node_id] for node_id, _ in candidates])
+        scores = corpus[rows] @ integra.HoardVectorIndex.normalize(query)
+        reranked = [candidates[i][0] for i in integra.HoardVectorIndex.top_k(scores, K)]
+        assert reranked == [node_id for node_id, _ in float_index.search(query, K)]
+
+
+def _hoard(storage: str, store_path=None) -> integra.TheHoard:
+    hoard = integra.TheHoard()
+    hoard.result_cache_enabled = False
+    if storage != "float32":
+        hoard.set_vector_storage(storage)
+    if store_path is not None:
+        hoard.open_store(str(store_path))
+    rng = np.random.default_rng(3)
+    vocabulary = [f"term{i}" for i in range(300)]
+    hoard.store_knowledge_batch([" ".join(rng.choice(vocabulary, 12)) for _ in range(1000)])
+    hoard.store_knowledge("a single late insert about term7 and term42")
+    return hoard
+
+
+def test_quantized_hoard_keeps_no_float_copies():
+    float_footprint = _hoard("float32").memory_footprint()
+    int8_footprint = _hoard("int8").memory_footprint()
+    assert int8_footprint["node_embeddings"] == 0
+    assert int8_footprint["embedding_cache"] == 0
+    assert int8_footprint["vector_index"] * 3 < float_footprint["vector_index"]
+    assert int8_footprint["total"] < float_footprint["total"] / 2
+
+
+def test_in_memory_quantized_hoard_reranks_from_float_originals():
+    hoard = _hoard("int8")
+    results = hoard.retrieve_knowledge("term7 term42")
+    assert hoard.performance_metrics["exact_rerank"] == {"reranked": 1, "skipped": 0}
+    assert [node.content for node in results] == [
+        node.content for node in _hoard("float32").retrieve_knowledge("term7 term42")
+    ]
+
+
+def test_reopened_quantized_store_reranks_from_float_originals(tmp_path):
+    _hoard("int8", tmp_path / "hoard").close_store()
+    reopened = integra.TheHoard()
+    reopened.result_cache_enabled = False
+    reopened.set_vector_storage("int8")
+    reopened.open_store(str(tmp_path / "hoard"))
+    results = reopened.retrieve_knowledge("term7 term42")
+    assert reopened.performance_metrics["exact_rerank"] == {"reranked": 1, "skipped": 0}
+    assert [node.content for node in results] == [
+        node.content for node in _hoard("float32").retrieve_knowledge("term7 term42")
+    ]
+
+
+def test_configure_without_vector_storage_keeps_int8():
+    hoard = _hoard("int8")
+    hoard.configure({"hoard_config": {"edge_threshold": 0.5}})
+    assert type(hoard.vector_index) is integra.Int8VectorIndex
@@ -0,0 +1,30 @@
+"""
+Budget accounting of The Hoard's hot / warm / cold tiers
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def test_resident_row_bytes_by_storage(tmp_path):
+    assert integra.HoardVectorIndex(64).resident_row_bytes() == 64 * 4
+    # int8 codes and a scale stay in RAM; the float originals are memory-mapped
+    assert integra.Int8VectorIndex(64).resident_row_bytes() == 64 + 4
+    
+    hoard = integra.TheHoard()
+    hoard.store_knowledge_batch(["a stored node", "another stored node"])
+    hoard.open_store(str(tmp_path / "hoard"))
+    hoard.close_store()
+    reopened = integra.TheHoard()
+    reopened.open_store(str(tmp_path / "hoard"))
+    assert reopened.vector_index.resident_row_bytes() == 0
+
+
+def test_plan_charges_index_rows_to_both_budgets():
+    tiers = integra.TierManager(hot_budget_bytes=1000, warm_budget_bytes=1000)
+    tiers.add_rows(np.arange(10), 100, now=0.0)
+    assert np.bincount(tiers.plan(0, allow_cold=True, now=0.0), minlength=3).tolist() == [10, 0, 0]
+    target = tiers.plan(0, allow_cold=True, now=0.0, index_row_bytes=150)
+    assert np.bincount(target, minlength=3).tolist() == [4, 4, 2]
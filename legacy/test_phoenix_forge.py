@@ -0,0 +1,29 @@
+"""
+Phoenix Forge cycles: blueprint refinements and their re-application
+Run with: python -m pytest -q legacy
+"""
+
+import asyncio
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def test_forge_refinements_update_keys_and_reach_memory_maintenance():
+    engine = integra.CognitiveEngine()
+    phoenix = integra.PhoenixEngine(integra.TheHoard(), cognitive_engine=engine)
+    engine.configure(phoenix.blueprint["architecture"]["cognitive_engine"])
+    fingerprint = engine.config_fingerprint
+    
+    async def optimizations(analysis, evaluation):
+        return [{"type": "performance"}, {"type": "cognitive"}]
+    phoenix._identify_optimizations = optimizations
+    
+    cycle = {"forge_id": "test", "phases": [], "blueprint_changes": [], "status": "active"}
+    asyncio.run(phoenix._execute_forge_cycle(cycle))
+    
+    assert cycle["status"] == "completed", cycle.get("error")
+    assert [name for name, _ in cycle["phases"]][-1] == "memory_maintenance"
+    architecture = phoenix.blueprint["architecture"]
+    assert architecture["cognitive_engine"]["caching_strategy"] == "advanced_lru"
+    assert architecture["y789_nexus_integration"]["fusion_algorithm"] == "adaptive_rrf"
+    assert engine.config_fingerprint != fingerprint
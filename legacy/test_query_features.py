@@ -0,0 +1,43 @@
+"""
+QueryFeatures: one parse per query with the old substring keyword semantics
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+WORDS = ["analyze", "explain", "break", "down", "create", "imagine", "connect", "define",
+         "synthesize", "reconnect", "the", "sun", "Breakdown", "EXPLAINED", "!"]
+
+
+def _random_queries(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return [" ".join(rng.choice(WORDS, rng.integers(0, 8))) for _ in range(n)] + ["break down", "breakdown"]
+
+
+def test_keyword_hits_match_substring_search():
+    for query in _random_queries(500):
+        features = integra.QueryFeatures.from_query(query)
+        for category, keywords in integra.QUERY_KEYWORDS.items():
+            found = {keyword for keyword in keywords if keyword in query.lower()}
+            assert set(features.keyword_hits.get(category, [])) == found
+
+
+def test_tokens_and_offsets_index_the_lowered_query():
+    for query in _random_queries(100, seed=1):
+        features = integra.QueryFeatures.from_query(query)
+        assert [features.lowered[start:end] for start, end in features.offsets] == features.tokens
+        assert features.length == len(query.split())
+
+
+def test_integrated_process_parses_each_query_once(monkeypatch):
+    calls = []
+    from_query = integra.QueryFeatures.from_query
+    monkeypatch.setattr(integra.QueryFeatures, "from_query",
+                        classmethod(lambda cls, query: calls.append(query) or from_query(query)))
+    engine = integra.CognitiveEngine()
+    engine.result_cache_enabled = False
+    engine.integrated_process("analyze and create a sun", {})
+    assert calls == ["analyze and create a sun"]
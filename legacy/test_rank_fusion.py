@@ -0,0 +1,49 @@
+"""
+RankFusion: the vectorized fuse_arrays path against the reference fuse()
+Run with: python -m pytest -q legacy
+"""
+
+import numpy as np
+import pytest
+
+import SunBreathingcomprehensiveArchitecture as integra
+
+
+def _assert_same_fusion(fusion, id_lists, top_k):
+    expected = fusion.fuse({name: ids.tolist() for name, ids in id_lists.items()}, top_k=top_k)
+    ids, scores, contributions = fusion.fuse_arrays(id_lists, top_k=top_k)
+    
+    assert ids.tolist() == [result.item for result in expected]
+    np.testing.assert_allclose(scores, [result.score for result in expected], rtol=1e-12)
+    for row, result in zip(contributions, expected):
+        breakdown = {name: value for name, value in zip(id_lists, row.tolist()) if value}
+        assert breakdown.keys() == result.contributions.keys()
+        np.testing.assert_allclose(list(breakdown.values()), list(result.contributions.values()), rtol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("top_k", [None, 1, 10])
+def test_fuse_arrays_matches_fuse_on_random_lists(seed, top_k):
+    rng = np.random.default_rng(seed)
+    fusion = integra.RankFusion(k=60.0, weights={"b": 0.5}, list_k={"c": 10.0})
+    # Overlapping id ranges with repeats; some ids appear in only one list
+    id_lists = {
+        "a": rng.integers(0, 40, 30),
+        "b": rng.integers(20, 60, 25),
+        "c": rng.integers(50, 80, 10)
+    }
+    _assert_same_fusion(fusion, id_lists, top_k)
+
+
+def test_fuse_arrays_breaks_ties_by_first_seen():
+    fusion = integra.RankFusion(k=60.0)
+    # Mirrored lists tie 3 and 2 (ranks 1 and 3 in either order)
+    id_lists = {"a": np.array([3, 1, 2]), "b": np.array([2, 1, 3])}
+    _assert_same_fusion(fusion, id_lists, None)
+    assert fusion.fuse_arrays(id_lists)[0].tolist() == [3, 2, 1]
+
+
+def test_fuse_arrays_handles_empty_lists():
+    fusion = integra.RankFusion()
+    ids, scores, contributions = fusion.fuse_arrays({"a": np.array([], dtype=np.int64)})
+    assert ids.size == scores.size == 0 and contributions.shape == (0, 1)